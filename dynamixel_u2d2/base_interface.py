@@ -5,11 +5,121 @@ This module defines the abstract base class that both U2D2Interface and FakeU2D2
 inherit from, ensuring a consistent API for hardware and testing implementations.
 """
 
+import asyncio
+import functools
+import logging
+import queue
+import struct
+import sys
+import threading
+import time
 from abc import ABC, abstractmethod
-from typing import Dict, List, Tuple, Literal, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Tuple, Literal, Optional, Union, get_args
+
+import numpy as np
 
 # Motor mode types for type hints
 MotorMode = Literal['position', 'current']
+VALID_MODES = frozenset(get_args(MotorMode))
+
+# Highest ID a motor can be assigned (253 is reserved, 254 is broadcast)
+MAX_MOTOR_ID = 252
+
+# IDs covered by a scan when no scan_range is given
+DEFAULT_SCAN_IDS = tuple(range(0, MAX_MOTOR_ID + 1))
+VALID_MOTOR_IDS = frozenset(DEFAULT_SCAN_IDS)
+
+# Little-endian signed dtype of a register by its length in bytes
+SIGNED_DTYPES = {1: np.dtype('i1'), 2: np.dtype('<i2'), 4: np.dtype('<i4')}
+
+# Little-endian unsigned dtype of a register by its length, for configuration
+# registers such as Return Delay Time (0-254) that do not fit the signed range
+UNSIGNED_DTYPES = {1: np.dtype('u1'), 2: np.dtype('<u2'), 4: np.dtype('<u4')}
+
+# Stand-in bytes for a register of each length that could not be read
+ZERO_REGISTERS = {length: bytes(length) for length in SIGNED_DTYPES}
+
+logger = logging.getLogger(__name__)
+
+# CRC-16/IBM (polynomial 0x8005, unreflected) used by Dynamixel Protocol 2.0
+CRC16_POLY = 0x8005
+
+_crc16_byte_table = None
+_crc16_word_table = None
+
+
+def _crc16_tables() -> Tuple[List[int], List[int]]:
+    """
+    Build the CRC-16 lookup tables on first use.
+    
+    The byte table advances the CRC by one byte; the 65536-entry word table
+    advances it by two bytes at once, halving the Python-level loop iterations.
+    """
+    global _crc16_byte_table, _crc16_word_table
+    if _crc16_word_table is None:
+        byte_table = []
+        for i in range(256):
+            crc = i << 8
+            for _ in range(8):
+                crc = (crc << 1) ^ CRC16_POLY if crc & 0x8000 else crc << 1
+            byte_table.append(crc & 0xFFFF)
+        _crc16_word_table = [
+            byte_table[(byte_table[word >> 8] >> 8) ^ (word & 0xFF)] ^ ((byte_table[word >> 8] << 8) & 0xFFFF)
+            for word in range(65536)
+        ]
+        _crc16_byte_table = byte_table
+    return _crc16_byte_table, _crc16_word_table
+
+
+def _enable_console_logging():
+    """
+    Show the package's info messages on stdout for verbose interfaces.
+    
+    Does nothing if the application already configured logging, so user
+    handlers and formats are never overridden or duplicated.
+    """
+    package_logger = logging.getLogger(__package__)
+    if package_logger.handlers or logging.getLogger().handlers:
+        package_logger.setLevel(min(package_logger.getEffectiveLevel(), logging.INFO))
+        return
+    
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter("[%(name)s] %(message)s"))
+    package_logger.addHandler(handler)
+    package_logger.setLevel(logging.INFO)
+
+
+@functools.lru_cache(maxsize=32)
+def _build_read_params(motor_ids: Tuple[int, ...], address: int, length: int) -> Tuple[Tuple[int, int, int], ...]:
+    """Build (and cache) the bulk_read parameters reading one register range from each motor."""
+    return tuple((int(motor_id), address, length) for motor_id in motor_ids)
+
+
+class ReadHandle:
+    """
+    Pending bulk read returned by submit_bulk_read().
+    
+    Await the handle itself (or its result() coroutine) to get the read results,
+    e.g. together with other work via asyncio.gather(handle, compute()).
+    """
+    
+    __slots__ = ('_future',)
+    
+    def __init__(self, future: asyncio.Future):
+        self._future = future
+    
+    def done(self) -> bool:
+        """Return True once the read has completed."""
+        return self._future.done()
+    
+    async def result(self) -> Dict[Tuple[int, int], bytes]:
+        """Wait for the read and return the dict with keys (motor_id, address)."""
+        return await self._future
+    
+    def __await__(self):
+        return self._future.__await__()
+
 
 class BaseInterface(ABC):
     """
@@ -17,15 +127,47 @@ class BaseInterface(ABC):
     
     This class defines the interface that both hardware (U2D2Interface) and 
     testing (FakeU2D2Interface) implementations must follow.
+    
+    Subclasses that need the column of a motor in per-motor results must use the
+    cached self._id_to_idx dict (or self._id_to_idx_array for vectorized lookups)
+    rather than scanning self.motor_ids.
+    
+    Likewise, sync read/write group objects must be created once and looked up
+    through _get_or_create_sync_reader / _get_or_create_sync_writer, never rebuilt
+    per call. Groups keyed by (start_address, length) are shared by every motor
+    set and re-register their motors (clearParam/addParam) when the set changes;
+    groups keyed by (start_address, length, motor_ids) keep a fixed motor set.
     """
     
+    # Concrete subclasses must declare their own __slots__ as well, otherwise
+    # instances silently fall back to a per-instance __dict__
+    __slots__ = (
+        'usb_port',
+        'baudrate',
+        'motor_ids',
+        'protocol_version',
+        'verbose',
+        'latency_timer_ms',
+        '_motor_ids_list',
+        '_id_to_idx',
+        '_id_to_idx_array',
+        '_io_executor',
+        '_sync_readers',
+        '_sync_writers',
+        '_poll_thread',
+        '_poll_stop',
+        '_latest_states',
+        '_posted_writes',
+    )
+    
     def __init__(
         self,
         usb_port: str,
         baudrate: int = 4000000,
-        motor_ids: Optional[List[int]] = None,
+        motor_ids: Optional[Union[List[int], np.ndarray]] = None,
         protocol_version: float = 2.0,
-        verbose: bool = False
+        verbose: bool = False,
+        latency_timer_ms: int = 1
     ):
         """
         Initialize the interface.
@@ -33,15 +175,41 @@ class BaseInterface(ABC):
         Args:
             usb_port: Serial port (e.g., '/dev/ttyUSB0')
             baudrate: Communication speed (57600, 1000000, etc.)
-            motor_ids: List of motor IDs for bulk reads (optional for utility functions)
+            motor_ids: Motor IDs for bulk reads, as a list or array (optional for utility functions)
             protocol_version: Dynamixel protocol version (usually 2.0)
             verbose: Print verbose output (default: False)
+            latency_timer_ms: USB latency timer to request for the port, in ms (default: 1)
         """
         self.usb_port = usb_port
         self.baudrate = baudrate
-        self.motor_ids = motor_ids
+        # Stored as a uint8 array; _motor_ids_list keeps plain ints for SDK calls and dict keys
+        self.motor_ids = None if motor_ids is None else np.asarray(motor_ids, dtype=np.uint8)
+        self._motor_ids_list = None if motor_ids is None else self.motor_ids.tolist()
         self.protocol_version = protocol_version
         self.verbose = verbose
+        self.latency_timer_ms = latency_timer_ms
+        
+        if self.verbose:
+            _enable_console_logging()
+        
+        # Motor ID -> column index in per-motor results, built once
+        self._id_to_idx: Dict[int, int] = {}
+        self._id_to_idx_array = np.full(256, -1, dtype=np.int16)
+        if self.motor_ids is not None:
+            self._index_motor_ids(self.motor_ids)
+        
+        # Worker thread for async operations, created on first use
+        self._io_executor = None
+        
+        # Reusable sync read/write groups, keyed by (start_address, length)
+        self._sync_readers: Dict[Tuple[int, int], object] = {}
+        self._sync_writers: Dict[Tuple[int, int], object] = {}
+        
+        # Background state polling, started on demand
+        self._poll_thread: Optional[threading.Thread] = None
+        self._poll_stop = threading.Event()
+        self._latest_states: Optional[Dict[int, Dict[str, int]]] = None
+        self._posted_writes: queue.SimpleQueue = queue.SimpleQueue()
     
     # ============================================================================
     # MOTOR CONFIGURATION
@@ -85,6 +253,62 @@ class BaseInterface(ABC):
         """Set the Position D Gain for a single motor."""
         pass
     
+    @abstractmethod
+    def set_position_gains(self, motor_id: int, p_gain: int, i_gain: int, d_gain: int):
+        """Set the Position P, I and D Gains of a single motor in one write."""
+        pass
+    
+    @abstractmethod
+    def bulk_enable_torque(self, motor_ids: List[int]):
+        """Enable torque on several motors with one sync write."""
+        pass
+    
+    @abstractmethod
+    def bulk_disable_torque(self, motor_ids: List[int]):
+        """Disable torque on several motors with one sync write."""
+        pass
+    
+    @abstractmethod
+    def bulk_set_motor_mode(self, motor_ids: List[int], modes: Union[MotorMode, List[MotorMode]], skip_unchanged: bool = False):
+        """
+        Set the operating mode of several motors with one sync write.
+        
+        Args:
+            motor_ids: List of motor IDs
+            modes: One mode for all motors, or a list of modes aligned to motor_ids
+            skip_unchanged: Read the current modes first and only write the motors
+                whose mode differs (default: False)
+        """
+        pass
+    
+    @abstractmethod
+    def bulk_set_position_gains(self, motor_ids: List[int], p_gains: List[int], i_gains: List[int], d_gains: List[int]):
+        """Set the Position P, I and D Gains of several motors with one sync write."""
+        pass
+    
+    @abstractmethod
+    def bulk_set_return_delay_time(self, motor_ids: List[int], delay_units: Union[int, List[int]] = 0, skip_unchanged: bool = False):
+        """
+        Set the Return Delay Time (2 µs units) of several motors with one sync write.
+        
+        Args:
+            motor_ids: List of motor IDs
+            delay_units: One value for all motors or a list aligned to motor_ids (default: 0)
+            skip_unchanged: Read the current values first and only write the
+                motors whose value differs (default: False)
+        """
+        pass
+    
+    @abstractmethod
+    def bulk_set_velocity_limit(self, motor_ids: List[int], velocity_limits: Union[int, List[int]]):
+        """Set the profile velocity limit of several motors (one value or one per motor) with one sync write."""
+        pass
+    
+    @abstractmethod
+    def bulk_set_position_p_gain(self, motor_ids: List[int], p_gains: Union[int, List[int]]):
+        """Set the Position P Gain of several motors (one value or one per motor) with one sync write."""
+        pass
+    
     # ============================================================================
     # SYNC BASE OPERATIONS
     # ============================================================================
@@ -99,17 +323,26 @@ class BaseInterface(ABC):
         """Sync read the full state (position, velocity, current) of all motors."""
         pass
     
+    @abstractmethod
+    def sync_read_state_fast(self) -> Tuple[List[int], List[int], List[int]]:
+        """
+        Sync read the full state (position, velocity, current) of all motors using
+        the Fast Sync Read instruction (single status packet for all motors).
+        """
+        pass
+    
     # ============================================================================
     # SYNC WRITE OPERATIONS
     # ============================================================================
     
     @abstractmethod
-    def sync_write_positions(self, positions: List[int]):
+    def sync_write_positions(self, positions: Union[List[int], np.ndarray, bytes]):
         """
         Sync write position commands to all configured motors.
         
         Args:
-            positions: List of position values (must match self.motor_ids length)
+            positions: Position values (must match self.motor_ids length), as a list,
+                an int32 array, or pre-packed little-endian int32 bytes
         """
         pass
     
@@ -159,17 +392,32 @@ class BaseInterface(ABC):
             read_params: List of tuples (motor_id, address, length)
         
         Returns:
-            Dict with keys (motor_id, address) and byte values
+            Dict with keys (motor_id, address) and bytes values
         """
         pass
     
     @abstractmethod
-    def bulk_write(self, write_params: List[Tuple[int, int, bytes]]):
+    def bulk_read_views(self, read_params: List[Tuple[int, int, int]]) -> Dict:
+        """
+        Bulk read without copying: values are memoryviews valid until the next call.
+        
+        Args:
+            read_params: List of tuples (motor_id, address, length)
+        
+        Returns:
+            Dict with keys (motor_id, address) and memoryview values
+        """
+        pass
+    
+    @abstractmethod
+    def bulk_write(self, write_params: Union[List[Tuple[int, int, bytes]], Tuple[np.ndarray, int, np.ndarray]]):
         """
         Perform bulk write operation for multiple motors.
         
         Args:
-            write_params: List of tuples (motor_id, address, data_bytes)
+            write_params: List of tuples (motor_id, address, data_bytes), or a single
+                tuple (motor_ids, address, data_block) where data_block is a C-contiguous
+                uint8 array of shape (N, length) and row i is the payload for motor_ids[i]
         """
         pass
     
@@ -178,13 +426,13 @@ class BaseInterface(ABC):
     # ============================================================================
     
     @abstractmethod
-    def bulk_write_positions(self, motor_ids: List[int], positions: List[int]):
+    def bulk_write_positions(self, motor_ids: List[int], positions: Union[List[int], np.ndarray]):
         """
         Bulk write position commands to multiple motors.
         
         Args:
             motor_ids: List of motor IDs
-            positions: List of position values (must match motor_ids length)
+            positions: List or integer array of position values (must match motor_ids length)
         """
         pass
     
@@ -199,10 +447,11 @@ class BaseInterface(ABC):
         """
         pass
     
-    @abstractmethod
     def bulk_read_positions(self, motor_ids: List[int]) -> Dict[int, int]:
         """
         Bulk read positions from multiple motors.
+        Only use this when exactly one field is needed; bulk_read_states
+        reads all three fields in the same single transaction.
         
         Args:
             motor_ids: List of motor IDs to read
@@ -210,12 +459,13 @@ class BaseInterface(ABC):
         Returns:
             Dict mapping motor_id to position value
         """
-        pass
+        return self._bulk_read_signed(motor_ids, 132, 4)  # Present Position
     
-    @abstractmethod
     def bulk_read_velocities(self, motor_ids: List[int]) -> Dict[int, int]:
         """
         Bulk read velocities from multiple motors.
+        Only use this when exactly one field is needed; bulk_read_states
+        reads all three fields in the same single transaction.
         
         Args:
             motor_ids: List of motor IDs to read
@@ -223,12 +473,13 @@ class BaseInterface(ABC):
         Returns:
             Dict mapping motor_id to velocity value
         """
-        pass
+        return self._bulk_read_signed(motor_ids, 128, 4)  # Present Velocity
     
-    @abstractmethod
     def bulk_read_currents(self, motor_ids: List[int]) -> Dict[int, int]:
         """
         Bulk read currents from multiple motors.
+        Only use this when exactly one field is needed; bulk_read_states
+        reads all three fields in the same single transaction.
         
         Args:
             motor_ids: List of motor IDs to read
@@ -236,13 +487,15 @@ class BaseInterface(ABC):
         Returns:
             Dict mapping motor_id to current value
         """
-        pass
+        return self._bulk_read_signed(motor_ids, 126, 2)  # Present Current
     
     @abstractmethod
     def bulk_read_states(self, motor_ids: List[int]) -> Dict[int, Dict[str, int]]:
         """
         Bulk read all states (position, velocity, current) from multiple motors.
-        Optimized to use a single bulk read operation.
+        Implementations should issue one contiguous read per motor of address 126
+        (Present Current), length 10, which also covers Present Velocity (128)
+        and Present Position (132).
         
         Args:
             motor_ids: List of motor IDs to read
@@ -252,6 +505,44 @@ class BaseInterface(ABC):
         """
         pass
     
+    # ============================================================================
+    # PIPELINED WRITES
+    # ============================================================================
+    
+    @abstractmethod
+    def enqueue_write(self, motor_id: int, address: int, data: bytes):
+        """
+        Queue a register write without touching the bus.
+        
+        Args:
+            motor_id: Motor ID
+            address: Control table start address
+            data: Little-endian bytes to write
+        """
+        pass
+    
+    @abstractmethod
+    def flush(self) -> Dict[int, bool]:
+        """
+        Send all queued writes in as few packets as possible and clear the queue.
+        
+        Returns:
+            Dictionary mapping motor_id to success status
+        """
+        pass
+    
+    @abstractmethod
+    def batch(self):
+        """
+        Context manager that sends every sync write issued inside it at once.
+        
+        Usage:
+            with interface.batch():
+                interface.bulk_write_positions(motor_ids, positions)
+                interface.bulk_write_currents(motor_ids, currents)
+        """
+        pass
+    
     # ============================================================================
     # INDIVIDUAL MOTOR OPERATIONS
     # ============================================================================
@@ -291,18 +582,210 @@ class BaseInterface(ABC):
         """Return the present current (signed, in control-table LSB)."""
         pass
     
+    # ============================================================================
+    # NUMPY STATE READS
+    # ============================================================================
+    
+    @abstractmethod
+    def sync_read_state_np(self, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Sync read the full state of all configured motors into an int32 array.
+        
+        Args:
+            out: Optional preallocated int32 array of shape (3, N) to fill in place
+            
+        Returns:
+            Array of shape (3, N) with rows (positions, velocities, currents),
+            columns aligned to self.motor_ids
+        """
+        pass
+    
+    @abstractmethod
+    def bulk_read_positions_np(self, motor_ids: List[int], out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Bulk read positions from multiple motors into an int32 array.
+        
+        Args:
+            motor_ids: List of motor IDs to read
+            out: Optional preallocated int32 array of shape (N,) to fill in place
+            
+        Returns:
+            Array of shape (N,) with positions aligned to motor_ids
+        """
+        pass
+    
+    @abstractmethod
+    def bulk_read_states_soa(self, motor_ids: List[int]) -> Dict[str, np.ndarray]:
+        """
+        Bulk read all states from multiple motors as one array per field.
+        
+        Args:
+            motor_ids: List of motor IDs to read
+            
+        Returns:
+            Dict with 'position' (int32), 'velocity' (int32) and 'current' (int16)
+            arrays of shape (N,), aligned to motor_ids
+        """
+        pass
+    
+    def compile_bulk_read_positions(self, motor_ids: List[int]) -> Callable[[], np.ndarray]:
+        """
+        Return a zero-argument reader of the positions of a fixed set of motors.
+        
+        Everything that only depends on motor_ids is resolved once here, so each
+        call of the returned function only performs the read and the decode.
+        
+        Args:
+            motor_ids: List of motor IDs to read
+            
+        Returns:
+            Function returning an int32 array of shape (N,) aligned to motor_ids
+        """
+        motor_ids = [int(motor_id) for motor_id in motor_ids]
+        return functools.partial(self.bulk_read_positions_np, motor_ids)
+    
+    @abstractmethod
+    def submit_sync_read_state(self):
+        """
+        Send the full-state sync read of all configured motors without waiting for the replies.
+        
+        Collect the result with reap_sync_read_state(). No other bus call may be
+        made in between; do the writes first, then submit, compute, and reap.
+        """
+        pass
+    
+    @abstractmethod
+    def reap_sync_read_state(self, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Receive the sync read sent by submit_sync_read_state().
+        
+        Args:
+            out: Optional preallocated int32 array of shape (3, N) to fill in place
+            
+        Returns:
+            Array of shape (3, N) with rows (positions, velocities, currents),
+            columns aligned to self.motor_ids
+        """
+        pass
+    
+    @abstractmethod
+    def control_loop_tick(self, goals: np.ndarray, previous_state: np.ndarray) -> bool:
+        """
+        Write goal positions and read the full state in one fused step.
+        
+        previous_state receives the state from the end of the previous tick (one
+        tick old, before these goals were applied), not the current state.
+        
+        Args:
+            goals: Goal positions aligned to self.motor_ids (int32 array)
+            previous_state: Preallocated int32 array of shape (3, N) receiving (positions, velocities, currents)
+        
+        Returns:
+            True if previous_state was read before these goals were sent, False if
+            it is newer (the first tick, which has no previous read)
+        """
+        pass
+    
+    # ============================================================================
+    # ASYNC OPERATIONS
+    # ============================================================================
+    
+    @abstractmethod
+    async def submit_bulk_read(self, read_params: List[Tuple[int, int, int]]) -> ReadHandle:
+        """
+        Start a bulk read in the background and return without waiting for it.
+        
+        Args:
+            read_params: List of tuples (motor_id, address, length)
+        
+        Returns:
+            ReadHandle resolving to a dict with keys (motor_id, address) and byte values
+        """
+        pass
+    
+    async def a_bulk_read_states(self, motor_ids: List[int]) -> Dict[int, Dict[str, int]]:
+        """Awaitable bulk_read_states that runs on the interface's I/O thread."""
+        return await self._run_in_io_thread(self.bulk_read_states, motor_ids)
+    
+    # ============================================================================
+    # BACKGROUND POLLING
+    # ============================================================================
+    
+    def start_background_polling(self, motor_ids: List[int], hz: float = 100.0):
+        """
+        Continuously bulk read the states of motor_ids on a background thread.
+        
+        Each cycle publishes a new states dict by swapping a single reference, so
+        get_latest_states() returns immediately without a lock. While polling is
+        running the thread owns the bus: send writes with post_write() instead of
+        calling other bus methods from the caller's thread.
+        
+        Args:
+            motor_ids: List of motor IDs to read
+            hz: Polling rate in Hz (default: 100)
+        """
+        if self._poll_thread is not None:
+            raise RuntimeError("Background polling already running. Call stop_background_polling() first.")
+        if hz <= 0:
+            raise ValueError(f"hz must be positive, got {hz}")
+        
+        self._poll_stop.clear()
+        self._poll_thread = threading.Thread(
+            target=self._poll_loop,
+            args=(list(motor_ids), 1.0 / hz),
+            name="dynamixel_poll",
+            daemon=True,
+        )
+        self._poll_thread.start()
+        self._verbose_log("✅ Background polling started for motors %s at %s Hz", motor_ids, hz)
+    
+    def stop_background_polling(self):
+        """Stop the polling thread, then send any writes still posted."""
+        if self._poll_thread is None:
+            return
+        
+        self._poll_stop.set()
+        self._poll_thread.join()
+        self._poll_thread = None
+        self._send_posted_writes()
+        self._verbose_log("✅ Background polling stopped")
+    
+    def get_latest_states(self) -> Optional[Dict[int, Dict[str, int]]]:
+        """
+        Return the most recent states published by the polling thread.
+        
+        Returns:
+            Dict as returned by bulk_read_states (treat as read-only), or None
+            before the first poll has completed
+        """
+        return self._latest_states
+    
+    def post_write(self, motor_id: int, address: int, data: bytes):
+        """
+        Hand a register write to the polling thread without blocking.
+        
+        Posted writes are merged and sent with flush() at the start of the next
+        polling cycle. Safe to call from any thread.
+        
+        Args:
+            motor_id: Motor ID
+            address: Control table start address
+            data: Little-endian bytes to write
+        """
+        self._posted_writes.put((motor_id, address, bytes(data)))
+    
     # ============================================================================
     # BAUD RATE AND ID MANAGEMENT
     # ============================================================================
     
     @abstractmethod
-    def scan_motors_at_baudrate(self, baudrate: int, scan_range: range = range(0, 253)) -> List[int]:
+    def scan_motors_at_baudrate(self, baudrate: int, scan_range: Optional[range] = None) -> List[int]:
         """
         Scan for motors at a specific baud rate.
         
         Args:
             baudrate: Baud rate to scan at
-            scan_range: Range of motor IDs to scan (default: 0-252)
+            scan_range: Range of motor IDs to scan (default: all IDs 0-252)
             
         Returns:
             List of detected motor IDs
@@ -310,12 +793,13 @@ class BaseInterface(ABC):
         pass
     
     @abstractmethod
-    def scan_all_baudrates(self, scan_range: range = range(0, 253)) -> Dict[int, int]:
+    def scan_all_baudrates(self, scan_range: Optional[range] = None, extra_ports: Optional[List[str]] = None) -> Dict[int, int]:
         """
         Scan for motors at all possible baud rates.
         
         Args:
-            scan_range: Range of motor IDs to scan (default: 0-252)
+            scan_range: Range of motor IDs to scan (default: all IDs 0-252)
+            extra_ports: Other adapters' serial ports to scan concurrently (default: none)
             
         Returns:
             Dictionary mapping motor_id to baudrate
@@ -389,15 +873,167 @@ class BaseInterface(ABC):
         """Close the serial port."""
         pass
     
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
     # ============================================================================
     # UTILS
     # ============================================================================
     
-    def _log(self, msg: str):
-        """Log a message."""
-        print(f"[BaseInterface] {msg}")
+    def _index_motor_ids(self, motor_ids: Union[List[int], np.ndarray]):
+        """Cache the motor ID -> column index mapping for motor_ids."""
+        self._id_to_idx = {int(motor_id): idx for idx, motor_id in enumerate(motor_ids)}
+        self._id_to_idx_array.fill(-1)
+        self._id_to_idx_array[motor_ids] = np.arange(len(motor_ids))
+    
+    def _bulk_read_signed(self, motor_ids: List[int], address: int, length: int) -> Dict[int, int]:
+        """Bulk read one signed little-endian register per motor, 0 where the read failed."""
+        results = self.bulk_read_views(self._read_params(motor_ids, address, length))
+        missing = ZERO_REGISTERS[length]
+        raw = b''.join(results.get((motor_id, address), missing) for motor_id in motor_ids)
+        return dict(zip(motor_ids, np.frombuffer(raw, dtype=SIGNED_DTYPES[length]).tolist()))
+    
+    def _validate_id_mapping(self, id_mapping: Dict[int, int]) -> bool:
+        """Check that the new IDs of an ID mapping are in range and unique, logging why not."""
+        new_ids = set(id_mapping.values())
+        if not new_ids <= VALID_MOTOR_IDS:
+            invalid_ids = [new_id for new_id in id_mapping.values() if new_id not in VALID_MOTOR_IDS]
+            self._log("❌ Invalid new IDs: %s. Must be 0-%s", invalid_ids, MAX_MOTOR_ID)
+            return False
+        
+        if len(new_ids) != len(id_mapping):
+            self._log("❌ Duplicate new IDs found. Each motor must have a unique ID.")
+            return False
+        
+        return True
+    
+    def _read_params(self, motor_ids: List[int], address: int, length: int) -> Tuple[Tuple[int, int, int], ...]:
+        """
+        Return bulk_read parameters reading address/length from every motor in motor_ids.
+        
+        Polling loops pass the same motor_ids every call, so the tuples are built once
+        per (motor_ids, address, length) and reused.
+        """
+        return _build_read_params(tuple(motor_ids), address, length)
+    
+    def _get_or_create_sync_reader(self, key: Tuple[int, int], factory):
+        """Return the cached sync reader for key, calling factory() only the first time."""
+        reader = self._sync_readers.get(key)
+        if reader is None:
+            reader = self._sync_readers[key] = factory()
+        return reader
+    
+    def _get_or_create_sync_writer(self, key: Tuple[int, int], factory):
+        """Return the cached sync writer for key, calling factory() only the first time."""
+        writer = self._sync_writers.get(key)
+        if writer is None:
+            writer = self._sync_writers[key] = factory()
+        return writer
+    
+    def _run_in_io_thread(self, func, *args) -> asyncio.Future:
+        """
+        Run a blocking call on the interface's single I/O worker thread.
+        
+        One worker per interface keeps bus transactions strictly ordered, since the
+        serial port cannot be shared between concurrent requests.
+        """
+        if self._io_executor is None:
+            self._io_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="dynamixel_io")
+        return asyncio.get_running_loop().run_in_executor(self._io_executor, func, *args)
+    
+    def _shutdown_io_executor(self):
+        """Stop the I/O worker thread if one was started."""
+        if self._io_executor is not None:
+            self._io_executor.shutdown(wait=True)
+            self._io_executor = None
+    
+    def _poll_loop(self, motor_ids: List[int], period: float):
+        """Polling thread body: send posted writes, read and publish states, wait for the next cycle."""
+        next_time = time.monotonic()
+        while not self._poll_stop.is_set():
+            try:
+                self._send_posted_writes()
+                self._latest_states = self.bulk_read_states(motor_ids)
+            except Exception as e:
+                self._log("❌ Background polling error: %s", e)
+            
+            next_time += period
+            delay = next_time - time.monotonic()
+            if delay < 0:
+                # Overran the period; restart the schedule instead of bursting to catch up
+                next_time = time.monotonic()
+                delay = 0
+            self._poll_stop.wait(delay)
+    
+    def _send_posted_writes(self):
+        """Move all posted writes into the write queue and flush them."""
+        posted = False
+        while True:
+            try:
+                motor_id, address, data = self._posted_writes.get_nowait()
+            except queue.Empty:
+                break
+            self.enqueue_write(motor_id, address, data)
+            posted = True
+        
+        if posted:
+            self.flush()
+    
+    def _state_buffer(self, out: Optional[np.ndarray], shape: Tuple[int, ...]) -> np.ndarray:
+        """Return out if it is a usable int32 buffer of the given shape, else allocate one."""
+        if out is None:
+            return np.empty(shape, dtype=np.int32)
+        if out.shape != shape or out.dtype != np.int32:
+            raise ValueError(f"out must be an int32 array of shape {shape}, got {out.dtype} {out.shape}")
+        return out
+    
+    def _as_int32_array(self, values: Union[List[int], np.ndarray, bytes]) -> np.ndarray:
+        """Convert a list, array or packed little-endian bytes to a contiguous int32 array."""
+        if isinstance(values, (bytes, bytearray, memoryview)):
+            return np.frombuffer(values, dtype='<i4')
+        return np.ascontiguousarray(values, dtype='<i4')
+    
+    def _bulk_write_entries(self, write_params) -> List[Tuple[int, int, bytes]]:
+        """
+        Normalize either bulk_write form to a list of (motor_id, address, data) entries.
+        
+        For the (motor_ids, address, data_block) form, each data is a memoryview of a
+        row of data_block, so no per-motor bytes objects are allocated.
+        """
+        if not isinstance(write_params, tuple):
+            return write_params
+        motor_ids, address, data_block = write_params
+        if not isinstance(data_block, np.ndarray) or data_block.dtype != np.uint8 or data_block.ndim != 2:
+            raise ValueError("data_block must be a 2D uint8 array")
+        if not data_block.flags.c_contiguous:
+            raise ValueError("data_block must be C-contiguous")
+        if len(motor_ids) != data_block.shape[0]:
+            raise ValueError("motor_ids and data_block rows must have the same length")
+        return [(int(motor_id), address, data_block[i].data) for i, motor_id in enumerate(motor_ids)]
+    
+    def _crc16(self, buf: bytes, crc: int = 0) -> int:
+        """
+        Compute the Protocol 2.0 CRC-16 of buf, continuing from crc.
+        
+        Subclasses can override this with a faster implementation; the default is
+        a table-driven pure-Python version that consumes two bytes per step.
+        """
+        byte_table, word_table = _crc16_tables()
+        words = len(buf) >> 1
+        for word in struct.unpack_from(f'>{words}H', buf):
+            crc = word_table[crc ^ word]
+        if len(buf) & 1:
+            crc = ((crc << 8) ^ byte_table[(crc >> 8) ^ buf[-1]]) & 0xFFFF
+        return crc
+    
+    def _log(self, msg: str, *args):
+        """Log a message. Arguments are %-formatted lazily by the logger."""
+        logger.warning(msg, *args)
     
-    def _verbose_log(self, msg: str):
+    def _verbose_log(self, msg: str, *args):
         """Log a message if verbose is True."""
         if self.verbose:
-            self._log(msg)
+            logger.info(msg, *args)
@@ -5,25 +5,67 @@ This module provides a mock implementation of the U2D2Interface for testing
 higher-level code without requiring actual hardware.
 """
 
+import asyncio
+import contextlib
 import struct
 import time
-import random
-from typing import Dict, List, Tuple, Optional
-from .base_interface import BaseInterface, MotorMode
+from typing import Dict, List, Tuple, Optional, Union
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; the NumPy simulation is used without it
+    njit = None
+
+from .base_interface import BaseInterface, MotorMode, ReadHandle, DEFAULT_SCAN_IDS
 
 # Import constants from the original interface
 from .u2d2_interface import (
     ADDR_PRESENT_CURRENT,
     ADDR_PRESENT_VELOCITY, 
     ADDR_PRESENT_POSITION,
-    LEN_PRESENT_CURRENT,
-    LEN_PRESENT_VELOCITY,
-    LEN_PRESENT_POSITION,
-    STATE_ADDRESS_MAP,
+    VALID_STATES,
+    STRUCT_INT16,
+    STRUCT_INT32,
     BAUDRATE_MAP,
     SCAN_BAUDRATES
 )
 
+# Operating mode codes stored in the simulated state arrays
+MODE_CODES = {'position': 0, 'current': 1}
+_MODE_POSITION = MODE_CODES['position']
+_MODE_CURRENT = MODE_CODES['current']
+
+# State array attribute holding each readable state
+STATE_ARRAY_ATTRS = {'position': '_position', 'velocity': '_velocity', 'current': '_current'}
+
+
+def _simulate_kernel(position, velocity, current, goal_position, goal_current, torque_enabled, mode):
+    """
+    Per-motor loop form of FakeU2D2Interface._simulate_motor_behavior.
+    
+    Only used when numba is installed, compiled with njit; as plain Python it
+    would be slower than the vectorized NumPy version.
+    """
+    for i in range(position.shape[0]):
+        if not torque_enabled[i]:
+            continue
+        if mode[i] == _MODE_POSITION:
+            error = goal_position[i] - position[i]
+            if abs(error) > 5:
+                step = min(max(error * 0.1, -50.0), 50.0)
+                velocity[i] = step
+                position[i] += step * 0.01
+            else:
+                velocity[i] = 0.0
+        elif mode[i] == _MODE_CURRENT:
+            current[i] = goal_current[i]
+            position[i] += np.random.randint(-1, 2)
+
+
+_simulate_kernel_jit = njit(cache=True)(_simulate_kernel) if njit is not None else None
+
 
 class FakeU2D2Interface(BaseInterface):
     """
@@ -33,13 +75,33 @@ class FakeU2D2Interface(BaseInterface):
     for testing higher-level code without requiring actual Dynamixel hardware.
     """
     
+    __slots__ = (
+        '_rows',
+        '_position',
+        '_velocity',
+        '_current',
+        '_goal_position',
+        '_goal_current',
+        '_torque_enabled',
+        '_mode',
+        '_velocity_limit',
+        '_current_limit',
+        '_pid_gains',
+        '_sim_dt',
+        '_last_sim_time',
+        '_write_queue',
+        '_rng',
+        '_sync_rows',
+    )
+    
     def __init__(
         self,
         usb_port: str = "/dev/ttyUSB_fake",
         baudrate: int = 4000000,
-        motor_ids: Optional[List[int]] = None,
+        motor_ids: Optional[Union[List[int], np.ndarray]] = None,
         protocol_version: float = 2.0,
-        verbose: bool = False
+        verbose: bool = False,
+        latency_timer_ms: int = 1
     ):
         """
         Initialize the fake interface.
@@ -47,70 +109,99 @@ class FakeU2D2Interface(BaseInterface):
         Args:
             usb_port: Serial port (ignored for fake interface)
             baudrate: Communication speed (ignored for fake interface)
-            motor_ids: List of motor IDs for bulk reads
+            motor_ids: Motor IDs for bulk reads, as a list or array
             protocol_version: Dynamixel protocol version (ignored for fake interface)
             verbose: Print verbose output (default: False)
+            latency_timer_ms: USB latency timer (ignored for fake interface)
         """
-        super().__init__(usb_port, baudrate, motor_ids, protocol_version, verbose)
-        
-        # Mock motor state storage
-        self._motor_states: Dict[int, Dict[str, int]] = {}
-        self._motor_modes: Dict[int, str] = {}
-        self._torque_enabled: Dict[int, bool] = {}
-        self._goal_positions: Dict[int, int] = {}
-        self._goal_currents: Dict[int, int] = {}
-        self._velocity_limits: Dict[int, int] = {}
-        self._current_limits: Dict[int, int] = {}
-        self._pid_gains: Dict[int, Dict[str, int]] = {}
-        
-        # Initialize motor states if motor_ids provided
-        if self.motor_ids:
-            for motor_id in self.motor_ids:
-                self._initialize_motor_state(motor_id)
-        
-        self._verbose_log(f"✅ Fake interface initialized with {len(self.motor_ids) if self.motor_ids else 0} motors")
-    
-    def _initialize_motor_state(self, motor_id: int):
-        """Initialize mock state for a motor."""
-        self._motor_states[motor_id] = {
-            'position': 0,
-            'velocity': 0,
-            'current': 0
-        }
-        self._motor_modes[motor_id] = 'position'
-        self._torque_enabled[motor_id] = False
-        self._goal_positions[motor_id] = 0
-        self._goal_currents[motor_id] = 0
-        self._velocity_limits[motor_id] = 100
-        self._current_limits[motor_id] = 1000
-        self._pid_gains[motor_id] = {'p': 0, 'i': 0, 'd': 0}
+        super().__init__(usb_port, baudrate, motor_ids, protocol_version, verbose, latency_timer_ms)
+        
+        # Mock motor state storage: parallel arrays with one row per motor, so the
+        # simulation updates every motor with a few vectorized operations.
+        # Present values are float64 so sub-step position changes accumulate.
+        self._rows: Dict[int, int] = {}
+        self._position = np.zeros(0)
+        self._velocity = np.zeros(0)
+        self._current = np.zeros(0)
+        self._goal_position = np.zeros(0, dtype=np.int64)
+        self._goal_current = np.zeros(0, dtype=np.int64)
+        self._torque_enabled = np.zeros(0, dtype=bool)
+        self._mode = np.zeros(0, dtype=np.uint8)
+        self._velocity_limit = np.zeros(0, dtype=np.int64)
+        self._current_limit = np.zeros(0, dtype=np.int64)
+        self._pid_gains = np.zeros((0, 3), dtype=np.int64)  # Columns: P, I, D
+        
+        # The simulation advances at most one step per _sim_dt seconds, so reading
+        # N motors one at a time costs one step instead of N full-array steps
+        self._sim_dt = 0.01
+        self._last_sim_time = float('-inf')
+        self._write_queue: List[Tuple[int, int, bytes]] = []
+        self._rng = np.random.default_rng()
+        
+        # Initialize motor states if motor_ids provided, and cache their rows
+        self._sync_rows: Union[np.ndarray, slice] = np.zeros(0, dtype=np.intp)
+        if self.motor_ids is not None:
+            rows = np.array([self._row(motor_id) for motor_id in self._motor_ids_list], dtype=np.intp)
+            # The sync motors are created first, so unless motor_ids repeats an ID they
+            # occupy the leading rows in order; a slice then indexes them as a view
+            # instead of gathering a copy on every sync read and write
+            if np.array_equal(rows, np.arange(len(rows))):
+                rows = slice(0, len(rows))
+            self._sync_rows = rows
+        
+        self._verbose_log("✅ Fake interface initialized with %s motors", len(self.motor_ids) if self.motor_ids is not None else 0)
+    
+    def _initialize_motor_state(self, motor_id: int) -> int:
+        """Add a zeroed mock state row for a motor and return its row index."""
+        row = len(self._rows)
+        self._rows[motor_id] = row
+        self._position = np.append(self._position, 0.0)
+        self._velocity = np.append(self._velocity, 0.0)
+        self._current = np.append(self._current, 0.0)
+        self._goal_position = np.append(self._goal_position, 0)
+        self._goal_current = np.append(self._goal_current, 0)
+        self._torque_enabled = np.append(self._torque_enabled, False)
+        self._mode = np.append(self._mode, np.uint8(MODE_CODES['position']))
+        self._velocity_limit = np.append(self._velocity_limit, 100)
+        self._current_limit = np.append(self._current_limit, 1000)
+        self._pid_gains = np.vstack((self._pid_gains, np.zeros((1, 3), dtype=np.int64)))
+        return row
+    
+    def _row(self, motor_id: int) -> int:
+        """Return the state row of a motor, initializing it on first use."""
+        row = self._rows.get(motor_id)
+        if row is None:
+            row = self._initialize_motor_state(motor_id)
+        return row
     
     def _simulate_motor_behavior(self):
         """Simulate motor behavior by updating states based on goals."""
-        for motor_id in self._motor_states:
-            if not self._torque_enabled.get(motor_id, False):
-                continue
-            
-            # Simple simulation: move towards goal position
-            current_pos = self._motor_states[motor_id]['position']
-            goal_pos = self._goal_positions.get(motor_id, current_pos)
-            
-            if self._motor_modes.get(motor_id) == 'position':
-                # Simulate position control
-                error = goal_pos - current_pos
-                if abs(error) > 5:  # Deadband
-                    # Simple proportional control simulation
-                    velocity = min(max(error * 0.1, -50), 50)  # Limit velocity
-                    self._motor_states[motor_id]['velocity'] = velocity
-                    self._motor_states[motor_id]['position'] += velocity * 0.01  # Simple integration
-                else:
-                    self._motor_states[motor_id]['velocity'] = 0
-            elif self._motor_modes.get(motor_id) == 'current':
-                # Simulate current control
-                goal_current = self._goal_currents.get(motor_id, 0)
-                self._motor_states[motor_id]['current'] = goal_current
-                # In current mode, position can drift
-                self._motor_states[motor_id]['position'] += random.randint(-1, 1)
+        now = time.monotonic()
+        if now - self._last_sim_time < self._sim_dt:
+            return
+        self._last_sim_time = now
+        
+        if _simulate_kernel_jit is not None:
+            _simulate_kernel_jit(
+                self._position, self._velocity, self._current,
+                self._goal_position, self._goal_current,
+                self._torque_enabled, self._mode,
+            )
+            return
+        
+        # Simulate position control: simple proportional move towards the goal
+        position_mode = self._torque_enabled & (self._mode == _MODE_POSITION)
+        error = self._goal_position - self._position
+        moving = position_mode & (np.abs(error) > 5)  # Deadband
+        velocity = np.clip(error[moving] * 0.1, -50, 50)  # Limit velocity
+        self._velocity[position_mode] = 0
+        self._velocity[moving] = velocity
+        self._position[moving] += velocity * 0.01  # Simple integration
+        
+        # Simulate current control; in current mode, position can drift
+        current_mode = self._torque_enabled & (self._mode == _MODE_CURRENT)
+        self._current[current_mode] = self._goal_current[current_mode]
+        self._position[current_mode] += self._rng.integers(-1, 2, size=np.count_nonzero(current_mode))
     
     # ============================================================================
     # MOTOR CONFIGURATION
@@ -118,36 +209,100 @@ class FakeU2D2Interface(BaseInterface):
     
     def enable_torque(self, motor_id: int):
         """Enable torque on the specified motor."""
-        self._torque_enabled[motor_id] = True
-        self._verbose_log(f"✅ Fake torque enabled for motor {motor_id}")
+        row = self._row(motor_id)
+        self._torque_enabled[row] = True
+        self._verbose_log("✅ Fake torque enabled for motor %s", motor_id)
     
     def disable_torque(self, motor_id: int):
         """Disable torque on the specified motor."""
-        self._torque_enabled[motor_id] = False
-        self._verbose_log(f"✅ Fake torque disabled for motor {motor_id}")
+        row = self._row(motor_id)
+        self._torque_enabled[row] = False
+        self._verbose_log("✅ Fake torque disabled for motor %s", motor_id)
     
     def set_motor_mode(self, motor_id: int, mode: MotorMode):
         """Set the operating mode of a single motor using string parameter."""
-        if mode not in ['position', 'current']:
+        mode_code = MODE_CODES.get(mode)
+        if mode_code is None:
             raise ValueError(f"Invalid mode '{mode}'. Valid modes are: position, current")
         
-        self._motor_modes[motor_id] = mode
-        self._verbose_log(f"✅ Fake motor {motor_id} set to {mode} mode")
+        row = self._row(motor_id)
+        self._mode[row] = mode_code
+        self._verbose_log("✅ Fake motor %s set to %s mode", motor_id, mode)
     
     def set_position_p_gain(self, motor_id: int, p_gain: int):
         """Set the Position P Gain for a single motor."""
-        self._pid_gains[motor_id]['p'] = p_gain
-        self._verbose_log(f"✅ Fake P-Gain {p_gain} set for motor {motor_id}")
+        row = self._row(motor_id)
+        self._pid_gains[row, 0] = p_gain
+        self._verbose_log("✅ Fake P-Gain %s set for motor %s", p_gain, motor_id)
     
     def set_position_i_gain(self, motor_id: int, i_gain: int):
         """Set the Position I Gain for a single motor."""
-        self._pid_gains[motor_id]['i'] = i_gain
-        self._verbose_log(f"✅ Fake I-Gain {i_gain} set for motor {motor_id}")
+        row = self._row(motor_id)
+        self._pid_gains[row, 1] = i_gain
+        self._verbose_log("✅ Fake I-Gain %s set for motor %s", i_gain, motor_id)
     
     def set_position_d_gain(self, motor_id: int, d_gain: int):
         """Set the Position D Gain for a single motor."""
-        self._pid_gains[motor_id]['d'] = d_gain
-        self._verbose_log(f"✅ Fake D-Gain {d_gain} set for motor {motor_id}")
+        row = self._row(motor_id)
+        self._pid_gains[row, 2] = d_gain
+        self._verbose_log("✅ Fake D-Gain %s set for motor %s", d_gain, motor_id)
+    
+    def set_position_gains(self, motor_id: int, p_gain: int, i_gain: int, d_gain: int):
+        """Set the Position P, I and D Gains of a single motor in one write."""
+        row = self._row(motor_id)
+        self._pid_gains[row] = (p_gain, i_gain, d_gain)
+        self._verbose_log("✅ Fake gains P=%s I=%s D=%s set for motor %s", p_gain, i_gain, d_gain, motor_id)
+    
+    def bulk_enable_torque(self, motor_ids: List[int]):
+        """Enable torque on several motors."""
+        for motor_id in motor_ids:
+            self.enable_torque(motor_id)
+    
+    def bulk_disable_torque(self, motor_ids: List[int]):
+        """Disable torque on several motors."""
+        for motor_id in motor_ids:
+            self.disable_torque(motor_id)
+    
+    def bulk_set_motor_mode(self, motor_ids: List[int], modes: Union[MotorMode, List[MotorMode]], skip_unchanged: bool = False):
+        """Set the operating mode of several motors (simulated writes are free, so skip_unchanged has no effect)."""
+        if isinstance(modes, str):
+            modes = [modes] * len(motor_ids)
+        if len(modes) != len(motor_ids):
+            raise ValueError("motor_ids and modes must have the same length")
+        
+        for motor_id, mode in zip(motor_ids, modes):
+            self.set_motor_mode(motor_id, mode)
+    
+    def bulk_set_position_gains(self, motor_ids: List[int], p_gains: List[int], i_gains: List[int], d_gains: List[int]):
+        """Set the Position P, I and D Gains of several motors."""
+        if not len(motor_ids) == len(p_gains) == len(i_gains) == len(d_gains):
+            raise ValueError("motor_ids and gains must have the same length")
+        
+        for motor_id, p_gain, i_gain, d_gain in zip(motor_ids, p_gains, i_gains, d_gains):
+            self.set_position_gains(motor_id, p_gain, i_gain, d_gain)
+    
+    def bulk_set_return_delay_time(self, motor_ids: List[int], delay_units: Union[int, List[int]] = 0, skip_unchanged: bool = False):
+        """Set the Return Delay Time of several motors (the simulation has no reply delay to change)."""
+        if isinstance(delay_units, int):
+            delay_units = [delay_units] * len(motor_ids)
+        if len(delay_units) != len(motor_ids):
+            raise ValueError("motor_ids and delay_units must have the same length")
+        
+        self._verbose_log("✅ Fake return delay time set: %s", dict(zip(motor_ids, delay_units)))
+    
+    def bulk_set_velocity_limit(self, motor_ids: List[int], velocity_limits: Union[int, List[int]]):
+        """Set the profile velocity limit of several motors."""
+        if isinstance(velocity_limits, int):
+            velocity_limits = [velocity_limits] * len(motor_ids)
+        for motor_id, velocity_limit in zip(motor_ids, velocity_limits):
+            self.set_velocity_limit(motor_id, velocity_limit)
+    
+    def bulk_set_position_p_gain(self, motor_ids: List[int], p_gains: Union[int, List[int]]):
+        """Set the Position P Gain of several motors."""
+        if isinstance(p_gains, int):
+            p_gains = [p_gains] * len(motor_ids)
+        for motor_id, p_gain in zip(motor_ids, p_gains):
+            self.set_position_p_gain(motor_id, p_gain)
     
     # ============================================================================
     # SYNC BASE OPERATIONS
@@ -156,9 +311,8 @@ class FakeU2D2Interface(BaseInterface):
     def init_group_sync_read(self, motor_ids: List[int]):
         """Initialize group sync read parameters for maximum efficiency using contiguous read."""
         for motor_id in motor_ids:
-            if motor_id not in self._motor_states:
-                self._initialize_motor_state(motor_id)
-        self._verbose_log(f"✅ Fake sync read initialized for motors: {motor_ids}")
+            self._row(motor_id)
+        self._verbose_log("✅ Fake sync read initialized for motors: %s", motor_ids)
     
     def sync_read_state(self) -> Tuple[List[int], List[int], List[int]]:
         """Sync read the full state (position, velocity, current) of all motors."""
@@ -168,36 +322,34 @@ class FakeU2D2Interface(BaseInterface):
         # Simulate motor behavior
         self._simulate_motor_behavior()
         
-        positions = []
-        velocities = []
-        currents = []
-        
-        for motor_id in self.motor_ids:
-            state = self._motor_states.get(motor_id, {'position': 0, 'velocity': 0, 'current': 0})
-            positions.append(int(state['position']))
-            velocities.append(int(state['velocity']))
-            currents.append(int(state['current']))
-        
-        return positions, velocities, currents
+        rows = self._sync_rows
+        return (
+            self._position[rows].astype(np.int64).tolist(),
+            self._velocity[rows].astype(np.int64).tolist(),
+            self._current[rows].astype(np.int64).tolist(),
+        )
+    
+    def sync_read_state_fast(self) -> Tuple[List[int], List[int], List[int]]:
+        """Sync read the full state of all motors (same as sync_read_state for the fake)."""
+        return self.sync_read_state()
     
     # ============================================================================
     # SYNC WRITE OPERATIONS
     # ============================================================================
     
-    def sync_write_positions(self, positions: List[int]):
+    def sync_write_positions(self, positions: Union[List[int], np.ndarray, bytes]):
         """Sync write position commands to all configured motors."""
         if self.motor_ids is None:
             raise RuntimeError("Sync write position not configured. Initialize with motor_ids.")
         
+        positions = self._as_int32_array(positions)
         if len(positions) != len(self.motor_ids):
             raise ValueError(f"positions length ({len(positions)}) must match motor_ids length ({len(self.motor_ids)})")
         
-        for motor_id, position in zip(self.motor_ids, positions):
-            self._goal_positions[motor_id] = position
-            if motor_id not in self._motor_states:
-                self._initialize_motor_state(motor_id)
+        self._goal_position[self._sync_rows] = positions
         
-        self._verbose_log(f"✅ Fake sync write positions: {dict(zip(self.motor_ids, positions))}")
+        if self.verbose:
+            self._verbose_log("✅ Fake sync write positions: %s", dict(zip(self._motor_ids_list, positions.tolist())))
     
     def sync_write_currents(self, currents: List[int]):
         """Sync write current commands to all configured motors."""
@@ -207,12 +359,10 @@ class FakeU2D2Interface(BaseInterface):
         if len(currents) != len(self.motor_ids):
             raise ValueError(f"currents length ({len(currents)}) must match motor_ids length ({len(self.motor_ids)})")
         
-        for motor_id, current in zip(self.motor_ids, currents):
-            self._goal_currents[motor_id] = current
-            if motor_id not in self._motor_states:
-                self._initialize_motor_state(motor_id)
+        self._goal_current[self._sync_rows] = currents
         
-        self._verbose_log(f"✅ Fake sync write currents: {dict(zip(self.motor_ids, currents))}")
+        if self.verbose:
+            self._verbose_log("✅ Fake sync write currents: %s", dict(zip(self._motor_ids_list, currents)))
     
     # ============================================================================
     # SYNC SPECIFIC STATE READS
@@ -220,28 +370,24 @@ class FakeU2D2Interface(BaseInterface):
     
     def init_specific_group_sync_read(self, state: str):
         """Initialize group sync read parameters for specific states."""
-        if state not in STATE_ADDRESS_MAP.keys():
+        if state not in VALID_STATES:
             raise ValueError(f"Invalid state: {state}")
         
-        self._verbose_log(f"✅ Fake specific sync read initialized for state: {state}")
+        self._verbose_log("✅ Fake specific sync read initialized for state: %s", state)
     
     def sync_read_specific(self, state: str) -> List[int]:
         """Sync read only specific state for all configured motors."""
         if self.motor_ids is None:
             raise RuntimeError(f"Specific state sync read not configured. Call init_specific_group_sync_read({state}) first.")
         
-        if state not in STATE_ADDRESS_MAP.keys():
+        if state not in VALID_STATES:
             raise ValueError(f"Invalid state: {state}")
         
         # Simulate motor behavior
         self._simulate_motor_behavior()
         
-        specific_state = []
-        for motor_id in self.motor_ids:
-            state_value = self._motor_states.get(motor_id, {'position': 0, 'velocity': 0, 'current': 0})[state]
-            specific_state.append(int(state_value))
-        
-        return specific_state
+        values = getattr(self, STATE_ARRAY_ATTRS[state])
+        return values[self._sync_rows].astype(np.int64).tolist()
     
     # ============================================================================
     # BULK BASE OPERATIONS
@@ -249,122 +395,123 @@ class FakeU2D2Interface(BaseInterface):
     
     def bulk_read(self, read_params: List[Tuple[int, int, int]]) -> Dict:
         """Perform bulk read operation for multiple motors."""
+        return {key: bytes(data) for key, data in self.bulk_read_views(read_params).items()}
+    
+    def bulk_read_views(self, read_params: List[Tuple[int, int, int]]) -> Dict:
+        """Bulk read without copying: values are memoryviews valid until the next call."""
+        # Resolve rows first, since initializing a new motor reallocates the state arrays
+        rows = [self._row(motor_id) for motor_id, _, _ in read_params]
+        
+        # Each register is encoded for all motors at once into one buffer, and every
+        # motor gets a memoryview slice of it instead of its own bytes object
+        fields = {
+            ADDR_PRESENT_POSITION: (self._position, '<i4', 4),
+            ADDR_PRESENT_VELOCITY: (self._velocity, '<i4', 4),
+            ADDR_PRESENT_CURRENT: (self._current, '<i2', 2),
+        }
+        buffers = {}
         results = {}
         
-        for motor_id, address, length in read_params:
-            if motor_id not in self._motor_states:
-                self._initialize_motor_state(motor_id)
-            
-            state = self._motor_states[motor_id]
-            
-            if address == ADDR_PRESENT_POSITION:
-                data = struct.pack('<I', int(state['position']))
-            elif address == ADDR_PRESENT_VELOCITY:
-                data = struct.pack('<I', int(state['velocity']))
-            elif address == ADDR_PRESENT_CURRENT:
-                data = struct.pack('<H', int(state['current']))
-            else:
-                data = b'\x00' * length
+        for (motor_id, address, length), row in zip(read_params, rows):
+            field = fields.get(address)
+            if field is None:
+                results[(motor_id, address)] = memoryview(bytes(length))
+                continue
             
-            results[(motor_id, address)] = data
+            values, dtype, size = field
+            buf = buffers.get(address)
+            if buf is None:
+                buf = buffers[address] = memoryview(values.astype(dtype).tobytes())
+            results[(motor_id, address)] = buf[row * size:(row + 1) * size]
         
         return results
     
-    def bulk_write(self, write_params: List[Tuple[int, int, bytes]]):
+    def bulk_write(self, write_params: Union[List[Tuple[int, int, bytes]], Tuple[np.ndarray, int, np.ndarray]]):
         """Perform bulk write operation for multiple motors."""
+        write_params = self._bulk_write_entries(write_params)
         for motor_id, address, data_bytes in write_params:
-            if motor_id not in self._motor_states:
-                self._initialize_motor_state(motor_id)
+            row = self._row(motor_id)
             
             # Simulate different write operations based on address
             if address == 116:  # ADDR_GOAL_POSITION
-                position = struct.unpack('<I', data_bytes)[0]
-                self._goal_positions[motor_id] = position
+                self._goal_position[row] = STRUCT_INT32.unpack(data_bytes)[0]
             elif address == 102:  # ADDR_GOAL_CURRENT
-                current = struct.unpack('<H', data_bytes)[0]
-                self._goal_currents[motor_id] = current
+                self._goal_current[row] = STRUCT_INT16.unpack(data_bytes)[0]
         
-        self._verbose_log(f"✅ Fake bulk write completed for {len(write_params)} parameters")
+        self._verbose_log("✅ Fake bulk write completed for %s parameters", len(write_params))
     
     # ============================================================================
     # BULK HIGH-LEVEL OPERATIONS
     # ============================================================================
     
-    def bulk_write_positions(self, motor_ids: List[int], positions: List[int]):
+    def bulk_write_positions(self, motor_ids: List[int], positions: Union[List[int], np.ndarray]):
         """Bulk write position commands to multiple motors."""
         if len(motor_ids) != len(positions):
             raise ValueError("motor_ids and positions must have the same length")
         
-        for motor_id, position in zip(motor_ids, positions):
-            self._goal_positions[motor_id] = position
-            if motor_id not in self._motor_states:
-                self._initialize_motor_state(motor_id)
+        rows = [self._row(motor_id) for motor_id in motor_ids]
+        self._goal_position[rows] = positions
         
-        self._verbose_log(f"✅ Fake bulk write positions: {dict(zip(motor_ids, positions))}")
+        if self.verbose:
+            self._verbose_log("✅ Fake bulk write positions: %s", dict(zip(motor_ids, positions)))
     
     def bulk_write_currents(self, motor_ids: List[int], currents: List[int]):
         """Bulk write current commands to multiple motors."""
         if len(motor_ids) != len(currents):
             raise ValueError("motor_ids and currents must have the same length")
         
-        for motor_id, current in zip(motor_ids, currents):
-            self._goal_currents[motor_id] = current
-            if motor_id not in self._motor_states:
-                self._initialize_motor_state(motor_id)
+        rows = [self._row(motor_id) for motor_id in motor_ids]
+        self._goal_current[rows] = currents
         
-        self._verbose_log(f"✅ Fake bulk write currents: {dict(zip(motor_ids, currents))}")
+        if self.verbose:
+            self._verbose_log("✅ Fake bulk write currents: %s", dict(zip(motor_ids, currents)))
     
-    def bulk_read_positions(self, motor_ids: List[int]) -> Dict[int, int]:
-        """Bulk read positions from multiple motors."""
-        read_params = [(motor_id, ADDR_PRESENT_POSITION, LEN_PRESENT_POSITION) for motor_id in motor_ids]
-        results = self.bulk_read(read_params)
+    def bulk_read_states(self, motor_ids: List[int]) -> Dict[int, Dict[str, int]]:
+        """Bulk read all states (position, velocity, current) from multiple motors."""
+        self._simulate_motor_behavior()
         
-        positions = {}
-        for motor_id in motor_ids:
-            data = results.get((motor_id, ADDR_PRESENT_POSITION), b'\x00\x00\x00\x00')
-            positions[motor_id] = self._parse_position(data)
+        # Gather every motor's row once, then build the result in a single pass
+        rows = [self._row(motor_id) for motor_id in motor_ids]
+        positions = self._position[rows].astype(np.int64).tolist()
+        velocities = self._velocity[rows].astype(np.int64).tolist()
+        currents = self._current[rows].astype(np.int64).tolist()
         
-        return positions
+        return {
+            motor_id: {'position': position, 'velocity': velocity, 'current': current}
+            for motor_id, position, velocity, current in zip(motor_ids, positions, velocities, currents)
+        }
     
-    def bulk_read_velocities(self, motor_ids: List[int]) -> Dict[int, int]:
-        """Bulk read velocities from multiple motors."""
-        read_params = [(motor_id, ADDR_PRESENT_VELOCITY, LEN_PRESENT_VELOCITY) for motor_id in motor_ids]
-        results = self.bulk_read(read_params)
-        
-        velocities = {}
-        for motor_id in motor_ids:
-            data = results.get((motor_id, ADDR_PRESENT_VELOCITY), b'\x00\x00\x00\x00')
-            velocities[motor_id] = self._parse_velocity(data)
-        
-        return velocities
+    # ============================================================================
+    # PIPELINED WRITES
+    # ============================================================================
     
-    def bulk_read_currents(self, motor_ids: List[int]) -> Dict[int, int]:
-        """Bulk read currents from multiple motors."""
-        read_params = [(motor_id, ADDR_PRESENT_CURRENT, LEN_PRESENT_CURRENT) for motor_id in motor_ids]
-        results = self.bulk_read(read_params)
-        
-        currents = {}
-        for motor_id in motor_ids:
-            data = results.get((motor_id, ADDR_PRESENT_CURRENT), b'\x00\x00')
-            currents[motor_id] = self._parse_current(data)
-        
-        return currents
+    def enqueue_write(self, motor_id: int, address: int, data: bytes):
+        """Queue a register write without touching the bus."""
+        self._write_queue.append((motor_id, address, bytes(data)))
     
-    def bulk_read_states(self, motor_ids: List[int]) -> Dict[int, Dict[str, int]]:
-        """Bulk read all states (position, velocity, current) from multiple motors."""
-        positions = self.bulk_read_positions(motor_ids)
-        velocities = self.bulk_read_velocities(motor_ids)
-        currents = self.bulk_read_currents(motor_ids)
-        
-        states = {}
-        for motor_id in motor_ids:
-            states[motor_id] = {
-                'position': positions[motor_id],
-                'velocity': velocities[motor_id],
-                'current': currents[motor_id]
-            }
+    def flush(self) -> Dict[int, bool]:
+        """Apply all queued writes and clear the queue."""
+        queue, self._write_queue = self._write_queue, []
+        if not queue:
+            return {}
         
-        return states
+        self.bulk_write(queue)
+        return {motor_id: True for motor_id, _, _ in queue}
+    
+    @contextlib.contextmanager
+    def batch(self):
+        """Writes are applied immediately, so batching changes nothing."""
+        yield
+    
+    # ============================================================================
+    # ASYNC OPERATIONS
+    # ============================================================================
+    
+    async def submit_bulk_read(self, read_params: List[Tuple[int, int, int]]) -> ReadHandle:
+        """Perform the bulk read immediately and return an already-resolved handle."""
+        future = asyncio.get_running_loop().create_future()
+        future.set_result(self.bulk_read(read_params))
+        return ReadHandle(future)
     
     # ============================================================================
     # BULK UTILS
@@ -372,30 +519,73 @@ class FakeU2D2Interface(BaseInterface):
     
     def _parse_position(self, data: bytes) -> int:
         """Parse 4-byte position data."""
-        if len(data) >= 4:
-            value = struct.unpack('<I', data[:4])[0]
-            if value > 2147483647:
-                value -= 4294967296
-            return value
-        return 0
+        try:
+            return STRUCT_INT32.unpack_from(data, 0)[0]
+        except struct.error:  # Short or missing data
+            return 0
     
     def _parse_velocity(self, data: bytes) -> int:
         """Parse 4-byte velocity data."""
-        if len(data) >= 4:
-            value = struct.unpack('<I', data[:4])[0]
-            if value > 2147483647:
-                value -= 4294967296
-            return value
-        return 0
+        try:
+            return STRUCT_INT32.unpack_from(data, 0)[0]
+        except struct.error:  # Short or missing data
+            return 0
     
     def _parse_current(self, data: bytes) -> int:
         """Parse 2-byte current data."""
-        if len(data) >= 2:
-            value = struct.unpack('<H', data[:2])[0]
-            if value > 32767:
-                value -= 65536
-            return value
-        return 0
+        try:
+            return STRUCT_INT16.unpack_from(data, 0)[0]
+        except struct.error:  # Short or missing data
+            return 0
+    
+    # ============================================================================
+    # NUMPY STATE READS
+    # ============================================================================
+    
+    def sync_read_state_np(self, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """Sync read the full state of all configured motors into a (3, N) int32 array."""
+        if self.motor_ids is None:
+            raise RuntimeError("Sync read not configured. Initialize with motor_ids.")
+        
+        out = self._state_buffer(out, (3, len(self.motor_ids)))
+        positions, velocities, currents = self.sync_read_state()
+        out[0] = positions
+        out[1] = velocities
+        out[2] = currents
+        return out
+    
+    def bulk_read_positions_np(self, motor_ids: List[int], out: Optional[np.ndarray] = None) -> np.ndarray:
+        """Bulk read positions from multiple motors into an (N,) int32 array."""
+        out = self._state_buffer(out, (len(motor_ids),))
+        positions = self.bulk_read_positions(motor_ids)
+        out[:] = [positions[motor_id] for motor_id in motor_ids]
+        return out
+    
+    def bulk_read_states_soa(self, motor_ids: List[int]) -> Dict[str, np.ndarray]:
+        """Bulk read all states from multiple motors as one array per field."""
+        self._simulate_motor_behavior()
+        
+        rows = [self._row(motor_id) for motor_id in motor_ids]
+        return {
+            'position': self._position[rows].astype(np.int32),
+            'velocity': self._velocity[rows].astype(np.int32),
+            'current': self._current[rows].astype(np.int16),
+        }
+    
+    def submit_sync_read_state(self):
+        """Nothing to send on the fake bus; the state is read by reap_sync_read_state()."""
+        if self.motor_ids is None:
+            raise RuntimeError("Sync read not configured. Initialize with motor_ids.")
+    
+    def reap_sync_read_state(self, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """Read the full state of all configured motors into a (3, N) int32 array."""
+        return self.sync_read_state_np(out)
+    
+    def control_loop_tick(self, goals: np.ndarray, previous_state: np.ndarray) -> bool:
+        """Read the state from before these goals into previous_state, then apply the goals."""
+        self.sync_read_state_np(previous_state)
+        self.sync_write_positions(goals)
+        return True
     
     # ============================================================================
     # INDIVIDUAL MOTOR OPERATIONS
@@ -403,77 +593,75 @@ class FakeU2D2Interface(BaseInterface):
     
     def set_goal_position(self, motor_id: int, goal: int):
         """Set goal position for a single motor."""
-        self._goal_positions[motor_id] = goal
-        if motor_id not in self._motor_states:
-            self._initialize_motor_state(motor_id)
-        self._verbose_log(f"✅ Fake goal position {goal} set for motor {motor_id}")
+        row = self._row(motor_id)
+        self._goal_position[row] = goal
+        self._verbose_log("✅ Fake goal position %s set for motor %s", goal, motor_id)
     
     def set_goal_current(self, motor_id: int, current: int):
         """Set the goal current for a single motor."""
-        self._goal_currents[motor_id] = current
-        if motor_id not in self._motor_states:
-            self._initialize_motor_state(motor_id)
-        self._verbose_log(f"✅ Fake goal current {current} set for motor {motor_id}")
+        row = self._row(motor_id)
+        self._goal_current[row] = current
+        self._verbose_log("✅ Fake goal current %s set for motor %s", current, motor_id)
     
     def set_velocity_limit(self, motor_id: int, velocity_limit: int):
         """Set the profile velocity limit for a single motor."""
-        self._velocity_limits[motor_id] = velocity_limit
-        self._verbose_log(f"✅ Fake velocity limit {velocity_limit} set for motor {motor_id}")
+        row = self._row(motor_id)
+        self._velocity_limit[row] = velocity_limit
+        self._verbose_log("✅ Fake velocity limit %s set for motor %s", velocity_limit, motor_id)
     
     def set_current_limit(self, motor_id: int, limit_mA: int):
         """Set the current limit for a single motor."""
-        self._current_limits[motor_id] = limit_mA
-        self._verbose_log(f"✅ Fake current limit {limit_mA} set for motor {motor_id}")
+        row = self._row(motor_id)
+        self._current_limit[row] = limit_mA
+        self._verbose_log("✅ Fake current limit %s set for motor %s", limit_mA, motor_id)
     
     def get_position(self, motor_id: int) -> int:
         """Return the current position of a motor."""
-        if motor_id not in self._motor_states:
-            self._initialize_motor_state(motor_id)
+        row = self._row(motor_id)
         
         # Simulate motor behavior
         self._simulate_motor_behavior()
         
-        return int(self._motor_states[motor_id]['position'])
+        return int(self._position[row])
     
     def get_velocity(self, motor_id: int) -> int:
         """Return the current velocity of the motor."""
-        if motor_id not in self._motor_states:
-            self._initialize_motor_state(motor_id)
+        row = self._row(motor_id)
         
         # Simulate motor behavior
         self._simulate_motor_behavior()
         
-        return int(self._motor_states[motor_id]['velocity'])
+        return int(self._velocity[row])
     
     def get_current(self, motor_id: int) -> int:
         """Return the present current (signed, in control-table LSB)."""
-        if motor_id not in self._motor_states:
-            self._initialize_motor_state(motor_id)
+        row = self._row(motor_id)
         
         # Simulate motor behavior
         self._simulate_motor_behavior()
         
-        return int(self._motor_states[motor_id]['current'])
+        return int(self._current[row])
     
     # ============================================================================
     # BAUD RATE AND ID MANAGEMENT
     # ============================================================================
     
-    def scan_motors_at_baudrate(self, baudrate: int, scan_range: range = range(0, 253)) -> List[int]:
+    def scan_motors_at_baudrate(self, baudrate: int, scan_range: Optional[range] = None) -> List[int]:
         """Scan for motors at a specific baud rate."""
-        self._verbose_log(f"🔄 Fake scanning at baudrate {baudrate}...")
+        self._verbose_log("🔄 Fake scanning at baudrate %s...", baudrate)
         
-        # Return a random subset of motors for testing
-        detected = []
-        for motor_id in scan_range:
-            if random.random() < 0.1:  # 10% chance of finding a motor
-                detected.append(motor_id)
+        if scan_range is None:
+            scan_range = DEFAULT_SCAN_IDS
         
-        self._verbose_log(f"✅ Fake scan found {len(detected)} motors at {baudrate} baud")
+        # Return a random subset of motors for testing (10% chance of finding each motor)
+        scan_ids = np.fromiter(scan_range, dtype=np.int32)
+        detected = scan_ids[self._rng.random(len(scan_ids)) < 0.1].tolist()
+        
+        self._verbose_log("✅ Fake scan found %s motors at %s baud", len(detected), baudrate)
         return detected
     
-    def scan_all_baudrates(self, scan_range: range = range(0, 253)) -> Dict[int, int]:
-        """Scan for motors at all possible baud rates."""
+    def scan_all_baudrates(self, scan_range: Optional[range] = None, extra_ports: Optional[List[str]] = None) -> Dict[int, int]:
+        """Scan for motors at all possible baud rates (extra_ports are ignored, there is only one fake bus)."""
         self._verbose_log("🔍 Fake scanning for motors at all baud rates...")
         
         detected_motors = {}
@@ -483,22 +671,22 @@ class FakeU2D2Interface(BaseInterface):
             for motor_id in detected:
                 detected_motors[motor_id] = baudrate
         
-        self._verbose_log(f"📊 Fake scan complete: Found {len(detected_motors)} motors total")
+        self._verbose_log("📊 Fake scan complete: Found %s motors total", len(detected_motors))
         return detected_motors
     
     def change_motor_baudrate(self, motor_id: int, current_baud: int, new_baud: int) -> bool:
         """Change baud rate of a specific motor."""
         if new_baud not in BAUDRATE_MAP:
-            self._log(f"❌ Invalid baud rate: {new_baud}. Valid rates: {list(BAUDRATE_MAP.keys())}")
+            self._log("❌ Invalid baud rate: %s. Valid rates: %s", new_baud, list(BAUDRATE_MAP.keys()))
             return False
         
-        self._verbose_log(f"✅ Fake motor ID {motor_id}: {current_baud} → {new_baud} baud")
+        self._verbose_log("✅ Fake motor ID %s: %s → %s baud", motor_id, current_baud, new_baud)
         return True
     
     def change_motors_baudrate(self, motor_baud_map: Dict[int, int], new_baud: int) -> Dict[int, bool]:
         """Change baud rate for multiple motors."""
         if not motor_baud_map:
-            self._log(f"❌ No motor IDs provided")
+            self._log("❌ No motor IDs provided")
             return {}
         
         results = {}
@@ -513,28 +701,19 @@ class FakeU2D2Interface(BaseInterface):
     def change_motor_id(self, current_id: int, new_id: int, baudrate: int) -> bool:
         """Change the ID of a single motor."""
         if new_id < 0 or new_id > 252:
-            self._log(f"❌ Invalid new ID: {new_id}. Must be 0-252")
+            self._log("❌ Invalid new ID: %s. Must be 0-252", new_id)
             return False
         
-        self._verbose_log(f"✅ Fake motor ID {current_id} → {new_id}")
+        self._verbose_log("✅ Fake motor ID %s → %s", current_id, new_id)
         return True
     
     def change_motors_id(self, id_mapping: Dict[int, int], baudrate: int) -> Dict[int, bool]:
         """Change IDs for multiple motors."""
         if not id_mapping:
-            self._log(f"❌ No motor ID mappings provided")
-            return {}
-        
-        # Validate all new IDs
-        invalid_ids = [new_id for new_id in id_mapping.values() if new_id < 0 or new_id > 252]
-        if invalid_ids:
-            self._log(f"❌ Invalid new IDs: {invalid_ids}. Must be 0-252")
+            self._log("❌ No motor ID mappings provided")
             return {}
         
-        # Check for duplicate new IDs
-        new_ids = list(id_mapping.values())
-        if len(new_ids) != len(set(new_ids)):
-            self._log(f"❌ Duplicate new IDs found. Each motor must have a unique ID.")
+        if not self._validate_id_mapping(id_mapping):
             return {}
         
         results = {}
@@ -552,6 +731,8 @@ class FakeU2D2Interface(BaseInterface):
     
     def close(self):
         """Close the serial port."""
+        self.stop_background_polling()
+        self._shutdown_io_executor()
         self._verbose_log("✅ Fake port closed.")
     
     # ============================================================================
@@ -568,17 +749,16 @@ class FakeU2D2Interface(BaseInterface):
             velocity: Velocity to set (optional)
             current: Current to set (optional)
         """
-        if motor_id not in self._motor_states:
-            self._initialize_motor_state(motor_id)
+        row = self._row(motor_id)
         
         if position is not None:
-            self._motor_states[motor_id]['position'] = position
+            self._position[row] = position
         if velocity is not None:
-            self._motor_states[motor_id]['velocity'] = velocity
+            self._velocity[row] = velocity
         if current is not None:
-            self._motor_states[motor_id]['current'] = current
+            self._current[row] = current
         
-        self._verbose_log(f"✅ Fake motor {motor_id} state set: pos={position}, vel={velocity}, cur={current}")
+        self._verbose_log("✅ Fake motor %s state set: pos=%s, vel=%s, cur=%s", motor_id, position, velocity, current)
     
     def get_motor_state(self, motor_id: int) -> Dict[str, int]:
         """
@@ -588,9 +768,13 @@ class FakeU2D2Interface(BaseInterface):
             motor_id: Motor ID to get state for
             
         Returns:
-            Dictionary with 'position', 'velocity', 'current'
+            Dictionary with 'position', 'velocity', 'current', built from the state
+            arrays on each call; changing it does not affect the simulated motor
         """
-        if motor_id not in self._motor_states:
-            self._initialize_motor_state(motor_id)
+        row = self._row(motor_id)
         
-        return self._motor_states[motor_id].copy()
+        return {
+            'position': int(self._position[row]),
+            'velocity': int(self._velocity[row]),
+            'current': int(self._current[row])
+        }
@@ -0,0 +1,98 @@
+"""
+USB latency timer access for FTDI-based adapters such as the U2D2.
+
+The FTDI driver buffers incoming bytes for up to latency_timer milliseconds
+(16 ms by default) before handing them to the host, which puts a floor on
+the round trip of every read. The timer is exposed per port in sysfs:
+
+    /sys/bus/usb-serial/devices/ttyUSB0/latency_timer
+
+Writing it needs root, or a udev rule that makes it writable, e.g.
+/etc/udev/rules.d/99-dynamixel-latency.rules:
+
+    ACTION=="add", SUBSYSTEM=="usb-serial", DRIVER=="ftdi_sio", ATTR{latency_timer}="1"
+
+Without either, set_low_latency asks the driver for low-latency mode through
+the TIOCSSERIAL ioctl on the open port, which any user that can open the port
+may do. ftdi_sio drops its latency timer to 1 ms when the flag is set.
+"""
+
+import os
+import struct
+from typing import Optional
+
+try:
+    import fcntl
+    import termios
+except ImportError:  # Windows
+    fcntl = termios = None
+
+# Latency timers above this are reported as a performance problem
+LATENCY_TIMER_WARN_MS = 4
+
+# struct serial_struct from <linux/serial.h>: flags is the int after type, line, port, irq
+ASYNC_LOW_LATENCY = 1 << 13
+SERIAL_FLAGS = struct.Struct('=i')
+SERIAL_FLAGS_OFFSET = 16
+SERIAL_STRUCT_SIZE = 128  # Larger than sizeof(struct serial_struct) on any ABI
+
+
+def latency_timer_path(port: str) -> str:
+    """Return the sysfs latency_timer path for a port, following /dev/serial/by-id links."""
+    return f"/sys/bus/usb-serial/devices/{os.path.basename(os.path.realpath(port))}/latency_timer"
+
+
+def read_latency_timer(port: str) -> Optional[int]:
+    """
+    Read the current latency timer of a port.
+
+    Returns:
+        Latency timer in milliseconds, or None if the port has no latency timer
+    """
+    try:
+        with open(latency_timer_path(port), 'r') as f:
+            return int(f.read().strip())
+    except (OSError, ValueError):
+        return None
+
+
+def write_latency_timer(port: str, latency_ms: int) -> bool:
+    """
+    Write the latency timer of a port.
+
+    Returns:
+        True if the value was written, False if the port has no latency timer
+        or the sysfs file is not writable by this user
+    """
+    try:
+        with open(latency_timer_path(port), 'w') as f:
+            f.write(str(latency_ms))
+        return True
+    except OSError:
+        return False
+
+
+def set_low_latency(fd: int) -> bool:
+    """
+    Set ASYNC_LOW_LATENCY on an open serial port.
+
+    Args:
+        fd: File descriptor of the open port
+
+    Returns:
+        True if the flag is set, False if the platform or driver does not support it
+    """
+    if fcntl is None or not hasattr(termios, 'TIOCGSERIAL'):
+        return False
+
+    buf = bytearray(SERIAL_STRUCT_SIZE)
+    try:
+        fcntl.ioctl(fd, termios.TIOCGSERIAL, buf)
+        flags, = SERIAL_FLAGS.unpack_from(buf, SERIAL_FLAGS_OFFSET)
+        if flags & ASYNC_LOW_LATENCY:
+            return True
+        SERIAL_FLAGS.pack_into(buf, SERIAL_FLAGS_OFFSET, flags | ASYNC_LOW_LATENCY)
+        fcntl.ioctl(fd, termios.TIOCSSERIAL, buf)
+        return True
+    except OSError:
+        return False
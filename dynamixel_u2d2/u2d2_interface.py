@@ -9,18 +9,45 @@ Requirements:
     pip install dynamixel-sdk numpy
 """
 
+import contextlib
+import functools
+import inspect
+import itertools
+import logging
+import select
 import struct
-from typing import Dict, List, Tuple, Literal, Optional
+import sys
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, List, Tuple, Literal, Optional, Union
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; the pure-Python CRC tables are used without it
+    njit = None
+
 from dynamixel_sdk import (
     PortHandler,
     PacketHandler, 
+    Protocol2PacketHandler,
     GroupSyncRead,
     GroupSyncWrite,
     GroupBulkRead,
     GroupBulkWrite,
-    COMM_SUCCESS
+    COMM_SUCCESS,
+    COMM_RX_TIMEOUT,
+    COMM_PORT_BUSY,
+    COMM_TX_FAIL
 )
-from .base_interface import BaseInterface, MotorMode
+from .base_interface import BaseInterface, MotorMode, ReadHandle, DEFAULT_SCAN_IDS, SIGNED_DTYPES, UNSIGNED_DTYPES, _crc16_tables
+from .port_latency import LATENCY_TIMER_WARN_MS, read_latency_timer, set_low_latency, write_latency_timer
+
+logger = logging.getLogger(__name__)
+
+# dynamixel-sdk 4.x added a fast_option argument to Protocol2PacketHandler.rxPacket
+RX_PACKET_ARGS = (False,) if 'fast_option' in inspect.signature(Protocol2PacketHandler.rxPacket).parameters else ()
 
 # ============================================================================
 # CONTROL TABLE ADDRESSES AND CONSTANTS
@@ -29,6 +56,7 @@ from .base_interface import BaseInterface, MotorMode
 # Control table addresses for X-series motors
 ADDR_ID = 7
 ADDR_BAUD_RATE = 8
+ADDR_RETURN_DELAY_TIME = 9
 ADDR_OPERATING_MODE = 11
 ADDR_POSITION_P_GAIN = 84
 ADDR_POSITION_I_GAIN = 82
@@ -48,6 +76,12 @@ ADDR_PRESENT_POSITION = 132
 POSITION_CONTROL = 3
 CURRENT_CONTROL_MODE = 0
 
+# Operating Mode register value for each MotorMode
+OPERATING_MODE_MAP = {
+    'position': POSITION_CONTROL,
+    'current': CURRENT_CONTROL_MODE,
+}
+
 # Data lengths for bulk operations
 LEN_GOAL_CURRENT = 2
 LEN_GOAL_POSITION = 4
@@ -60,11 +94,62 @@ STATE_ADDRESS_MAP = {
     "velocity": (ADDR_PRESENT_VELOCITY, LEN_PRESENT_VELOCITY, 32),
     "position": (ADDR_PRESENT_POSITION, LEN_PRESENT_POSITION, 32),
 }
+VALID_STATES = frozenset(STATE_ADDRESS_MAP)
 
 # Constant for Sync Operations: 
 ADDR_ALL_STATES = ADDR_PRESENT_CURRENT
 LEN_ALL_STATES = LEN_PRESENT_CURRENT + LEN_PRESENT_VELOCITY + LEN_PRESENT_POSITION # 10 bytes total
 
+# Stand-in state block for motors that did not answer a bulk read (decodes to all zeros)
+ZERO_STATE_BLOCK = bytes(LEN_ALL_STATES)
+
+# Packed little-endian layout of the contiguous state block starting at ADDR_ALL_STATES
+STATE_DTYPE = np.dtype([
+    ('current', '<i2'),
+    ('velocity', '<i4'),
+    ('position', '<i4'),
+])
+
+# Precompiled little-endian codecs for register values and the state block,
+# so hot paths don't re-parse a format string on every call
+STRUCT_INT16 = struct.Struct('<h')
+STRUCT_INT32 = struct.Struct('<i')
+STRUCT_STATE = struct.Struct('<hii')  # current, velocity, position
+STRUCT_UINT16 = struct.Struct('<H')
+STRUCT_POSITION_GAINS = struct.Struct('<HHH')  # D, I, P gains from ADDR_POSITION_D_GAIN
+LEN_POSITION_GAINS = STRUCT_POSITION_GAINS.size
+
+# Per-motor sync write layout of the D, I, P gain block
+POSITION_GAINS_DTYPE = np.dtype(('<u2', (3,)))
+
+# Protocol 2.0 Sync Write packet: header, broadcast ID, length, instruction,
+# start address and data length, then [id, data...] per motor and the CRC
+SYNC_WRITE_HEADER = struct.Struct('<4sBHBHH')
+SYNC_WRITE_PREFIX = b'\xff\xff\xfd\x00'
+BROADCAST_ID = 0xFE
+INST_SYNC_WRITE = 0x83
+PKT_LENGTH_L = 5
+LEN_CRC = 2
+
+# Protocol 2.0 Write packet: header, motor ID, length, instruction and start
+# address, then the data and the CRC. Its status packet is 11 bytes long.
+WRITE_HEADER = struct.Struct('<4sBHBH')
+INST_WRITE = 0x03
+PKT_ID = 4
+PKT_ERROR = 8
+LEN_WRITE_STATUS = 11
+
+# Longest Return Delay Time a motor can wait before each status packet (254 x 2 us),
+# budgeted per status packet since the configured value is not known here
+MAX_RETURN_DELAY_MS = 254 * 2 / 1000.0
+
+# Byte sequence that Protocol 2.0 requires to be stuffed inside a packet body
+STUFFING_PATTERN = b'\xff\xff\xfd'
+
+# Driver receive queue requested for the serial port on Windows, where the 4 KiB
+# default can overflow on large sync read responses at high baud rates
+SERIAL_RX_BUFFER_SIZE = 65536
+
 # Baudrate mapping for Dynamixel X-series
 BAUDRATE_MAP = {
     9600: 0,
@@ -79,6 +164,27 @@ BAUDRATE_MAP = {
 # Common baud rates
 SCAN_BAUDRATES = [9600, 57600, 115200, 1000000, 2000000, 3000000, 4000000]
 
+def _crc16_kernel(data, crc, table):
+    """
+    Byte-at-a-time table CRC-16 of data (uint8 array), continuing from crc.
+    
+    Only used when numba is installed, compiled with njit; as plain Python it
+    would be slower than the two-bytes-per-step BaseInterface._crc16.
+    """
+    for i in range(data.shape[0]):
+        crc = ((crc << 8) ^ table[((crc >> 8) ^ data[i]) & 0xFF]) & 0xFFFF
+    return crc
+
+
+_crc16_kernel_jit = njit(cache=True)(_crc16_kernel) if njit is not None else None
+
+
+@functools.lru_cache(maxsize=1)
+def _crc16_table_np() -> np.ndarray:
+    """The CRC-16 byte table as a uint16 array for _crc16_kernel."""
+    return np.array(_crc16_tables()[0], dtype=np.uint16)
+
+
 class U2D2Interface(BaseInterface):
     """
     U2D2 Interface with sync read/write support for Dynamixel motors.
@@ -87,41 +193,100 @@ class U2D2Interface(BaseInterface):
     through the U2D2 communication bridge, with efficient sync operations for
     multi-motor control scenarios.
     """
+    
+    __slots__ = (
+        '_portHandler',
+        '_packetHandler',
+        '_groupSyncRead',
+        '_groupSyncReadSpecific',
+        '_groupSyncWritePosition',
+        '_groupSyncWriteCurrent',
+        '_groupBulkRead',
+        '_groupBulkReadParams',
+        '_groupBulkWrite',
+        '_positionParam',
+        '_currentParam',
+        '_fast_sync_read_supported',
+        '_bulk_read_buffer',
+        '_write_queue',
+        '_tx_batch',
+        '_comm_result_texts',
+        '_write_packets',
+        '_latency_timer',
+    )
 
     def __init__(
         self,
         usb_port: str,
         baudrate: int = 4000000,
-        motor_ids: Optional[List[int]] = None,
+        motor_ids: Optional[Union[List[int], np.ndarray]] = None,
         protocol_version: float = 2.0,
-        verbose: bool = False
+        verbose: bool = False,
+        latency_timer_ms: int = 1
     ):
         """
         Args:
             usb_port: Serial port (e.g., '/dev/ttyUSB0')
             baudrate: Communication speed (57600, 1000000, etc.)
-            motor_ids: List of motor IDs for bulk reads (optional for utility functions)
+            motor_ids: Motor IDs for bulk reads, as a list or array (optional for utility functions)
             protocol_version: Dynamixel protocol version (usually 2.0)
             verbose: Print verbose output (default: False)
+            latency_timer_ms: USB latency timer to set on the port, in ms (default: 1)
         """
-        super().__init__(usb_port, baudrate, motor_ids, protocol_version, verbose)
+        super().__init__(usb_port, baudrate, motor_ids, protocol_version, verbose, latency_timer_ms)
 
         # Hardware interfaces
         self._portHandler = PortHandler(self.usb_port)
         self._packetHandler = PacketHandler(self.protocol_version)
+        if self.protocol_version == 2.0:
+            # Every TX/RX packet is checksummed; route it through the faster _crc16
+            self._packetHandler.updateCRC = self._update_crc
 
         # Group handlers
         self._groupSyncRead = None
         self._groupSyncReadSpecific = None
         self._groupSyncWritePosition = None
         self._groupSyncWriteCurrent = None
+        self._positionParam = None
+        self._currentParam = None
+        
+        # Bulk handlers reused across calls; the reader keeps its parameters
+        # registered until bulk_read is called with different read_params
+        self._groupBulkRead = GroupBulkRead(self._portHandler, self._packetHandler)
+        self._groupBulkReadParams: Tuple[Tuple[int, int, int], ...] = ()
+        self._groupBulkWrite = GroupBulkWrite(self._portHandler, self._packetHandler)
+        
+        # Fast Sync Read support: None until the first attempt, False if the SDK lacks it
+        self._fast_sync_read_supported = None if hasattr(GroupSyncRead, 'fastSyncRead') else False
+        
+        # Backing storage for bulk_read results, reused across calls
+        self._bulk_read_buffer = bytearray()
+        
+        # Pending (motor_id, address, data) writes for flush()
+        self._write_queue: List[Tuple[int, int, bytes]] = []
+        
+        # Sync Write packets deferred by batch(), None outside a batch
+        self._tx_batch: Optional[bytearray] = None
+        
+        # SDK descriptions of communication results, by result code
+        self._comm_result_texts: Dict[int, str] = {}
+        
+        # Prebuilt single-motor Write packets, keyed by (motor_id, address)
+        self._write_packets: Dict[Tuple[int, int], bytearray] = {}
         
         # Connect to the U2D2 interface
         self._connect()
+        
+        # Latency timer read back from the port, None if it has none. Set after
+        # connecting so the low-latency fallback has an open port to work on.
+        self._latency_timer = self._configure_latency_timer()
 
         # Setup sync I/O handlers:
         if self.motor_ids is not None:
             self._setup_sync_io_handlers()
+        
+        # Pay the hot path's one-time costs now rather than in the first control cycle
+        self._warm_up()
     
     # ============================================================================
     # SETUP METHODS
@@ -133,31 +298,230 @@ class U2D2Interface(BaseInterface):
             raise RuntimeError("Cannot setup bulk I/O without motor_ids")
         
         # Single sync reader for all motors (reads current + velocity + position)
-        self.init_group_sync_read(self.motor_ids)
+        self.init_group_sync_read(self._motor_ids_list)
             
-        # Sync writers
-        self._groupSyncWritePosition = GroupSyncWrite(
-            self._portHandler,
-            self._packetHandler,
-            ADDR_GOAL_POSITION, 
-            LEN_GOAL_POSITION
+        # Sync writers, each with a pre-packed parameter buffer
+        self._groupSyncWritePosition, self._positionParam = self._get_sync_writer(ADDR_GOAL_POSITION, LEN_GOAL_POSITION)
+        self._groupSyncWriteCurrent, self._currentParam = self._get_sync_writer(ADDR_GOAL_CURRENT, LEN_GOAL_CURRENT)
+    
+    def _warm_up(self):
+        """
+        Do the lazy one-time work of the packet path before the first real packet.
+        
+        Builds the CRC tables (and loads or compiles the numba CRC kernel), then
+        discards any bytes left in the receive buffer from before the port was opened.
+        """
+        self._crc16(bytes(2))
+        ser = getattr(self._portHandler, 'ser', None)
+        if ser is not None:
+            ser.reset_input_buffer()
+    
+    def _get_sync_writer(self, address: int, data_length: int) -> Tuple[GroupSyncWrite, np.ndarray]:
+        """Return the cached (GroupSyncWrite, param view) pair for a register range."""
+        return self._get_or_create_sync_writer(
+            (address, data_length),
+            lambda: self._prime_sync_write(
+                GroupSyncWrite(self._portHandler, self._packetHandler, address, data_length),
+                data_length,
+            ),
+        )
+    
+    def _get_sync_reader(self, address: int, data_length: int, motor_ids: List[int]) -> GroupSyncRead:
+        """
+        Return the cached GroupSyncRead for a register range, registered for motor_ids.
+        
+        The cache key is only (address, data_length): if motor_ids differ from the
+        motors the group was last registered for, its parameters are rebuilt.
+        """
+        group = self._get_or_create_sync_reader(
+            (address, data_length),
+            lambda: GroupSyncRead(self._portHandler, self._packetHandler, address, data_length),
+        )
+        if list(group.data_dict) != list(motor_ids):
+            group.clearParam()
+            for motor_id in motor_ids:
+                if not group.addParam(motor_id):
+                    raise Exception(f"[U2D2Interface] Failed to add sync read parameter for motor {motor_id}")
+        return group
+    
+    def _get_group_sync_reader(self, address: int, data_length: int, motor_ids: Tuple[int, ...]) -> GroupSyncRead:
+        """
+        Return the cached GroupSyncRead for a register range of an arbitrary motor set.
+        
+        Unlike _get_sync_reader, the motor set is part of the cache key, so polling
+        other motors never re-registers the groups used by the configured sync reads.
+        """
+        def create():
+            group = GroupSyncRead(self._portHandler, self._packetHandler, address, data_length)
+            for motor_id in motor_ids:
+                group.addParam(motor_id)  # Repeated IDs are read once
+            return group
+        
+        return self._get_or_create_sync_reader((address, data_length, motor_ids), create)
+    
+    def _get_group_sync_writer(self, address: int, data_length: int, motor_ids: Tuple[int, ...], data_dtype: Optional[np.dtype] = None) -> Tuple[GroupSyncWrite, np.ndarray]:
+        """Return the cached (GroupSyncWrite, param view) pair for a register range of an arbitrary motor set."""
+        return self._get_or_create_sync_writer(
+            (address, data_length, motor_ids),
+            lambda: self._prime_sync_write(
+                GroupSyncWrite(self._portHandler, self._packetHandler, address, data_length),
+                data_length,
+                motor_ids,
+                data_dtype,
+            ),
         )
-        self._groupSyncWriteCurrent = GroupSyncWrite(
-            self._portHandler,
-            self._packetHandler,
-            ADDR_GOAL_CURRENT,
-            LEN_GOAL_CURRENT
+    
+    def _prime_sync_write(self, group: GroupSyncWrite, data_length: int, motor_ids: Optional[Tuple[int, ...]] = None, data_dtype: Optional[np.dtype] = None) -> Tuple[GroupSyncWrite, np.ndarray]:
+        """
+        Preallocate the SDK parameter buffer of a sync writer.
+        
+        The buffer holds one [id, data...] record per motor with the IDs filled in
+        once, so later writes only assign the 'data' field in place. Assigning an
+        int array or list to that field encodes it straight into the buffer, with
+        no per-call bytes objects or temporary arrays. On Protocol 2.0 the buffer
+        sits inside a prebuilt Sync Write packet sent by _sync_write_tx.
+        
+        Args:
+            group: Sync writer to prime
+            data_length: Bytes written per motor
+            motor_ids: Motors to write (default: the configured motor_ids)
+            data_dtype: Layout of one motor's data (default: little-endian signed,
+                data_length bytes)
+        
+        Returns:
+            The group and a structured view of shape (N,) over its param buffer, with
+            fields 'id' (uint8) and 'data' (data_dtype)
+        """
+        if motor_ids is None:
+            motor_ids = self._motor_ids_list
+        if data_dtype is None:
+            data_dtype = SIGNED_DTYPES[data_length]
+        
+        for motor_id in motor_ids:
+            if not group.addParam(motor_id, [0] * data_length):
+                raise RuntimeError(f"Failed to add sync write parameter for motor {motor_id}")
+        
+        param_length = len(motor_ids) * (1 + data_length)
+        if self.protocol_version == 2.0:
+            # Lay the parameters out inside a complete Sync Write packet, so that
+            # _sync_write_tx can send it without the SDK rebuilding it as a list
+            packet = bytearray(SYNC_WRITE_HEADER.size + param_length + LEN_CRC)
+            SYNC_WRITE_HEADER.pack_into(
+                packet, 0, SYNC_WRITE_PREFIX, BROADCAST_ID,
+                param_length + 7, INST_SYNC_WRITE, group.start_address, data_length,
+            )
+            param = memoryview(packet)[SYNC_WRITE_HEADER.size:-LEN_CRC]
+        else:
+            param = bytearray(param_length)
+        param_view = np.frombuffer(param, dtype=np.dtype([('id', np.uint8), ('data', data_dtype)]))
+        param_view['id'] = motor_ids
+        
+        # txPacket sends group.param as-is as long as it is not flagged as changed
+        group.param = param
+        group.is_param_changed = False
+        return group, param_view
+    
+    def _configure_latency_timer(self) -> Optional[int]:
+        """
+        Set the port's USB latency timer to latency_timer_ms and read it back.
+        
+        The verified value is cached here once, so the per-call sync/bulk paths
+        never touch sysfs. It also replaces the 16 ms latency the SDK assumes when
+        computing RX timeouts, so lost packets are detected sooner.
+        
+        Returns:
+            The latency timer in ms, or None if the port does not expose one
+        """
+        current = read_latency_timer(self.usb_port)
+        if current is None:
+            self._verbose_log("ℹ️ %s has no USB latency timer, skipping", self.usb_port)
+            return None
+        
+        if current != self.latency_timer_ms:
+            if not write_latency_timer(self.usb_port, self.latency_timer_ms) and not self._set_low_latency():
+                self._log("⚠️ Cannot write latency timer of %s (needs root or a udev rule, see port_latency.py)", self.usb_port)
+            current = read_latency_timer(self.usb_port)
+            if current is None:
+                return None
+        
+        if current > LATENCY_TIMER_WARN_MS:
+            self._log("⚠️ Latency timer of %s is %s ms; every read will take at least that long", self.usb_port, current)
+        else:
+            self._verbose_log("✅ Latency timer of %s: %s ms", self.usb_port, current)
+        
+        self._portHandler.setPacketTimeout = self._set_packet_timeout
+        return current
+    
+    def _set_low_latency(self) -> bool:
+        """Fall back to the driver's low-latency flag on the open port when sysfs is not writable."""
+        ser = getattr(self._portHandler, 'ser', None)
+        if ser is None or not set_low_latency(ser.fileno()):
+            return False
+        self._verbose_log("✅ Set ASYNC_LOW_LATENCY on %s", self.usb_port)
+        return True
+    
+    def _set_packet_timeout(self, packet_length: int):
+        """
+        PortHandler.setPacketTimeout using the port's actual latency timer instead of 16 ms.
+        
+        A sync or bulk read sets one timeout for all of its status packets, and
+        each motor waits its Return Delay Time (500 us from the factory) before
+        answering. Every status packet is at least LEN_WRITE_STATUS bytes, so
+        packet_length // LEN_WRITE_STATUS bounds how many there are, and each
+        gets MAX_RETURN_DELAY_MS of margin.
+        """
+        port = self._portHandler
+        status_packets = max(1, packet_length // LEN_WRITE_STATUS)
+        port.packet_start_time = port.getCurrentTime()
+        port.packet_timeout = (
+            (port.tx_time_per_byte * packet_length)
+            + (self._latency_timer * 2.0) + 2.0
+            + status_packets * MAX_RETURN_DELAY_MS
         )
     
+    def _setup_port(self, cflag_baud: int) -> bool:
+        """PortHandler.setupPort that also enlarges the driver's receive queue."""
+        result = PortHandler.setupPort(self._portHandler, cflag_baud)
+        self._portHandler.ser.set_buffer_size(rx_size=SERIAL_RX_BUFFER_SIZE)
+        return result
+    
+    def _read_port(self, length: int) -> bytes:
+        """
+        PortHandler.readPort that waits in select() when no bytes are ready.
+        
+        The SDK's receive loops call readPort back to back until the packet
+        arrives or times out, spinning a core for the whole round trip. An
+        empty read here sleeps on the port's fd for at most the rest of the
+        packet timeout, so the loop wakes only when data arrives.
+        """
+        port = self._portHandler
+        ser = port.ser
+        data = ser.read(length)
+        if data:
+            return data
+        
+        remaining_ms = port.packet_timeout - (port.getCurrentTime() - port.packet_start_time)
+        if remaining_ms > 0 and select.select([ser.fileno()], [], [], remaining_ms / 1000.0)[0]:
+            return ser.read(length)
+        return data
+    
     def _connect(self):
         """Connect to the U2D2 interface."""
+        # pyserial already opens POSIX ports raw and non-blocking. Windows ports get
+        # a larger receive queue, reapplied on every reopen since setBaudRate
+        # recreates the serial object.
+        if sys.platform == 'win32':
+            self._portHandler.setupPort = self._setup_port
+        else:
+            self._portHandler.readPort = self._read_port
+        
         if not self._portHandler.openPort():
             raise RuntimeError("Failed to open the serial port!")
         
         if not self._portHandler.setBaudRate(self.baudrate):
             raise RuntimeError(f"Failed to set baudrate to {self.baudrate}!")
         
-        self._verbose_log(f"✅ Connected to {self.usb_port} at {self.baudrate} baud")
+        self._verbose_log("✅ Connected to %s at %s baud", self.usb_port, self.baudrate)
 
     # ============================================================================
     # MOTOR CONFIGURATION
@@ -168,16 +532,14 @@ class U2D2Interface(BaseInterface):
         dxl_comm_result, dxl_error = self._packetHandler.write1ByteTxRx(
             self._portHandler, motor_id, ADDR_TORQUE_ENABLE, 1
         )
-        if dxl_comm_result != COMM_SUCCESS:
-            self._log(f"❌ Torque Enable Error ({motor_id}): {self._packetHandler.getTxRxResult(dxl_comm_result)}")
+        self._comm_ok(dxl_comm_result, "❌ Torque Enable Error (%s)", motor_id)
     
     def disable_torque(self, motor_id: int):
         """Disable torque on the specified motor."""
         dxl_comm_result, dxl_error = self._packetHandler.write1ByteTxRx(
             self._portHandler, motor_id, ADDR_TORQUE_ENABLE, 0
         )
-        if dxl_comm_result != COMM_SUCCESS:
-            self._log(f"❌ Torque Disable Error ({motor_id}): {self._packetHandler.getTxRxResult(dxl_comm_result)}")
+        self._comm_ok(dxl_comm_result, "❌ Torque Disable Error (%s)", motor_id)
     
     def _set_operating_mode(self, motor_id: int, mode: int):
         """
@@ -190,10 +552,8 @@ class U2D2Interface(BaseInterface):
         dxl_comm_result, dxl_error = self._packetHandler.write1ByteTxRx(
             self._portHandler, motor_id, ADDR_OPERATING_MODE, mode
         )
-        if dxl_comm_result != COMM_SUCCESS:
-            self._log(f"❌ Failed to set mode for motor {motor_id}")
-        else:
-            self._verbose_log(f"✅ Set motor {motor_id} to mode {mode}")
+        if self._comm_ok(dxl_comm_result, "❌ Failed to set mode for motor %s", motor_id):
+            self._verbose_log("✅ Set motor %s to mode %s", motor_id, mode)
     
     def set_motor_mode(self, motor_id: int, mode: MotorMode):
         """
@@ -206,18 +566,13 @@ class U2D2Interface(BaseInterface):
                 - 'position': Position control mode
                 - 'current': Current control mode  
         """
-        mode_map = {
-            'position': POSITION_CONTROL,
-            'current': CURRENT_CONTROL_MODE
-        }
-        
         # TODO: Add support for current_based_position, velocity, extended_position, pwm control modes
         
-        if mode not in mode_map:
-            valid_modes = ', '.join(mode_map.keys())
+        mode_value = OPERATING_MODE_MAP.get(mode)
+        if mode_value is None:
+            valid_modes = ', '.join(OPERATING_MODE_MAP)
             raise ValueError(f"Invalid mode '{mode}'. Valid modes are: {valid_modes}")
         
-        mode_value = mode_map[mode]
         self._set_operating_mode(motor_id, mode_value)
     
     def set_position_p_gain(self, motor_id: int, p_gain: int):
@@ -225,30 +580,121 @@ class U2D2Interface(BaseInterface):
         dxl_comm_result, dxl_error = self._packetHandler.write2ByteTxRx(
             self._portHandler, motor_id, ADDR_POSITION_P_GAIN, p_gain
         )
-        if dxl_comm_result != COMM_SUCCESS:
-            self._log(f"❌ Failed to set P-Gain for motor {motor_id}")
-        else:
-            self._verbose_log(f"✅ Set P-Gain {p_gain} for motor {motor_id}")
+        if self._comm_ok(dxl_comm_result, "❌ Failed to set P-Gain for motor %s", motor_id):
+            self._verbose_log("✅ Set P-Gain %s for motor %s", p_gain, motor_id)
     
     def set_position_i_gain(self, motor_id: int, i_gain: int):
         """Set the Position I Gain for a single motor."""
         dxl_comm_result, dxl_error = self._packetHandler.write2ByteTxRx(
             self._portHandler, motor_id, ADDR_POSITION_I_GAIN, i_gain
         )
-        if dxl_comm_result != COMM_SUCCESS:
-            self._log(f"❌ Failed to set I-Gain for motor {motor_id}")
-        else:
-            self._verbose_log(f"✅ Set I-Gain {i_gain} for motor {motor_id}")
+        if self._comm_ok(dxl_comm_result, "❌ Failed to set I-Gain for motor %s", motor_id):
+            self._verbose_log("✅ Set I-Gain %s for motor %s", i_gain, motor_id)
     
     def set_position_d_gain(self, motor_id: int, d_gain: int):
         """Set the Position D Gain for a single motor."""
         dxl_comm_result, dxl_error = self._packetHandler.write2ByteTxRx(
             self._portHandler, motor_id, ADDR_POSITION_D_GAIN, d_gain
         )
-        if dxl_comm_result != COMM_SUCCESS:
-            self._log(f"❌ Failed to set D-Gain for motor {motor_id}")
+        if self._comm_ok(dxl_comm_result, "❌ Failed to set D-Gain for motor %s", motor_id):
+            self._verbose_log("✅ Set D-Gain %s for motor %s", d_gain, motor_id)
+    
+    def bulk_enable_torque(self, motor_ids: List[int]):
+        """Enable torque on several motors with one sync write."""
+        self._sync_write_values(ADDR_TORQUE_ENABLE, 1, motor_ids, 1)
+    
+    def bulk_disable_torque(self, motor_ids: List[int]):
+        """Disable torque on several motors with one sync write."""
+        self._sync_write_values(ADDR_TORQUE_ENABLE, 1, motor_ids, 0)
+    
+    def bulk_set_motor_mode(self, motor_ids: List[int], modes: Union[MotorMode, List[MotorMode]], skip_unchanged: bool = False):
+        """
+        Set the operating mode of several motors with one sync write.
+        
+        Args:
+            motor_ids: List of motor IDs
+            modes: One mode for all motors, or a list of modes aligned to motor_ids
+            skip_unchanged: Read the current modes first and only write the motors
+                whose mode differs. Operating Mode is an EEPROM register, so this
+                trades one sync read round trip for EEPROM writes (default: False)
+        """
+        if isinstance(modes, str):
+            modes = [modes] * len(motor_ids)
+        if len(modes) != len(motor_ids):
+            raise ValueError("motor_ids and modes must have the same length")
+        
+        mode_values = []
+        for mode in modes:
+            mode_value = OPERATING_MODE_MAP.get(mode)
+            if mode_value is None:
+                valid_modes = ', '.join(OPERATING_MODE_MAP)
+                raise ValueError(f"Invalid mode '{mode}'. Valid modes are: {valid_modes}")
+            mode_values.append(mode_value)
+        
+        if skip_unchanged:
+            self._sync_write_changed(ADDR_OPERATING_MODE, 1, motor_ids, mode_values, UNSIGNED_DTYPES[1])
+        else:
+            self._sync_write_values(ADDR_OPERATING_MODE, 1, motor_ids, mode_values, UNSIGNED_DTYPES[1])
+    
+    def bulk_set_position_gains(self, motor_ids: List[int], p_gains: List[int], i_gains: List[int], d_gains: List[int]):
+        """
+        Set the Position P, I and D Gains of several motors with one sync write.
+        
+        Args:
+            motor_ids: List of motor IDs
+            p_gains, i_gains, d_gains: Gain values aligned to motor_ids
+        """
+        if not len(motor_ids) == len(p_gains) == len(i_gains) == len(d_gains):
+            raise ValueError("motor_ids and gains must have the same length")
+        
+        # Register order is D (80), I (82), P (84)
+        gains = np.column_stack((d_gains, i_gains, p_gains))
+        self._sync_write_values(ADDR_POSITION_D_GAIN, LEN_POSITION_GAINS, motor_ids, gains, POSITION_GAINS_DTYPE)
+    
+    def bulk_set_return_delay_time(self, motor_ids: List[int], delay_units: Union[int, List[int]] = 0, skip_unchanged: bool = False):
+        """
+        Set the Return Delay Time (2 µs units) of several motors with one sync write.
+        
+        Motors ship with 250 (500 µs), which every status packet waits for;
+        0 removes that wait. It is an EEPROM register, so torque must be off.
+        
+        Args:
+            motor_ids: List of motor IDs
+            delay_units: One value for all motors or a list aligned to motor_ids (default: 0)
+            skip_unchanged: Read the current values first and only write the
+                motors whose value differs (default: False)
+        """
+        if isinstance(delay_units, int):
+            delay_units = [delay_units] * len(motor_ids)
+        if len(delay_units) != len(motor_ids):
+            raise ValueError("motor_ids and delay_units must have the same length")
+        
+        if skip_unchanged:
+            self._sync_write_changed(ADDR_RETURN_DELAY_TIME, 1, motor_ids, delay_units, UNSIGNED_DTYPES[1])
         else:
-            self._verbose_log(f"✅ Set D-Gain {d_gain} for motor {motor_id}")
+            self._sync_write_values(ADDR_RETURN_DELAY_TIME, 1, motor_ids, delay_units, UNSIGNED_DTYPES[1])
+    
+    def bulk_set_velocity_limit(self, motor_ids: List[int], velocity_limits: Union[int, List[int]]):
+        """Set the profile velocity limit of several motors (one value or one per motor) with one sync write."""
+        self._sync_write_values(ADDR_PROFILE_VELOCITY, 4, motor_ids, velocity_limits)
+    
+    def bulk_set_position_p_gain(self, motor_ids: List[int], p_gains: Union[int, List[int]]):
+        """Set the Position P Gain of several motors (one value or one per motor) with one sync write."""
+        self._sync_write_values(ADDR_POSITION_P_GAIN, 2, motor_ids, p_gains)
+    
+    def set_position_gains(self, motor_id: int, p_gain: int, i_gain: int, d_gain: int):
+        """
+        Set the Position P, I and D Gains of a single motor in one write.
+        
+        The D (80), I (82) and P (84) gain registers are contiguous, so one
+        6-byte write replaces three set_position_*_gain round trips.
+        """
+        data = STRUCT_POSITION_GAINS.pack(d_gain, i_gain, p_gain)
+        dxl_comm_result, dxl_error = self._packetHandler.writeTxRx(
+            self._portHandler, motor_id, ADDR_POSITION_D_GAIN, len(data), data
+        )
+        if self._comm_ok(dxl_comm_result, "❌ Failed to set position gains for motor %s", motor_id):
+            self._verbose_log("✅ Set gains P=%s I=%s D=%s for motor %s", p_gain, i_gain, d_gain, motor_id)
     
     # ============================================================================
     # SYNC BASE OPERATIONS
@@ -256,16 +702,7 @@ class U2D2Interface(BaseInterface):
 
     def init_group_sync_read(self, motor_ids: List[int]):
         """Initialize group sync read parameters for maximum efficiency using contiguous read."""
-        self._groupSyncRead = GroupSyncRead(
-            self._portHandler,
-            self._packetHandler,
-            ADDR_ALL_STATES,
-            LEN_ALL_STATES,
-        )
-
-        for motor_id in motor_ids:
-            if not self._groupSyncRead.addParam(motor_id):
-                raise Exception(f"[U2D2Interface] Failed to add sync read parameter for motor {motor_id}")
+        self._groupSyncRead = self._get_sync_reader(ADDR_ALL_STATES, LEN_ALL_STATES, motor_ids)
 
     def sync_read_state(self) -> Tuple[List[int], List[int], List[int]]:
         """Sync read the full state (position, velocity, current) of all motors."""
@@ -274,71 +711,77 @@ class U2D2Interface(BaseInterface):
             raise RuntimeError("Sync read not configured. Initialize with motor_ids.")
         
         dxl_comm_result = self._groupSyncRead.txRxPacket()
-        if dxl_comm_result != COMM_SUCCESS:
-            self._log(f"❌ Sync read state error: {dxl_comm_result}")
+        if not self._comm_ok(dxl_comm_result, "❌ Sync read state error"):
             raise RuntimeError(f"Sync read state error: {dxl_comm_result}")
         
-        positions = []
-        velocities = []
-        currents = []
+        return self._unpack_sync_state()
+    
+    def sync_read_state_fast(self) -> Tuple[List[int], List[int], List[int]]:
+        """
+        Sync read the full state (position, velocity, current) of all motors using
+        the Fast Sync Read instruction, which returns every motor's data in one
+        status packet. Falls back to sync_read_state if the SDK or the motor
+        firmware does not support it.
+        """
+        if self._groupSyncRead is None:
+            raise RuntimeError("Sync read not configured. Initialize with motor_ids.")
+        
+        if self._fast_sync_read_supported is False:
+            return self.sync_read_state()
         
-        for motor_id in self.motor_ids:
-            # Current (2 bytes)
-            if self._groupSyncRead.isAvailable(motor_id, ADDR_PRESENT_CURRENT, LEN_PRESENT_CURRENT):
-                unsigned_raw = self._groupSyncRead.getData(motor_id, ADDR_PRESENT_CURRENT, LEN_PRESENT_CURRENT)
-                value = self._to_signed(unsigned_raw, 8 * LEN_PRESENT_CURRENT)
-                currents.append(value)
-            else:
-                currents.append(None)
-            
-            # Velocity (4 bytes)
-            if self._groupSyncRead.isAvailable(motor_id, ADDR_PRESENT_VELOCITY, LEN_PRESENT_VELOCITY):
-                unsigned_raw = self._groupSyncRead.getData(motor_id, ADDR_PRESENT_VELOCITY, LEN_PRESENT_VELOCITY)
-                value = self._to_signed(unsigned_raw, 8 * LEN_PRESENT_VELOCITY)
-                velocities.append(value)
-            else:
-                velocities.append(None)
-            
-            # Position (4 bytes)
-            if self._groupSyncRead.isAvailable(motor_id, ADDR_PRESENT_POSITION, LEN_PRESENT_POSITION):
-                unsigned_raw = self._groupSyncRead.getData(motor_id, ADDR_PRESENT_POSITION, LEN_PRESENT_POSITION)
-                value = self._to_signed(unsigned_raw, 8 * LEN_PRESENT_POSITION)
-                positions.append(value)
-            else:
-                positions.append(None)
+        dxl_comm_result = self._groupSyncRead.fastSyncRead()
+        if dxl_comm_result != COMM_SUCCESS:
+            if self._fast_sync_read_supported is None:
+                self._log("⚠️ Fast sync read unavailable (%s), using regular sync read", self._comm_result_text(dxl_comm_result))
+                self._fast_sync_read_supported = False
+                return self.sync_read_state()
+            self._log("❌ Fast sync read state error: %s", self._comm_result_text(dxl_comm_result))
+            raise RuntimeError(f"Fast sync read state error: {dxl_comm_result}")
+        
+        self._fast_sync_read_supported = True
+        return self._unpack_sync_state()
+    
+    def _unpack_sync_state(self) -> Tuple[List[int], List[int], List[int]]:
+        """Extract positions, velocities and currents from the last sync read."""
+        states = self._sync_state_records()
+        return states['position'].tolist(), states['velocity'].tolist(), states['current'].tolist()
+    
+    def _sync_state_records(self) -> np.ndarray:
+        """
+        Decode the last successful sync read into a STATE_DTYPE record per motor.
         
-        return positions, velocities, currents
+        Every motor's raw 10-byte block is flattened into one buffer and decoded by
+        a single np.frombuffer, instead of per-value getData and sign-extension calls.
+        """
+        data_dict = self._groupSyncRead.data_dict
+        raw = bytes(itertools.chain.from_iterable([data_dict[motor_id] for motor_id in self._motor_ids_list]))
+        return np.frombuffer(raw, dtype=STATE_DTYPE)
     
     # ============================================================================
     # SYNC WRITE OPERATIONS
     # ============================================================================
 
-    def sync_write_positions(self, positions: List[int]):
+    def sync_write_positions(self, positions: Union[List[int], np.ndarray, bytes]):
         """
         Sync write position commands to all configured motors.
         
         Args:
-            positions: List of position values (must match self.motor_ids length)
+            positions: Position values (must match self.motor_ids length), as a list,
+                an int32 array, or pre-packed little-endian int32 bytes
         """
         if self._groupSyncWritePosition is None:
             raise RuntimeError("Sync write position not configured. Initialize with motor_ids.")
         
+        positions = self._as_int32_array(positions)
         if len(positions) != len(self.motor_ids):
             raise ValueError(f"positions length ({len(positions)}) must match motor_ids length ({len(self.motor_ids)})")
         
-        # Clear any existing parameters
-        self._groupSyncWritePosition.clearParam()
-        
-        # Add parameters for each motor
-        for motor_id, position in zip(self.motor_ids, positions):
-            position_bytes = struct.pack('<I', int(position))
-            if not self._groupSyncWritePosition.addParam(motor_id, position_bytes):
-                raise RuntimeError(f"Failed to add position parameter for motor {motor_id}")
+        # Copy all goals into the preallocated packet parameters in one shot
+        self._positionParam['data'] = positions
         
         # Execute sync write
-        dxl_comm_result = self._groupSyncWritePosition.txPacket()
-        if dxl_comm_result != COMM_SUCCESS:
-            self._log(f"❌ Sync write positions error: {self._packetHandler.getTxRxResult(dxl_comm_result)}")
+        dxl_comm_result = self._sync_write_tx(self._groupSyncWritePosition)
+        if not self._comm_ok(dxl_comm_result, "❌ Sync write positions error"):
             raise RuntimeError(f"Sync write positions error: {dxl_comm_result}")
 
     def sync_write_currents(self, currents: List[int]):
@@ -354,21 +797,12 @@ class U2D2Interface(BaseInterface):
         if len(currents) != len(self.motor_ids):
             raise ValueError(f"currents length ({len(currents)}) must match motor_ids length ({len(self.motor_ids)})")
         
-        # Clear any existing parameters
-        self._groupSyncWriteCurrent.clearParam()
-        
-        # Add parameters for each motor
-        for motor_id, current in zip(self.motor_ids, currents):
-            # Convert signed value to unsigned 16-bit for current register
-            current_value = self._to_unsigned_16bit(int(current))
-            current_bytes = struct.pack('<H', current_value)
-            if not self._groupSyncWriteCurrent.addParam(motor_id, current_bytes):
-                raise RuntimeError(f"Failed to add current parameter for motor {motor_id}")
+        # Overwrite only the data fields of the pre-packed parameters
+        self._currentParam['data'] = currents
         
         # Execute sync write
-        dxl_comm_result = self._groupSyncWriteCurrent.txPacket()
-        if dxl_comm_result != COMM_SUCCESS:
-            self._log(f"❌ Sync write currents error: {self._packetHandler.getTxRxResult(dxl_comm_result)}")
+        dxl_comm_result = self._sync_write_tx(self._groupSyncWriteCurrent)
+        if not self._comm_ok(dxl_comm_result, "❌ Sync write currents error"):
             raise RuntimeError(f"Sync write currents error: {dxl_comm_result}")
 
     # ============================================================================
@@ -377,20 +811,12 @@ class U2D2Interface(BaseInterface):
 
     def init_specific_group_sync_read(self, state: str):
         """Initialize group sync read parameters for specific states."""
-        if state not in STATE_ADDRESS_MAP.keys():
+        state_info = STATE_ADDRESS_MAP.get(state)
+        if state_info is None:
             raise ValueError(f"Invalid state: {state}")
 
-        address, length, bits = STATE_ADDRESS_MAP[state]
-        self._groupSyncReadSpecific = GroupSyncRead(
-            self._portHandler,
-            self._packetHandler,
-            address,
-            length,
-        )
-        
-        for motor_id in self.motor_ids:
-            if not self._groupSyncReadSpecific.addParam(motor_id):
-                raise Exception(f"[U2D2Interface] Failed to add sync read parameter for motor {motor_id}")
+        address, length, bits = state_info
+        self._groupSyncReadSpecific = self._get_sync_reader(address, length, self._motor_ids_list)
 
     def sync_read_specific(self, state: str) -> List[int]:
         """
@@ -407,17 +833,17 @@ class U2D2Interface(BaseInterface):
             raise RuntimeError(f"Specific state sync read not configured. Call init_specific_group_sync_read({state}) first.")
         
         dxl_comm_result = self._groupSyncReadSpecific.txRxPacket()
-        if dxl_comm_result != COMM_SUCCESS:
-            self._log(f"❌ Sync read specific state '{state}' error: {dxl_comm_result}")
+        if not self._comm_ok(dxl_comm_result, "❌ Sync read specific state '%s' error", state):
             raise RuntimeError(f"Sync read specific state '{state}' error: {dxl_comm_result}")
         
-        if state not in STATE_ADDRESS_MAP.keys():
+        state_info = STATE_ADDRESS_MAP.get(state)
+        if state_info is None:
             raise ValueError(f"Invalid state: {state}")
 
-        address, length, bits = STATE_ADDRESS_MAP[state]
+        address, length, bits = state_info
         specific_state = []
         
-        for motor_id in self.motor_ids:
+        for motor_id in self._motor_ids_list:
             # Specific state:
             if self._groupSyncReadSpecific.isAvailable(motor_id, address, length):
                 raw = self._groupSyncReadSpecific.getData(motor_id, address, length)
@@ -432,7 +858,7 @@ class U2D2Interface(BaseInterface):
     # BULK BASE OPERATIONS
     # ============================================================================
     
-    def bulk_read(self, read_params: List[Tuple[int, int, int]]) -> Dict:
+    def bulk_read(self, read_params: List[Tuple[int, int, int]]) -> Dict[Tuple[int, int], bytes]:
         """
         Perform bulk read operation for multiple motors.
         
@@ -440,96 +866,99 @@ class U2D2Interface(BaseInterface):
             read_params: List of tuples (motor_id, address, length)
         
         Returns:
-            Dict with keys (motor_id, address) and byte values
+            Dict with keys (motor_id, address) and the read bytes
+        """
+        return {key: bytes(data) for key, data in self.bulk_read_views(read_params).items()}
+    
+    def bulk_read_views(self, read_params: List[Tuple[int, int, int]]) -> Dict[Tuple[int, int], memoryview]:
         """
-        # Create new bulk read handler
-        groupBulkRead = GroupBulkRead(self._portHandler, self._packetHandler)
+        Bulk read without copying: results are memoryview slices of one shared buffer.
         
-        # Add parameters for bulk read
-        for motor_id, address, length in read_params:
-            dxl_addparam_result = groupBulkRead.addParam(motor_id, address, length)
-            if not dxl_addparam_result:
-                self._log(f"❌ [ID:{motor_id}] groupBulkRead addParam failed")
-                return {}
-
-        # Perform bulk read
-        dxl_comm_result = groupBulkRead.txRxPacket()
-        if dxl_comm_result != COMM_SUCCESS:
-            self._log(f"❌ Bulk read error: {self._packetHandler.getTxRxResult(dxl_comm_result)}")
+        The buffer is reused by the next bulk_read_views call, so the slices are only
+        valid until then. Use bulk_read for results that must be kept.
+        
+        Args:
+            read_params: List of tuples (motor_id, address, length)
+        
+        Returns:
+            Dict with keys (motor_id, address) and memoryview slices of the read bytes
+        """
+        groupBulkRead = self._bulk_read_group(read_params)
+        if groupBulkRead is None:
             return {}
         
-        # Extract results
+        # Copy the raw bytes of every entry into one buffer (works for any length,
+        # unlike getData which only decodes 1, 2 or 4 bytes). Values are never
+        # decoded to ints and re-encoded here; callers decode each field once.
+        total_length = sum(length for _, _, length in read_params)
+        if len(self._bulk_read_buffer) < total_length:
+            self._bulk_read_buffer = bytearray(total_length)
+        buffer = self._bulk_read_buffer
+        view = memoryview(buffer)
+        
         results = {}
+        offset = 0
         for motor_id, address, length in read_params:
+            end = offset + length
             if groupBulkRead.isAvailable(motor_id, address, length):
-                data = groupBulkRead.getData(motor_id, address, length)
-                # Convert to bytes
-                if length == 2:
-                    results[(motor_id, address)] = struct.pack('<H', data)
-                elif length == 4:
-                    results[(motor_id, address)] = struct.pack('<I', data)
-                else:
-                    results[(motor_id, address)] = data.to_bytes(length, 'little')
+                buffer[offset:end] = groupBulkRead.data_dict[motor_id][0]  # readRx returns exactly length bytes
             else:
-                results[(motor_id, address)] = b'\x00' * length
-        
-        # Clear bulk read
-        groupBulkRead.clearParam()
+                # Zero-fill so callers decode 0, but don't let the failure pass silently
+                self._log("⚠️ [ID:%s] No bulk read data at address %s, returning zeros", motor_id, address)
+                buffer[offset:end] = bytes(length)
+            results[(motor_id, address)] = view[offset:end]
+            offset = end
         
         return results
     
-    def bulk_write(self, write_params: List[Tuple[int, int, bytes]]):
+    def bulk_write(self, write_params: Union[List[Tuple[int, int, bytes]], Tuple[np.ndarray, int, np.ndarray]]):
         """
         Perform bulk write operation for multiple motors.
         
         Args:
-            write_params: List of tuples (motor_id, address, data_bytes)
+            write_params: List of tuples (motor_id, address, data_bytes), or a single
+                tuple (motor_ids, address, data_block) where data_block is a C-contiguous
+                uint8 array of shape (N, length) and row i is the payload for motor_ids[i]
         """
+        write_params = self._bulk_write_entries(write_params)
         if not write_params:
             return
         
-        # Create new bulk write handler
-        groupBulkWrite = GroupBulkWrite(self._portHandler, self._packetHandler)
+        # Reuse the bulk write handler
+        groupBulkWrite = self._groupBulkWrite
+        groupBulkWrite.clearParam()
         
-        # Add parameters for bulk write
+        # Add parameters for bulk write. The SDK only iterates the payload when
+        # building the packet, so bytes and memoryview rows are passed as-is.
         for motor_id, address, data_bytes in write_params:
-            # Convert bytes to integer array for SDK
-            data_array = list(data_bytes)
-            dxl_addparam_result = groupBulkWrite.addParam(motor_id, address, len(data_bytes), data_array)
+            dxl_addparam_result = groupBulkWrite.addParam(motor_id, address, len(data_bytes), data_bytes)
             if not dxl_addparam_result:
-                self._log(f"❌ [ID:{motor_id}] groupBulkWrite addParam failed")
+                self._log("❌ [ID:%s] groupBulkWrite addParam failed", motor_id)
                 return
         
         # Perform bulk write
         dxl_comm_result = groupBulkWrite.txPacket()
-        if dxl_comm_result != COMM_SUCCESS:
-            self._log(f"❌ Bulk write error: {self._packetHandler.getTxRxResult(dxl_comm_result)}")
-            return
-
-        # Clear bulk write
-        groupBulkWrite.clearParam()
+        self._comm_ok(dxl_comm_result, "❌ Bulk write error")
     
     # ============================================================================
     # BULK HIGH-LEVEL OPERATIONS
     # ============================================================================
     
-    def bulk_write_positions(self, motor_ids: List[int], positions: List[int]):
+    def bulk_write_positions(self, motor_ids: List[int], positions: Union[List[int], np.ndarray]):
         """
         Bulk write position commands to multiple motors.
         
+        An integer array is copied into the packet by numpy without creating a
+        Python int per motor.
+        
         Args:
             motor_ids: List of motor IDs
-            positions: List of position values (must match motor_ids length)
+            positions: List or integer array of position values (must match motor_ids length)
         """
         if len(motor_ids) != len(positions):
             raise ValueError("motor_ids and positions must have the same length")
         
-        write_params = []
-        for motor_id, position in zip(motor_ids, positions):
-            position_bytes = struct.pack('<I', int(position))
-            write_params.append((motor_id, ADDR_GOAL_POSITION, position_bytes))
-        
-        self.bulk_write(write_params)
+        self._sync_write_values(ADDR_GOAL_POSITION, LEN_GOAL_POSITION, motor_ids, positions)
     
     def bulk_write_currents(self, motor_ids: List[int], currents: List[int]):
         """
@@ -542,100 +971,204 @@ class U2D2Interface(BaseInterface):
         if len(motor_ids) != len(currents):
             raise ValueError("motor_ids and currents must have the same length")
         
-        write_params = []
-        for motor_id, current in zip(motor_ids, currents):
-            # Convert signed value to unsigned 16-bit for current register
-            current_value = self._to_unsigned_16bit(int(current))
-            current_bytes = struct.pack('<H', current_value)
-            write_params.append((motor_id, ADDR_GOAL_CURRENT, current_bytes))
-        
-        self.bulk_write(write_params)
+        self._sync_write_values(ADDR_GOAL_CURRENT, LEN_GOAL_CURRENT, motor_ids, currents)
     
-    def bulk_read_positions(self, motor_ids: List[int]) -> Dict[int, int]:
+    def bulk_read_states(self, motor_ids: List[int]) -> Dict[int, Dict[str, int]]:
         """
-        Bulk read positions from multiple motors.
+        Bulk read all states (position, velocity, current) from multiple motors.
+        
+        Present Current (126), Present Velocity (128) and Present Position (132)
+        are contiguous, so this issues a single read of ADDR_ALL_STATES,
+        LEN_ALL_STATES per motor instead of one transaction per field. Every motor
+        reads the same range, so on Protocol 2.0 it is sent as one cached Sync Read.
         
         Args:
             motor_ids: List of motor IDs to read
             
         Returns:
-            Dict mapping motor_id to position value
+            Dict mapping motor_id to state dict with 'position', 'velocity', 'current'
         """
-        read_params = [(motor_id, ADDR_PRESENT_POSITION, LEN_PRESENT_POSITION) for motor_id in motor_ids]
-        results = self.bulk_read(read_params)
-        
-        positions = {}
-        for motor_id in motor_ids:
-            data = results.get((motor_id, ADDR_PRESENT_POSITION), b'\x00\x00\x00\x00')
-            positions[motor_id] = self._parse_position(data)
+        records = self._bulk_read_state_records(motor_ids)
+        positions = records['position'].tolist()
+        velocities = records['velocity'].tolist()
+        currents = records['current'].tolist()
+        
+        return {
+            motor_id: {'position': position, 'velocity': velocity, 'current': current}
+            for motor_id, position, velocity, current in zip(motor_ids, positions, velocities, currents)
+        }
+    
+    def _bulk_read_state_records(self, motor_ids: List[int]) -> np.ndarray:
+        """
+        Read the LEN_ALL_STATES block of every motor into a STATE_DTYPE record per motor.
         
-        return positions
+        Motors that did not answer decode to all zeros.
+        """
+        if self.protocol_version == 2.0:
+            group = self._sync_read_group(ADDR_ALL_STATES, LEN_ALL_STATES, motor_ids)
+            data_dict = group.data_dict if group is not None else {}
+            blocks = [data_dict.get(motor_id, ZERO_STATE_BLOCK) for motor_id in motor_ids]
+            return np.frombuffer(bytes(itertools.chain.from_iterable(blocks)), dtype=STATE_DTYPE)
+        
+        # Sync Read is Protocol 2.0 only
+        return np.frombuffer(self._bulk_read_raw(motor_ids, ADDR_ALL_STATES, LEN_ALL_STATES), dtype=STATE_DTYPE)
+    
+    # ============================================================================
+    # PIPELINED WRITES
+    # ============================================================================
     
-    def bulk_read_velocities(self, motor_ids: List[int]) -> Dict[int, int]:
+    def enqueue_write(self, motor_id: int, address: int, data: bytes):
         """
-        Bulk read velocities from multiple motors.
+        Queue a register write without touching the bus.
         
         Args:
-            motor_ids: List of motor IDs to read
-            
-        Returns:
-            Dict mapping motor_id to velocity value
+            motor_id: Motor ID
+            address: Control table start address
+            data: Little-endian bytes to write
+        """
+        self._write_queue.append((motor_id, address, bytes(data)))
+    
+    def flush(self) -> Dict[int, bool]:
         """
-        read_params = [(motor_id, ADDR_PRESENT_VELOCITY, LEN_PRESENT_VELOCITY) for motor_id in motor_ids]
-        results = self.bulk_read(read_params)
+        Send all queued writes in as few packets as possible and clear the queue.
         
-        velocities = {}
-        for motor_id in motor_ids:
-            data = results.get((motor_id, ADDR_PRESENT_VELOCITY), b'\x00\x00\x00\x00')
-            velocities[motor_id] = self._parse_velocity(data)
+        Writes to the same motor are merged into contiguous register spans (later
+        writes win on overlap). Each round sends one span per motor in a single
+        bulk write, so a motor with N disjoint spans costs N packets in total rather
+        than one per write. A flush holding a single span uses an acknowledged write.
         
-        return velocities
-    
-    def bulk_read_currents(self, motor_ids: List[int]) -> Dict[int, int]:
+        Returns:
+            Dictionary mapping motor_id to success status
         """
-        Bulk read currents from multiple motors.
+        queue, self._write_queue = self._write_queue, []
+        if not queue:
+            return {}
         
-        Args:
-            motor_ids: List of motor IDs to read
+        spans = self._coalesce_writes(queue)
+        results = {motor_id: True for motor_id in spans}
+        
+        num_rounds = max(len(motor_spans) for motor_spans in spans.values())
+        for round_idx in range(num_rounds):
+            round_params = [
+                (motor_id, *motor_spans[round_idx])
+                for motor_id, motor_spans in spans.items()
+                if round_idx < len(motor_spans)
+            ]
             
-        Returns:
-            Dict mapping motor_id to current value
+            # The SDK copies payloads by slicing/iterating them, so span bytes are passed as-is
+            if len(round_params) == 1:
+                motor_id, address, data = round_params[0]
+                dxl_comm_result, dxl_error = self._packetHandler.writeTxRx(
+                    self._portHandler, motor_id, address, len(data), data
+                )
+                if not self._comm_ok(dxl_comm_result, "❌ Flush write error (%s)", motor_id):
+                    results[motor_id] = False
+                continue
+            
+            groupBulkWrite = self._groupBulkWrite
+            groupBulkWrite.clearParam()
+            for motor_id, address, data in round_params:
+                groupBulkWrite.addParam(motor_id, address, len(data), data)
+            
+            dxl_comm_result = groupBulkWrite.txPacket()
+            if not self._comm_ok(dxl_comm_result, "❌ Flush bulk write error"):
+                for motor_id, _, _ in round_params:
+                    results[motor_id] = False
+        
+        self._verbose_log("✅ Flushed %s queued writes in %s packet(s)", len(queue), num_rounds)
+        return results
+    
+    @contextlib.contextmanager
+    def batch(self):
+        """
+        Defer the sync writes issued inside the block and send them in one port write.
+        
+        The Sync Write instruction has no status packet, so the deferred packets
+        can go out back to back: one USB transfer (and one latency timer window)
+        carries all of them instead of one each. Covers sync_write_positions,
+        sync_write_currents and bulk_write_positions/currents; other bus calls
+        inside the block are sent immediately, ahead of the deferred writes.
+        Nested blocks join the outer one. If the block raises, nothing is sent.
         """
-        read_params = [(motor_id, ADDR_PRESENT_CURRENT, LEN_PRESENT_CURRENT) for motor_id in motor_ids]
-        results = self.bulk_read(read_params)
+        if self._tx_batch is not None:
+            yield
+            return
         
-        currents = {}
-        for motor_id in motor_ids:
-            data = results.get((motor_id, ADDR_PRESENT_CURRENT), b'\x00\x00')
-            currents[motor_id] = self._parse_current(data)
+        self._tx_batch = bytearray()
+        try:
+            yield
+            self._send_tx_batch()
+        finally:
+            self._tx_batch = None
+    
+    def _send_tx_batch(self):
+        """Write the packets deferred by batch() to the port and empty the batch."""
+        packets = self._tx_batch
+        if not packets:
+            return
+        
+        port = self._portHandler
+        if port.is_using:
+            self._comm_ok(COMM_PORT_BUSY, "❌ Batched sync write error")
+            raise RuntimeError(f"Batched sync write error: {COMM_PORT_BUSY}")
         
-        return currents
+        port.is_using = True
+        try:
+            port.clearPort()
+            written = port.writePort(packets)
+        finally:
+            port.is_using = False
+        
+        if written != len(packets):
+            self._comm_ok(COMM_TX_FAIL, "❌ Batched sync write error")
+            raise RuntimeError(f"Batched sync write error: {COMM_TX_FAIL}")
+        self._verbose_log("✅ Sent %s batched bytes in one port write", len(packets))
+        packets.clear()
     
-    def bulk_read_states(self, motor_ids: List[int]) -> Dict[int, Dict[str, int]]:
+    def _coalesce_writes(self, queue: List[Tuple[int, int, bytes]]) -> Dict[int, List[Tuple[int, bytes]]]:
+        """Merge queued writes into per-motor lists of contiguous (address, data) spans."""
+        registers: Dict[int, Dict[int, int]] = {}
+        for motor_id, address, data in queue:
+            motor_registers = registers.setdefault(motor_id, {})
+            for offset, byte in enumerate(data):
+                motor_registers[address + offset] = byte
+        
+        spans = {}
+        for motor_id, motor_registers in registers.items():
+            motor_spans = []
+            start = None
+            span = bytearray()
+            for address in sorted(motor_registers):
+                if start is not None and address != start + len(span):
+                    motor_spans.append((start, bytes(span)))
+                    start = None
+                    span = bytearray()
+                if start is None:
+                    start = address
+                span.append(motor_registers[address])
+            motor_spans.append((start, bytes(span)))
+            spans[motor_id] = motor_spans
+        
+        return spans
+    
+    # ============================================================================
+    # ASYNC OPERATIONS
+    # ============================================================================
+    
+    async def submit_bulk_read(self, read_params: List[Tuple[int, int, int]]) -> ReadHandle:
         """
-        Bulk read all states (position, velocity, current) from multiple motors.
-        Optimized to use a single bulk read operation.
+        Start a bulk read on the I/O thread and return without waiting for it.
+        
+        The caller can compute while the packet is on the wire and await the handle
+        afterwards. Avoid blocking calls on the same interface until it resolves.
         
         Args:
-            motor_ids: List of motor IDs to read
-            
+            read_params: List of tuples (motor_id, address, length)
+        
         Returns:
-            Dict mapping motor_id to state dict with 'position', 'velocity', 'current'
+            ReadHandle resolving to a dict with keys (motor_id, address) and byte values
         """
-        # Bulk read cannot handle more than 4 bytes at a time, so we need to read each state separately
-        positions = self.bulk_read_positions(motor_ids)
-        velocities = self.bulk_read_velocities(motor_ids)
-        currents = self.bulk_read_currents(motor_ids)
-        
-        states = {}
-        for motor_id in motor_ids:
-            states[motor_id] = {
-                'position': positions[motor_id],
-                'velocity': velocities[motor_id],
-                'current': currents[motor_id]
-            }
-        
-        return states
+        return ReadHandle(self._run_in_io_thread(self.bulk_read, read_params))
     
     # ============================================================================
     # BULK UTILS
@@ -643,23 +1176,29 @@ class U2D2Interface(BaseInterface):
     
     def _parse_2byte_signed(self, data: bytes) -> int:
         """Parse 2-byte signed data with two's complement handling."""
-        if len(data) >= 2:
-            value = struct.unpack('<H', data[:2])[0]
-            # Handle two's complement for signed 16-bit
-            if value > 32767:
-                value -= 65536
-            return value
-        return 0
+        try:
+            return STRUCT_INT16.unpack_from(data, 0)[0]
+        except struct.error:  # Short or missing data
+            return 0
     
     def _parse_4byte_signed(self, data: bytes) -> int:
         """Parse 4-byte signed data with two's complement handling."""
-        if len(data) >= 4:
-            value = struct.unpack('<I', data[:4])[0]
-            # Handle two's complement for signed 32-bit
-            if value > 2147483647:
-                value -= 4294967296
-            return value
-        return 0
+        try:
+            return STRUCT_INT32.unpack_from(data, 0)[0]
+        except struct.error:  # Short or missing data
+            return 0
+    
+    def _parse_pvc(self, buf: bytes) -> Tuple[int, int, int]:
+        """
+        Parse a LEN_ALL_STATES block read from ADDR_ALL_STATES.
+        
+        Layout is current (int16), velocity (int32), position (int32), little-endian.
+        
+        Returns:
+            Tuple of (position, velocity, current)
+        """
+        current, velocity, position = STRUCT_STATE.unpack_from(buf, 0)
+        return position, velocity, current
     
     def _parse_position(self, data: bytes) -> int:
         """Parse 4-byte position data."""
@@ -673,52 +1212,226 @@ class U2D2Interface(BaseInterface):
         """Parse 2-byte current data."""
         return self._parse_2byte_signed(data)
     
+    # ============================================================================
+    # NUMPY STATE READS
+    # ============================================================================
+    
+    def sync_read_state_np(self, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Sync read the full state of all configured motors into an int32 array.
+        
+        Args:
+            out: Optional preallocated int32 array of shape (3, N) to fill in place
+            
+        Returns:
+            Array of shape (3, N) with rows (positions, velocities, currents),
+            columns aligned to self.motor_ids
+        """
+        if self._groupSyncRead is None:
+            raise RuntimeError("Sync read not configured. Initialize with motor_ids.")
+        
+        out = self._state_buffer(out, (3, len(self.motor_ids)))
+        
+        dxl_comm_result = self._groupSyncRead.txRxPacket()
+        if not self._comm_ok(dxl_comm_result, "❌ Sync read state error"):
+            raise RuntimeError(f"Sync read state error: {dxl_comm_result}")
+        
+        return self._unpack_sync_state_np(out)
+    
+    def _unpack_sync_state_np(self, out: np.ndarray) -> np.ndarray:
+        """Decode the last sync read into out (3, N) as rows (positions, velocities, currents)."""
+        states = self._sync_state_records()
+        
+        out[0] = states['position']
+        out[1] = states['velocity']
+        out[2] = states['current']
+        return out
+    
+    def submit_sync_read_state(self):
+        """
+        Send the full-state sync read of all configured motors without waiting for the replies.
+        
+        The status packets queue up in the OS receive buffer while the caller
+        computes, and reap_sync_read_state() then decodes them without waiting
+        for the bus. The port stays busy until the reap, so no other bus call
+        may be made in between.
+        """
+        if self._groupSyncRead is None:
+            raise RuntimeError("Sync read not configured. Initialize with motor_ids.")
+        
+        dxl_comm_result = self._groupSyncRead.txPacket()
+        if not self._comm_ok(dxl_comm_result, "❌ Sync read state submit error"):
+            raise RuntimeError(f"Sync read state submit error: {dxl_comm_result}")
+    
+    def reap_sync_read_state(self, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Receive the sync read sent by submit_sync_read_state().
+        
+        Args:
+            out: Optional preallocated int32 array of shape (3, N) to fill in place
+            
+        Returns:
+            Array of shape (3, N) with rows (positions, velocities, currents),
+            columns aligned to self.motor_ids
+        """
+        if self._groupSyncRead is None:
+            raise RuntimeError("Sync read not configured. Initialize with motor_ids.")
+        
+        out = self._state_buffer(out, (3, len(self.motor_ids)))
+        
+        dxl_comm_result = self._groupSyncRead.rxPacket()
+        if not self._comm_ok(dxl_comm_result, "❌ Sync read state reap error"):
+            raise RuntimeError(f"Sync read state reap error: {dxl_comm_result}")
+        
+        return self._unpack_sync_state_np(out)
+    
+    def control_loop_tick(self, goals: np.ndarray, previous_state: np.ndarray) -> bool:
+        """
+        Write goal positions and read the full state in one fused step.
+        
+        The goal sync write is sent first; while its bytes drain on the bus the
+        previous tick's sync read is decoded into previous_state, then the next
+        sync read is issued. previous_state therefore holds the state read at the
+        end of the previous tick, i.e. one tick old and from before these goals
+        were applied. On the first tick there is no previous read, so it is
+        filled from this tick's read and False is returned.
+        
+        Args:
+            goals: Goal positions aligned to self.motor_ids (int32 array)
+            previous_state: Preallocated int32 array of shape (3, N) receiving (positions, velocities, currents)
+        
+        Returns:
+            True if previous_state was read before these goals were sent
+        """
+        if self._groupSyncRead is None:
+            raise RuntimeError("Sync read not configured. Initialize with motor_ids.")
+        
+        previous_state = self._state_buffer(previous_state, (3, len(self.motor_ids)))
+        
+        self.sync_write_positions(goals)
+        
+        have_previous = self._groupSyncRead.last_result
+        if have_previous:
+            self._unpack_sync_state_np(previous_state)
+        
+        dxl_comm_result = self._groupSyncRead.txRxPacket()
+        if not self._comm_ok(dxl_comm_result, "❌ Sync read state error"):
+            raise RuntimeError(f"Sync read state error: {dxl_comm_result}")
+        
+        if not have_previous:
+            self._unpack_sync_state_np(previous_state)
+        return have_previous
+    
+    def bulk_read_positions_np(self, motor_ids: List[int], out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Bulk read positions from multiple motors into an int32 array.
+        
+        Args:
+            motor_ids: List of motor IDs to read
+            out: Optional preallocated int32 array of shape (N,) to fill in place
+            
+        Returns:
+            Array of shape (N,) with positions aligned to motor_ids
+        """
+        out = self._state_buffer(out, (len(motor_ids),))
+        
+        if self.protocol_version == 2.0:
+            out[:] = self._sync_read_signed_np(ADDR_PRESENT_POSITION, LEN_PRESENT_POSITION, motor_ids)
+            return out
+        
+        # Sync Read is Protocol 2.0 only
+        raw = self._bulk_read_raw(motor_ids, ADDR_PRESENT_POSITION, LEN_PRESENT_POSITION)
+        out[:] = np.frombuffer(raw, dtype=SIGNED_DTYPES[LEN_PRESENT_POSITION])
+        return out
+    
+    def bulk_read_states_soa(self, motor_ids: List[int]) -> Dict[str, np.ndarray]:
+        """
+        Bulk read all states from multiple motors as one array per field.
+        
+        Uses the same single contiguous read as bulk_read_states, decoded by one
+        np.frombuffer, so control laws can work on whole arrays. The arrays are
+        strided views into one record buffer; copy them to keep them contiguous.
+        
+        Args:
+            motor_ids: List of motor IDs to read
+            
+        Returns:
+            Dict with 'position' (int32), 'velocity' (int32) and 'current' (int16)
+            arrays of shape (N,), aligned to motor_ids (0 for motors that did not answer)
+        """
+        records = self._bulk_read_state_records(motor_ids)
+        return {field: records[field] for field in STATE_DTYPE.names}
+    
+    def compile_bulk_read_positions(self, motor_ids: List[int]) -> Callable[[], np.ndarray]:
+        """
+        Return a zero-argument reader of the positions of a fixed set of motors.
+        
+        The Sync Read group, its data dict and the motor list are bound into the
+        returned closure, so a call is one txRxPacket plus one np.frombuffer,
+        with no cache lookups or read parameter tuples. Motors are 0 if the read
+        failed.
+        
+        Args:
+            motor_ids: List of motor IDs to read
+            
+        Returns:
+            Function returning an int32 array of shape (N,) aligned to motor_ids
+        """
+        motor_ids = [int(motor_id) for motor_id in motor_ids]
+        if self.protocol_version != 2.0 or not motor_ids:  # Sync Read is Protocol 2.0 only
+            return super().compile_bulk_read_positions(motor_ids)
+        
+        group = self._get_group_sync_reader(ADDR_PRESENT_POSITION, LEN_PRESENT_POSITION, tuple(motor_ids))
+        data = group.data_dict
+        tx_rx = group.txRxPacket
+        dtype = SIGNED_DTYPES[LEN_PRESENT_POSITION]
+        chain = itertools.chain.from_iterable
+        num_motors = len(motor_ids)
+        
+        def read_positions() -> np.ndarray:
+            dxl_comm_result = tx_rx()
+            if not self._comm_ok(dxl_comm_result, "❌ Sync read error"):
+                return np.zeros(num_motors, dtype=dtype)
+            return np.frombuffer(bytes(chain([data[motor_id] for motor_id in motor_ids])), dtype=dtype)
+        
+        return read_positions
+    
     # ============================================================================
     # INDIVIDUAL MOTOR OPERATIONS
     # ============================================================================
     
     def set_goal_position(self, motor_id: int, goal: int):
         """Set goal position for a single motor."""
-        dxl_comm_result, dxl_error = self._packetHandler.write4ByteTxRx(
-            self._portHandler, motor_id, ADDR_GOAL_POSITION, goal
-        )
-        if dxl_comm_result != COMM_SUCCESS:
-            self._log(f"❌ Command Position Error ({motor_id}): {self._packetHandler.getTxRxResult(dxl_comm_result)}")
+        dxl_comm_result, dxl_error = self._write_register(motor_id, ADDR_GOAL_POSITION, STRUCT_INT32, goal)
+        self._comm_ok(dxl_comm_result, "❌ Command Position Error (%s)", motor_id)
     
     def set_goal_current(self, motor_id: int, current: int):
         """Set the goal current for a single motor."""
-        dxl_comm_result, dxl_error = self._packetHandler.write2ByteTxRx(
-            self._portHandler, motor_id, ADDR_GOAL_CURRENT, int(current)
-        )
-        if dxl_comm_result != COMM_SUCCESS:
-            self._log(f"❌ Failed to set goal current for motor {motor_id}")
+        dxl_comm_result, dxl_error = self._write_register(motor_id, ADDR_GOAL_CURRENT, STRUCT_INT16, int(current))
+        self._comm_ok(dxl_comm_result, "❌ Failed to set goal current for motor %s", motor_id)
     
     def set_velocity_limit(self, motor_id: int, velocity_limit: int):
         """Set the profile velocity limit for a single motor."""
         dxl_comm_result, dxl_error = self._packetHandler.write4ByteTxRx(
             self._portHandler, motor_id, ADDR_PROFILE_VELOCITY, velocity_limit
         )
-        if dxl_comm_result != COMM_SUCCESS:
-            self._log(f"❌ Set Velocity Limit Error ({motor_id}): {self._packetHandler.getTxRxResult(dxl_comm_result)}")
+        self._comm_ok(dxl_comm_result, "❌ Set Velocity Limit Error (%s)", motor_id)
     
     def set_current_limit(self, motor_id: int, limit_mA: int):
         """Set the current limit for a single motor."""
         dxl_comm_result, dxl_error = self._packetHandler.write2ByteTxRx(
             self._portHandler, motor_id, ADDR_CURRENT_LIMIT, limit_mA
         )
-        if dxl_comm_result != COMM_SUCCESS:
-            self._log(f"❌ Failed to set current limit for motor {motor_id}")
-        else:
-            self._verbose_log(f"✅ Set current limit {limit_mA}LSB for motor {motor_id}")
+        if self._comm_ok(dxl_comm_result, "❌ Failed to set current limit for motor %s", motor_id):
+            self._verbose_log("✅ Set current limit %sLSB for motor %s", limit_mA, motor_id)
     
     def get_position(self, motor_id: int) -> int:
         """Return the current position of a motor."""
         dxl_present_position, dxl_comm_result, dxl_error = self._packetHandler.read4ByteTxRx(
             self._portHandler, motor_id, ADDR_PRESENT_POSITION
         )
-        if dxl_comm_result != COMM_SUCCESS:
-            self._log(f"❌ Get Position Error ({motor_id}): {self._packetHandler.getTxRxResult(dxl_comm_result)}")
-        return dxl_present_position
+        self._comm_ok(dxl_comm_result, "❌ Get Position Error (%s)", motor_id)
+        return self._to_signed(dxl_present_position, 8 * LEN_PRESENT_POSITION)
     
     def get_velocity(self, motor_id: int) -> int:
         """Return the current velocity of the motor."""
@@ -726,15 +1439,10 @@ class U2D2Interface(BaseInterface):
             self._portHandler, motor_id, ADDR_PRESENT_VELOCITY
         )
         
-        if dxl_comm_result != COMM_SUCCESS:
-            self._log(f"❌ Get Velocity Error ({motor_id}): {self._packetHandler.getTxRxResult(dxl_comm_result)}")
+        if not self._comm_ok(dxl_comm_result, "❌ Get Velocity Error (%s)", motor_id):
             return 0
         
-        # Handle two's complement for negative velocity values
-        if dxl_present_velocity > 2147483647:
-            dxl_present_velocity -= 4294967296
-        
-        return dxl_present_velocity
+        return self._to_signed(dxl_present_velocity, 8 * LEN_PRESENT_VELOCITY)
     
     def get_current(self, motor_id: int) -> int:
         """Return the present current (signed, in control-table LSB)."""
@@ -742,21 +1450,18 @@ class U2D2Interface(BaseInterface):
             self._portHandler, motor_id, ADDR_PRESENT_CURRENT
         )
         
-        if dxl_comm_result != COMM_SUCCESS:
-            self._log(f"❌ Get Current Error ({motor_id}): {self._packetHandler.getTxRxResult(dxl_comm_result)}")
+        if not self._comm_ok(dxl_comm_result, "❌ Get Current Error (%s)", motor_id):
             return 0
         
         if dxl_error != 0:
-            self._log(f"❌ Error in motor {motor_id}: {self._packetHandler.getRxPacketError(dxl_error)}")
+            self._log("❌ Error in motor %s: %s", motor_id, self._packetHandler.getRxPacketError(dxl_error))
             return 0
         
-        # Handle two's complement for negative current values
-        if dxl_present_current > 32767:
-            dxl_present_current -= 65536
+        dxl_present_current = self._to_signed(dxl_present_current, 8 * LEN_PRESENT_CURRENT)
         
         # Check for saturation
         if dxl_present_current == 0xFFFF:
-            self._log(f"⚠️ Current saturation detected on motor {motor_id}")
+            self._log("⚠️ Current saturation detected on motor %s", motor_id)
             return 0
         
         return dxl_present_current
@@ -767,85 +1472,152 @@ class U2D2Interface(BaseInterface):
     
     SCAN_BAUDRATES = SCAN_BAUDRATES
     BAUDRATE_MAP = BAUDRATE_MAP
+    BAUDRATE_SET = frozenset(BAUDRATE_MAP)
 
-    def scan_motors_at_baudrate(self, baudrate: int, scan_range: range = range(0, 253)) -> List[int]:
+    def scan_motors_at_baudrate(self, baudrate: int, scan_range: Optional[range] = None) -> List[int]:
         """
         Scan for motors at a specific baud rate.
         
         Args:
             baudrate: Baud rate to scan at
-            scan_range: Range of motor IDs to scan (default: 0-252)
+            scan_range: Range of motor IDs to scan (default: all IDs 0-252)
             
         Returns:
             List of detected motor IDs
+        
+        Port errors propagate to the caller; the original baud rate is restored either way.
         """
-        self._verbose_log(f"🔄 Scanning at baudrate {baudrate}...")
+        self._verbose_log("🔄 Scanning at baudrate %s...", baudrate)
         
+        original_baud = self._portHandler.getBaudRate()
         try:
-            # Store current baud rate
-            original_baud = self._portHandler.getBaudRate()
-            
             # Temporarily change to scan baud rate
             if not self._portHandler.setBaudRate(baudrate):
-                self._log(f"❌ Failed to set baudrate to {baudrate}")
+                self._log("❌ Failed to set baudrate to %s", baudrate)
                 return []
             
-            detected = []
+            # One broadcast ping collects every motor's status packet in a single transaction
+            ping_results, dxl_comm_result = self._packetHandler.broadcastPing(self._portHandler)
             
-            for motor_id in scan_range:
-                try:
-                    # Use ping to detect motor
-                    dxl_model_number, dxl_comm_result, dxl_error = self._packetHandler.ping(
-                        self._portHandler, motor_id
-                    )
-                    if dxl_comm_result == COMM_SUCCESS:
-                        self._verbose_log(f"✅ Found motor ID {motor_id} (Model: {dxl_model_number})")
-                        detected.append(motor_id)
-                except Exception as e:
-                    self._log(f"❌ Error scanning ID {motor_id}: {e}")
-                    continue
+            if dxl_comm_result == COMM_SUCCESS:
+                if scan_range is None:
+                    detected = sorted(ping_results)
+                else:
+                    detected = sorted(motor_id for motor_id in ping_results if motor_id in scan_range)
+                for motor_id in detected:
+                    self._verbose_log("✅ Found motor ID %s (Model: %s)", motor_id, ping_results[motor_id][0])
+                return detected
             
-            # Restore original baud rate
-            self._portHandler.setBaudRate(original_baud)
-            return detected
+            if dxl_comm_result == COMM_RX_TIMEOUT:
+                # Nobody answered at this baud rate
+                return []
             
+            # Broadcast ping unsupported (Protocol 1.0) or responses collided: ping each ID
+            self._verbose_log("⚠️ Broadcast ping failed (%s), pinging IDs individually", self._comm_result_text(dxl_comm_result))
+            return self._ping_each(DEFAULT_SCAN_IDS if scan_range is None else scan_range)
+        
+        finally:
+            # Restore original baud rate
+            self._restore_baudrate(original_baud)
+    
+    def _restore_baudrate(self, baudrate: int):
+        """Switch the port back to baudrate after a temporary change, logging instead of raising."""
+        try:
+            self._portHandler.setBaudRate(baudrate)
         except Exception as e:
-            self._log(f"❌ Failed to scan at baudrate {baudrate}: {e}")
-            
-            # Try to restore original baud rate on error
-            try:
-                self._portHandler.setBaudRate(original_baud)
-            except:
-                pass
-            return []
+            self._log("❌ Failed to restore baudrate %s: %s", baudrate, e)
+    
+    def _ping_each(self, scan_range: Iterable[int]) -> List[int]:
+        """Ping every ID in scan_range one by one and return the IDs that answered."""
+        detected = []
+        
+        for motor_id in scan_range:
+            dxl_model_number, dxl_comm_result, dxl_error = self._packetHandler.ping(
+                self._portHandler, motor_id
+            )
+            if dxl_comm_result == COMM_SUCCESS:
+                self._verbose_log("✅ Found motor ID %s (Model: %s)", motor_id, dxl_model_number)
+                detected.append(motor_id)
+        
+        return detected
     
-    def scan_all_baudrates(self, scan_range: range = range(0, 253)) -> Dict[int, int]:
+    def scan_all_baudrates(self, scan_range: Optional[range] = None, extra_ports: Optional[List[str]] = None) -> Dict[int, int]:
         """
         Scan for motors at all possible baud rates.
         
+        A single adapter can only scan one baud rate at a time. On rigs with
+        several adapters, pass the other ports as extra_ports: each is opened
+        with its own interface and scanned on a worker thread while this port
+        is scanned, so the wall-clock time is that of the slowest port.
+        
         Args:
-            scan_range: Range of motor IDs to scan (default: 0-252)
+            scan_range: Range of motor IDs to scan (default: all IDs 0-252)
+            extra_ports: Other adapters' serial ports to scan concurrently (default: none)
             
         Returns:
-            Dictionary mapping motor_id to baudrate
+            Dictionary mapping motor_id to baudrate, merged over all ports
+            (an ID found on several ports keeps the first port's baud rate)
         """
         self._verbose_log("🔍 Scanning for motors at all baud rates...")
         
+        if extra_ports:
+            with ThreadPoolExecutor(max_workers=len(extra_ports), thread_name_prefix="dynamixel_scan") as executor:
+                futures = [executor.submit(self._scan_port, port, scan_range) for port in extra_ports]
+                detected_motors = self._scan_baudrates(scan_range)
+                for port, future in zip(extra_ports, futures):
+                    for motor_id, baudrate in future.result().items():
+                        if motor_id in detected_motors:
+                            self._log("⚠️ Motor ID %s found on %s as well, keeping the first match", motor_id, port)
+                            continue
+                        detected_motors[motor_id] = baudrate
+        else:
+            detected_motors = self._scan_baudrates(scan_range)
+        
+        self._verbose_log("📊 Scan complete: Found %s motors total", len(detected_motors))
+        for motor_id, baud in detected_motors.items():
+            self._verbose_log("   - ID %s at %s baud", motor_id, baud)
+        
+        return detected_motors
+    
+    def _scan_baudrates(self, scan_range: Optional[range]) -> Dict[int, int]:
+        """
+        Scan this port at every baud rate in SCAN_BAUDRATES.
+        
+        An ID found at one baud rate is left out of the later ones, so a
+        per-ID ping fallback does not ping it again, and the sweep stops once
+        every ID in scan_range has been found.
+        """
         detected_motors = {}
+        remaining = set(DEFAULT_SCAN_IDS if scan_range is None else scan_range)
         
         for baudrate in SCAN_BAUDRATES:
-            detected = self.scan_motors_at_baudrate(baudrate, scan_range)
+            if not remaining:
+                break
+            detected = self.scan_motors_at_baudrate(baudrate, sorted(remaining))
             if detected:
-                self._verbose_log(f"Found {len(detected)} motors at {baudrate} baud")
+                self._verbose_log("Found %s motors at %s baud on %s", len(detected), baudrate, self.usb_port)
             for motor_id in detected:
                 detected_motors[motor_id] = baudrate
-        
-        self._verbose_log(f"📊 Scan complete: Found {len(detected_motors)} motors total")
-        for motor_id, baud in detected_motors.items():
-            self._verbose_log(f"   - ID {motor_id} at {baud} baud")
+            remaining.difference_update(detected)
         
         return detected_motors
     
+    def _scan_port(self, usb_port: str, scan_range: Optional[range]) -> Dict[int, int]:
+        """Open usb_port with its own interface, scan it at every baud rate and close it."""
+        try:
+            interface = U2D2Interface(
+                usb_port, self.baudrate, protocol_version=self.protocol_version,
+                verbose=self.verbose, latency_timer_ms=self.latency_timer_ms,
+            )
+        except Exception as e:
+            self._log("❌ Failed to open %s for scanning: %s", usb_port, e)
+            return {}
+        
+        try:
+            return interface._scan_baudrates(scan_range)
+        finally:
+            interface.close()
+    
     def change_motor_baudrate(self, motor_id: int, current_baud: int, new_baud: int) -> bool:
         """
         Change baud rate of a specific motor.
@@ -858,48 +1630,18 @@ class U2D2Interface(BaseInterface):
         Returns:
             True if successful, False otherwise
         """
-        if new_baud not in BAUDRATE_MAP:
-            self._log(f"❌ Invalid baud rate: {new_baud}. Valid rates: {list(BAUDRATE_MAP.keys())}")
-            return False
-        
-        try:
-            # Store current baud rate
-            original_baud = self._portHandler.getBaudRate()
-            
-            # Temporarily change to current motor baud rate
-            if not self._portHandler.setBaudRate(current_baud):
-                self._log(f"❌ Failed to set baud rate to {current_baud}")
-                return False
-            
-            # Change motor baud rate
-            baudrate_code = BAUDRATE_MAP[new_baud]
-            dxl_comm_result, dxl_error = self._packetHandler.write1ByteTxRx(
-                self._portHandler, motor_id, ADDR_BAUD_RATE, baudrate_code
-            )
-            
-            # Restore original baud rate
-            self._portHandler.setBaudRate(original_baud)
-            
-            if dxl_comm_result == COMM_SUCCESS:
-                self._verbose_log(f"✅ Motor ID {motor_id}: {current_baud} → {new_baud} baud")
-                return True
-            else:
-                self._log(f"❌ Failed to change baud rate for ID {motor_id}: {self._packetHandler.getTxRxResult(dxl_comm_result)}")
-                return False
-                
-        except Exception as e:
-            self._log(f"❌ Error changing baud rate for ID {motor_id}: {e}")
-            # Try to restore original baud rate on error
-            try:
-                self._portHandler.setBaudRate(original_baud)
-            except:
-                pass
-            return False
+        return self.change_motors_baudrate({motor_id: current_baud}, new_baud)[motor_id]
     
     def change_motors_baudrate(self, motor_baud_map: Dict[int, int], new_baud: int) -> Dict[int, bool]:
         """
         Change baud rate for multiple motors.
         
+        Motors are grouped by their current baud rate, so the port is switched
+        once per distinct baud rate and restored once at the end rather than
+        twice per motor. Each group is changed with one sync write. Sync writes
+        are not acknowledged, so every motor written is then looked for at
+        new_baud, and only the ones that answer count as changed.
+        
         Args:
             motor_baud_map: Dictionary mapping motor_id to current baud rate
             new_baud: New baud rate to set
@@ -908,19 +1650,51 @@ class U2D2Interface(BaseInterface):
             Dictionary mapping motor_id to success status
         """
         if not motor_baud_map:
-            self._log(f"❌ No motor IDs provided")
+            self._log("❌ No motor IDs provided")
             return {}
         
         results = {}
-        
+        groups = defaultdict(list)
         for motor_id, current_baud in motor_baud_map.items():
             if current_baud == new_baud:
-                self._verbose_log(f"⏭️  Motor ID {motor_id} already at {new_baud} baud, skipping")
+                self._verbose_log("⏭️  Motor ID %s already at %s baud, skipping", motor_id, new_baud)
                 results[motor_id] = True
-                continue
-            
-            success = self.change_motor_baudrate(motor_id, current_baud, new_baud)
-            results[motor_id] = success
+            else:
+                groups[current_baud].append(motor_id)
+        
+        if not groups:
+            return results
+        
+        baudrate_code = BAUDRATE_MAP.get(new_baud)
+        if baudrate_code is None:
+            self._log("❌ Invalid baud rate: %s. Valid rates: %s", new_baud, list(BAUDRATE_MAP.keys()))
+            results.update(dict.fromkeys(itertools.chain.from_iterable(groups.values()), False))
+            return results
+        
+        sent_ids = []
+        original_baud = self._portHandler.getBaudRate()
+        try:
+            for current_baud, motor_ids in groups.items():
+                if not self._set_port_baudrate(current_baud):
+                    results.update(dict.fromkeys(motor_ids, False))
+                    continue
+                
+                if self._sync_write_values(ADDR_BAUD_RATE, 1, motor_ids, baudrate_code, UNSIGNED_DTYPES[1]):
+                    sent_ids.extend(motor_ids)
+                else:
+                    results.update(dict.fromkeys(motor_ids, False))
+        finally:
+            self._restore_baudrate(original_baud)
+        
+        if sent_ids:
+            # Confirm the change: the motors must now answer at new_baud
+            answered = set(self.scan_motors_at_baudrate(new_baud, sent_ids))
+            for motor_id in sent_ids:
+                results[motor_id] = motor_id in answered
+                if results[motor_id]:
+                    self._verbose_log("✅ Motor ID %s: %s → %s baud", motor_id, motor_baud_map[motor_id], new_baud)
+                else:
+                    self._log("❌ Motor ID %s did not answer at %s baud after the change", motor_id, new_baud)
         
         return results
     
@@ -937,41 +1711,10 @@ class U2D2Interface(BaseInterface):
             True if successful, False otherwise
         """
         if new_id < 0 or new_id > 252:
-            self._log(f"❌ Invalid new ID: {new_id}. Must be 0-252")
+            self._log("❌ Invalid new ID: %s. Must be 0-252", new_id)
             return False
         
-        try:
-            # Store current baud rate
-            original_baud = self._portHandler.getBaudRate()
-            
-            # Temporarily change to specified baud rate
-            if not self._portHandler.setBaudRate(baudrate):
-                self._log(f"❌ Failed to set baud rate to {baudrate}")
-                return False
-            
-            # Change motor ID
-            dxl_comm_result, dxl_error = self._packetHandler.write1ByteTxRx(
-                self._portHandler, current_id, ADDR_ID, new_id
-            )
-            
-            # Restore original baud rate
-            self._portHandler.setBaudRate(original_baud)
-            
-            if dxl_comm_result == COMM_SUCCESS:
-                self._verbose_log(f"✅ Motor ID {current_id} → {new_id}")
-                return True
-            else:
-                self._log(f"❌ Failed to change ID {current_id} → {new_id}: {self._packetHandler.getTxRxResult(dxl_comm_result)}")
-                return False
-                
-        except Exception as e:
-            self._log(f"❌ Error changing ID {current_id} → {new_id}: {e}")
-            # Try to restore original baud rate on error
-            try:
-                self._portHandler.setBaudRate(original_baud)
-            except:
-                pass
-            return False
+        return self._change_ids({current_id: new_id}, baudrate)[current_id]
     
     def change_motors_id(self, id_mapping: Dict[int, int], baudrate: int) -> Dict[int, bool]:
         """
@@ -985,40 +1728,74 @@ class U2D2Interface(BaseInterface):
             Dictionary mapping current_id to success status
         """
         if not id_mapping:
-            self._log(f"❌ No motor ID mappings provided")
-            return {}
-        
-        # Validate all new IDs
-        invalid_ids = [new_id for new_id in id_mapping.values() if new_id < 0 or new_id > 252]
-        if invalid_ids:
-            self._log(f"❌ Invalid new IDs: {invalid_ids}. Must be 0-252")
+            self._log("❌ No motor ID mappings provided")
             return {}
         
-        # Check for duplicate new IDs
-        new_ids = list(id_mapping.values())
-        if len(new_ids) != len(set(new_ids)):
-            self._log(f"❌ Duplicate new IDs found. Each motor must have a unique ID.")
+        if not self._validate_id_mapping(id_mapping):
             return {}
         
         results = {}
-        
+        pending = {}
         for current_id, new_id in id_mapping.items():
             if current_id == new_id:
-                self._verbose_log(f"⏭️  Motor ID {current_id} already at {new_id}, skipping")
+                self._verbose_log("⏭️  Motor ID %s already at %s, skipping", current_id, new_id)
                 results[current_id] = True
-                continue
-            
-            success = self.change_motor_id(current_id, new_id, baudrate)
-            results[current_id] = success
+            else:
+                pending[current_id] = new_id
         
+        if pending:
+            results.update(self._change_ids(pending, baudrate))
         return results
     
+    def _change_ids(self, id_mapping: Dict[int, int], baudrate: int) -> Dict[int, bool]:
+        """Write every ID in id_mapping with the port switched to baudrate once for the whole batch."""
+        original_baud = self._portHandler.getBaudRate()
+        try:
+            if not self._set_port_baudrate(baudrate):
+                return dict.fromkeys(id_mapping, False)
+            
+            results = {}
+            for current_id, new_id in id_mapping.items():
+                results[current_id] = self._write_byte_register(
+                    current_id, ADDR_ID, new_id,
+                    "ID %s → %s" % (current_id, new_id),
+                )
+                if results[current_id]:
+                    self._verbose_log("✅ Motor ID %s → %s", current_id, new_id)
+            return results
+        finally:
+            self._restore_baudrate(original_baud)
+    
+    def _set_port_baudrate(self, baudrate: int) -> bool:
+        """Switch the port to baudrate, logging and returning False if it fails."""
+        try:
+            if self._portHandler.setBaudRate(baudrate):
+                return True
+        except Exception as e:
+            self._log("❌ Failed to set baud rate to %s: %s", baudrate, e)
+            return False
+        self._log("❌ Failed to set baud rate to %s", baudrate)
+        return False
+    
+    def _write_byte_register(self, motor_id: int, address: int, value: int, what: str) -> bool:
+        """write1ByteTxRx value to one motor at the port's current baud rate, logging failures as 'change <what>'."""
+        try:
+            dxl_comm_result, dxl_error = self._packetHandler.write1ByteTxRx(
+                self._portHandler, motor_id, address, value
+            )
+        except Exception as e:
+            self._log("❌ Error changing %s: %s", what, e)
+            return False
+        return self._comm_ok(dxl_comm_result, "❌ Failed to change %s", what)
+    
     # ============================================================================
     # PORT MANAGEMENT
     # ============================================================================
     
     def close(self):
         """Close the serial port."""
+        self.stop_background_polling()
+        self._shutdown_io_executor()
         self._portHandler.closePort()
         self._verbose_log("✅ Port closed.")
     
@@ -1026,20 +1803,282 @@ class U2D2Interface(BaseInterface):
     # UTILS
     # ============================================================================
     
+    def _bulk_read_signed(self, motor_ids: List[int], address: int, length: int) -> Dict[int, int]:
+        """
+        Read one signed register from every motor with a single Sync Read.
+        
+        All motors read the same range, so Sync Read (1 byte per motor in the
+        instruction packet) replaces Bulk Read (5 bytes per motor).
+        """
+        if self.protocol_version != 2.0:  # Sync Read is Protocol 2.0 only
+            raw = self._bulk_read_raw(motor_ids, address, length)
+            return dict(zip(motor_ids, np.frombuffer(raw, dtype=SIGNED_DTYPES[length]).tolist()))
+        
+        return dict(zip(motor_ids, self._sync_read_signed_np(address, length, motor_ids).tolist()))
+    
+    def _bulk_read_group(self, read_params: List[Tuple[int, int, int]]) -> Optional[GroupBulkRead]:
+        """
+        Bulk read read_params with the reused GroupBulkRead.
+        
+        The parameters stay registered between calls and are only cleared and
+        re-added when read_params differs from the previous call.
+        
+        Returns:
+            The group holding the read data, or None if the read failed
+        """
+        group = self._groupBulkRead
+        read_params = tuple(read_params)
+        if read_params != self._groupBulkReadParams:
+            group.clearParam()
+            self._groupBulkReadParams = ()
+            for motor_id, address, length in read_params:
+                if not group.addParam(motor_id, address, length):
+                    self._log("❌ [ID:%s] groupBulkRead addParam failed", motor_id)
+                    group.clearParam()
+                    return None
+            self._groupBulkReadParams = read_params
+        
+        if not self._comm_ok(group.txRxPacket(), "❌ Bulk read error"):
+            return None
+        return group
+    
+    def _bulk_read_raw(self, motor_ids: List[int], address: int, length: int) -> bytes:
+        """
+        Bulk read one register range from every motor into a flat buffer aligned to motor_ids.
+        
+        The bytes are gathered straight from the group's data dict, without the
+        intermediate (motor_id, address) dict built by bulk_read_views. Motors whose
+        read failed are zero-filled.
+        """
+        if not motor_ids:
+            return b''
+        
+        group = self._bulk_read_group(self._read_params(motor_ids, address, length))
+        if group is None:
+            return bytes(len(motor_ids) * length)
+        
+        data = group.data_dict
+        missing = bytes(length)
+        blocks = []
+        for motor_id in motor_ids:
+            if group.isAvailable(motor_id, address, length):
+                blocks.append(data[motor_id][0])  # readRx returns exactly length bytes
+            else:
+                self._log("⚠️ [ID:%s] No bulk read data at address %s, returning zeros", motor_id, address)
+                blocks.append(missing)
+        return bytes(itertools.chain.from_iterable(blocks))
+    
+    def _sync_read_signed_np(self, address: int, length: int, motor_ids: List[int]) -> np.ndarray:
+        """
+        Sync read one signed register from every motor into an array aligned to motor_ids.
+        
+        All motors' bytes are flattened into one buffer and decoded by a single
+        np.frombuffer with a signed dtype, instead of decoding each motor in Python.
+        Motors are 0 if the read failed.
+        """
+        dtype = SIGNED_DTYPES[length]
+        group = self._sync_read_group(address, length, motor_ids)
+        if group is None:
+            return np.zeros(len(motor_ids), dtype=dtype)
+        
+        data = group.data_dict
+        return np.frombuffer(bytes(itertools.chain.from_iterable([data[motor_id] for motor_id in motor_ids])), dtype=dtype)
+    
+    def _sync_read_group(self, address: int, length: int, motor_ids: List[int]) -> Optional[GroupSyncRead]:
+        """
+        Sync read address/length from motor_ids with a cached group.
+        
+        Returns:
+            The group holding the read data, or None if the read failed
+        """
+        if not motor_ids:
+            return None
+        
+        group = self._get_group_sync_reader(address, length, tuple(motor_ids))
+        dxl_comm_result = group.txRxPacket()
+        if not self._comm_ok(dxl_comm_result, "❌ Sync read error"):
+            return None
+        return group
+    
+    def _sync_write_values(self, address: int, length: int, motor_ids: List[int], values, data_dtype: Optional[np.dtype] = None) -> bool:
+        """
+        Sync write one value (or data_dtype record) per motor to address/length with a cached, pre-packed group.
+        
+        Returns:
+            True if the packet was sent (a sync write has no status packets to confirm it)
+        """
+        if not len(motor_ids):
+            return True
+        
+        group, param_view = self._get_group_sync_writer(address, length, tuple(motor_ids), data_dtype)
+        param_view['data'] = values
+        
+        dxl_comm_result = self._sync_write_tx(group)
+        return self._comm_ok(dxl_comm_result, "❌ Sync write error")
+    
+    def _sync_write_changed(self, address: int, length: int, motor_ids: List[int], values: List[int], data_dtype: Optional[np.dtype] = None):
+        """
+        Sync write values only to the motors whose register differs from them.
+        
+        The current values are sync read first; if that read fails (or on
+        Protocol 1.0, which has no Sync Read) every motor is written. data_dtype
+        is used both to decode the current values and to write the new ones
+        (default: little-endian signed, length bytes).
+        """
+        if data_dtype is None:
+            data_dtype = SIGNED_DTYPES[length]
+        
+        group = self._sync_read_group(address, length, motor_ids) if self.protocol_version == 2.0 else None
+        if group is not None:
+            data = group.data_dict
+            current = np.frombuffer(bytes(itertools.chain.from_iterable([data[motor_id] for motor_id in motor_ids])), dtype=data_dtype)
+            changed = current != np.asarray(values)
+            if not changed.any():
+                self._verbose_log("⏭️  Address %s already set on all motors, skipping write", address)
+                return
+            motor_ids = [motor_id for motor_id, is_changed in zip(motor_ids, changed) if is_changed]
+            values = [value for value, is_changed in zip(values, changed) if is_changed]
+        
+        self._sync_write_values(address, length, motor_ids, values, data_dtype)
+    
+    def _sync_write_tx(self, group: GroupSyncWrite) -> int:
+        """
+        Send a primed sync writer's packet straight to the port.
+        
+        Replaces GroupSyncWrite.txPacket, which copies the parameters into a
+        Python list, stuffs and checksums it, and converts it back to bytes on
+        every call. Here only the CRC of the prebuilt packet is refreshed. Inside
+        batch() the packet is appended to the batch instead of sent. Packets
+        that would need byte stuffing, or writers without a prebuilt packet
+        (Protocol 1.0), go through the SDK.
+        
+        Returns:
+            The SDK communication result
+        """
+        param = group.param
+        packet = param.obj if isinstance(param, memoryview) else None
+        crc_offset = len(packet) - LEN_CRC if packet is not None else 0
+        if packet is None or packet.find(STUFFING_PATTERN, PKT_LENGTH_L, crc_offset) != -1:
+            if self._tx_batch:
+                self._send_tx_batch()  # Keep the deferred packets ahead of this one
+            return group.txPacket()
+        
+        STRUCT_UINT16.pack_into(packet, crc_offset, self._crc16(memoryview(packet)[:crc_offset]))
+        
+        if self._tx_batch is not None:
+            self._tx_batch += packet
+            return COMM_SUCCESS
+        
+        port = self._portHandler
+        if port.is_using:
+            return COMM_PORT_BUSY
+        
+        port.is_using = True
+        try:
+            port.clearPort()
+            written = port.writePort(packet)
+        finally:
+            port.is_using = False
+        return COMM_SUCCESS if written == len(packet) else COMM_TX_FAIL
+    
+    def _write_register(self, motor_id: int, address: int, codec: struct.Struct, value: int) -> Tuple[int, int]:
+        """
+        Write one register of a single motor and wait for its status, like PacketHandler.writeTxRx.
+        
+        On Protocol 2.0 the Write packet of each (motor_id, address) is built once;
+        a call only packs value into it, refreshes the CRC and sends it, then
+        reads the status through the SDK. Packets that would need byte stuffing,
+        and Protocol 1.0, go through PacketHandler.writeTxRx.
+        
+        Returns:
+            Tuple of (communication result, motor error)
+        """
+        if self.protocol_version != 2.0:
+            return self._packetHandler.writeTxRx(self._portHandler, motor_id, address, codec.size, codec.pack(value))
+        
+        packet = self._write_packets.get((motor_id, address))
+        if packet is None:
+            packet = bytearray(WRITE_HEADER.size + codec.size + LEN_CRC)
+            WRITE_HEADER.pack_into(packet, 0, SYNC_WRITE_PREFIX, motor_id, codec.size + 5, INST_WRITE, address)
+            self._write_packets[(motor_id, address)] = packet
+        
+        codec.pack_into(packet, WRITE_HEADER.size, value)
+        crc_offset = len(packet) - LEN_CRC
+        if packet.find(STUFFING_PATTERN, PKT_LENGTH_L, crc_offset) != -1:
+            return self._packetHandler.writeTxRx(
+                self._portHandler, motor_id, address, codec.size, bytes(packet[WRITE_HEADER.size:crc_offset])
+            )
+        STRUCT_UINT16.pack_into(packet, crc_offset, self._crc16(memoryview(packet)[:crc_offset]))
+        
+        port = self._portHandler
+        if port.is_using:
+            return COMM_PORT_BUSY, 0
+        
+        port.is_using = True
+        port.clearPort()
+        if port.writePort(packet) != len(packet):
+            port.is_using = False
+            return COMM_TX_FAIL, 0
+        if motor_id == BROADCAST_ID:  # No status packet
+            port.is_using = False
+            return COMM_SUCCESS, 0
+        
+        # rxPacket releases the port once it returns
+        port.setPacketTimeout(LEN_WRITE_STATUS)
+        while True:
+            rxpacket, dxl_comm_result = self._packetHandler.rxPacket(port, *RX_PACKET_ARGS)
+            if dxl_comm_result != COMM_SUCCESS or rxpacket[PKT_ID] == motor_id:
+                break
+        
+        if dxl_comm_result != COMM_SUCCESS:
+            return dxl_comm_result, 0
+        return dxl_comm_result, rxpacket[PKT_ERROR]
+    
     def _to_signed(self, raw: int, bits: int) -> int:
-        """Convert an unsigned integer to a signed integer."""
+        """Convert an unsigned integer to a signed integer (two's complement, no branch)."""
         sign_bit = 1 << (bits - 1)
-        return raw - (1 << bits) if raw & sign_bit else raw
+        return (raw ^ sign_bit) - sign_bit
     
-    def _to_unsigned_16bit(self, signed_value: int) -> int:
-        """Convert a signed integer to unsigned 16-bit for writing to 16-bit registers."""
-        return (1 << 16) + signed_value if signed_value < 0 else signed_value
 
-    def _log(self, msg: str):
-        """Log a message."""
-        print(f"[U2D2Interface] {msg}")
+    def _crc16(self, buf: bytes, crc: int = 0) -> int:
+        """
+        Compute the Protocol 2.0 CRC-16 of buf, continuing from crc.
+        
+        With numba installed the CRC runs in the compiled _crc16_kernel over a
+        zero-copy uint8 view of buf; otherwise the pure-Python version is used.
+        """
+        if _crc16_kernel_jit is None:
+            return super()._crc16(buf, crc)
+        return _crc16_kernel_jit(np.frombuffer(buf, dtype=np.uint8), crc, _crc16_table_np())
+    
+    def _update_crc(self, crc_accum: int, data_blk_ptr: List[int], data_blk_size: int) -> int:
+        """Drop-in replacement for the SDK's PacketHandler.updateCRC, backed by _crc16."""
+        return self._crc16(bytes(data_blk_ptr[:data_blk_size]), crc_accum)
+
+    def _comm_ok(self, dxl_comm_result: int, msg: str, *args) -> bool:
+        """
+        Return True if dxl_comm_result is COMM_SUCCESS, otherwise log the failure.
+        
+        msg and args are logged with the SDK's description of the result appended,
+        so callers only need "if not self._comm_ok(...)" around their error handling.
+        """
+        if dxl_comm_result == COMM_SUCCESS:
+            return True
+        self._log(msg + ": %s", *args, self._comm_result_text(dxl_comm_result))
+        return False
+    
+    def _comm_result_text(self, dxl_comm_result: int) -> str:
+        """PacketHandler.getTxRxResult, memoized per result code."""
+        text = self._comm_result_texts.get(dxl_comm_result)
+        if text is None:
+            text = self._comm_result_texts[dxl_comm_result] = self._packetHandler.getTxRxResult(dxl_comm_result)
+        return text
+    
+    def _log(self, msg: str, *args):
+        """Log a message. Arguments are %-formatted lazily by the logger."""
+        logger.warning(msg, *args)
     
-    def _verbose_log(self, msg: str):
+    def _verbose_log(self, msg: str, *args):
         """Log a message if verbose is True."""
         if self.verbose:
-            self._log(msg)
\ No newline at end of file
+            logger.info(msg, *args)
\ No newline at end of file
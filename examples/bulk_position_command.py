@@ -13,6 +13,8 @@ import os
 import time
 from pathlib import Path
 
+import numpy as np
+
 # Add the parent directory to the path to import dynamixel_u2d2
 sys.path.append(str(Path(__file__).parent.parent))
 
@@ -31,48 +33,66 @@ ROTATED_POSITION = 1500  # Rotated position
 VELOCITY_LIMIT = 100
 P_GAIN = 200
 
+# Telemetry settings
+MOVE_TIME = 2.0  # Seconds to track each move (its peak speed and current are reported)
+SAMPLE_PERIOD = 0.01  # Seconds between state samples
+
 def setup_motors(u2d2):
-    """Set up motors for position control."""
+    """Set up motors for position control, one sync write per register."""
     print("🔧 Setting up motors...")
     
-    for motor_id in MOTOR_IDS:
-        print(f"\n  Motor {motor_id}: Setting up...")
-
-        # Disable torque to change operating mode
-        u2d2.disable_torque(motor_id)
-        print(f"  Torque disabled")
-        
-        # Set operating mode to position control
-        u2d2.set_motor_mode(motor_id, 'position')
-        print(f"  Set to position control mode")
-        
-        # Set velocity limit and P gain
-        u2d2.set_velocity_limit(motor_id, VELOCITY_LIMIT)
-        u2d2.set_position_p_gain(motor_id, P_GAIN)
-        
-        # Enable torque
-        u2d2.enable_torque(motor_id)
-        print(f"  Torque enabled")
+    # Disable torque to change operating mode
+    u2d2.bulk_disable_torque(MOTOR_IDS)
+    print("  Torque disabled")
+    
+    # Set operating mode to position control (an EEPROM write, skipped where already set)
+    u2d2.bulk_set_motor_mode(MOTOR_IDS, 'position', skip_unchanged=True)
+    print("  Set to position control mode")
+    
+    # Set velocity limit and P gain
+    u2d2.bulk_set_velocity_limit(MOTOR_IDS, VELOCITY_LIMIT)
+    u2d2.bulk_set_position_p_gain(MOTOR_IDS, P_GAIN)
+    
+    # Enable torque
+    u2d2.bulk_enable_torque(MOTOR_IDS)
+    print("  Torque enabled")
     
     print("\n ✅ All motors set up successfully!")
 
 def bulk_command_position(u2d2, position):
     """Command all motors to the same position using bulk write."""
-    # Create list of same position for all motors
-    positions = [position] * len(MOTOR_IDS)
+    # Same position for all motors, as an array so no Python int is built per motor
+    positions = np.full(len(MOTOR_IDS), position, dtype=np.int32)
     u2d2.bulk_write_positions(MOTOR_IDS, positions)
     print(f"Bulk commanded all motors to position {position}")
 
-def bulk_read_states(u2d2):
-    """Read and display motor states using bulk read."""
-    # Use the new bulk_read_states method
-    states = u2d2.bulk_read_states(MOTOR_IDS)
+def bulk_read_states(u2d2, duration):
+    """Sample motor states with bulk read every SAMPLE_PERIOD for duration seconds, then display the last sample and the peaks of the move."""
+    period_ns = int(SAMPLE_PERIOD * 1e9)
+    next_sample = time.monotonic_ns()
+    deadline = next_sample + int(duration * 1e9)
+    samples = 0
+    peak_velocity = dict.fromkeys(MOTOR_IDS, 0)
+    peak_current = dict.fromkeys(MOTOR_IDS, 0)
+    while next_sample < deadline:
+        delay_ns = next_sample - time.monotonic_ns()
+        if delay_ns > 0:
+            time.sleep(delay_ns / 1e9)
+        states = u2d2.bulk_read_states(MOTOR_IDS)
+        samples += 1
+        for motor_id, state in states.items():
+            peak_velocity[motor_id] = max(peak_velocity[motor_id], abs(state['velocity']))
+            peak_current[motor_id] = max(peak_current[motor_id], abs(state['current']))
+        # Advance from the schedule, not from now, so read time does not add drift
+        next_sample += period_ns
     
-    # Display results
-    print("Motor States (Bulk Read):")
+    # Display results, built as one block and printed once instead of once per motor
+    lines = [f"Motor States (Bulk Read, {samples} samples over {duration:.1f}s):"]
     for motor_id in MOTOR_IDS:
         state = states[motor_id]
-        print(f"  Motor {motor_id}: Pos={state['position']:4d}, Vel={state['velocity']:4d}, Curr={state['current']:4d}")
+        lines.append(f"  Motor {motor_id}: Pos={state['position']:4d}, Vel={state['velocity']:4d}, Curr={state['current']:4d}"
+                     f" (peak |Vel|={peak_velocity[motor_id]:4d}, peak |Curr|={peak_current[motor_id]:4d})")
+    print("\n".join(lines))
 
 def main():
     """Main function."""
@@ -87,40 +107,36 @@ def main():
         print(f"❌ USB port {USB_PORT} not found!")
         return 1
     
-    # Initialize U2D2 interface
-    u2d2 = U2D2Interface(USB_PORT, BAUDRATE, verbose=True)
-    
-    try:
-        # Set up motors
-        setup_motors(u2d2)
-        
-        # Main loop
-        cycle = 0
-        while True:
-            cycle += 1
-            print(f"\nCycle {cycle}")
-            
-            # Move to neutral position using bulk operations
-            bulk_command_position(u2d2, NEUTRAL_POSITION)
-            time.sleep(2.0)
-            bulk_read_states(u2d2)
+    # Initialize U2D2 interface; the port is closed when the block exits
+    with U2D2Interface(USB_PORT, BAUDRATE, verbose=True) as u2d2:
+        try:
+            # Set up motors
+            setup_motors(u2d2)
             
-            # Move to rotated position using bulk operations
-            bulk_command_position(u2d2, ROTATED_POSITION)
-            time.sleep(2.0)
-            bulk_read_states(u2d2)
-            
-    except KeyboardInterrupt:
-        print("\n🛑 Stopping...")
-    except Exception as e:
-        print(f"❌ Error: {e}")
-    finally:
-        # Cleanup
-        print("🧹 Disabling torque...")
-        for motor_id in MOTOR_IDS:
-            u2d2.disable_torque(motor_id)
-        u2d2.close()
-        print("✅ Done!")
+            # Main loop
+            cycle = 0
+            while True:
+                cycle += 1
+                print(f"\nCycle {cycle}")
+                
+                # Move to neutral position using bulk operations
+                bulk_command_position(u2d2, NEUTRAL_POSITION)
+                bulk_read_states(u2d2, MOVE_TIME)
+                
+                # Move to rotated position using bulk operations
+                bulk_command_position(u2d2, ROTATED_POSITION)
+                bulk_read_states(u2d2, MOVE_TIME)
+                
+        except KeyboardInterrupt:
+            print("\n🛑 Stopping...")
+        except Exception as e:
+            print(f"❌ Error: {e}")
+        finally:
+            # Cleanup
+            print("🧹 Disabling torque...")
+            u2d2.bulk_disable_torque(MOTOR_IDS)
+    
+    print("✅ Done!")
 
 if __name__ == "__main__":
     main()
@@ -32,28 +32,29 @@ ROTATED_POSITION = 1500  # Rotated position
 VELOCITY_LIMIT = 100
 P_GAIN = 200
 
+# Telemetry settings
+MOVE_TIME = 2.0  # Seconds to track each move (its peak speed and current are reported)
+SAMPLE_PERIOD = 0.01  # Seconds between state samples
+
 def setup_motors(u2d2):
-    """Set up motors for position control."""
+    """Set up motors for position control, one sync write per register."""
     print("🔧 Setting up motors...")
     
-    for motor_id in MOTOR_IDS:
-        print(f"\n  Motor {motor_id}: Setting up...")
-
-        # Disable torque to change operating mode
-        u2d2.disable_torque(motor_id)
-        print(f"  Torque disabled")
-        
-        # Set operating mode to position control
-        u2d2.set_motor_mode(motor_id, 'position')
-        print(f"  Set to position control mode")
-        
-        # Set velocity limit and P gain
-        u2d2.set_velocity_limit(motor_id, VELOCITY_LIMIT)
-        u2d2.set_position_p_gain(motor_id, P_GAIN)
-        
-        # Enable torque
-        u2d2.enable_torque(motor_id)
-        print(f"  Torque enabled")
+    # Disable torque to change operating mode
+    u2d2.bulk_disable_torque(MOTOR_IDS)
+    print("  Torque disabled")
+    
+    # Set operating mode to position control (an EEPROM write, skipped where already set)
+    u2d2.bulk_set_motor_mode(MOTOR_IDS, 'position', skip_unchanged=True)
+    print("  Set to position control mode")
+    
+    # Set velocity limit and P gain
+    u2d2.bulk_set_velocity_limit(MOTOR_IDS, VELOCITY_LIMIT)
+    u2d2.bulk_set_position_p_gain(MOTOR_IDS, P_GAIN)
+    
+    # Enable torque
+    u2d2.bulk_enable_torque(MOTOR_IDS)
+    print("  Torque enabled")
     
     print("\n ✅ All motors set up successfully!")
 
@@ -62,15 +63,31 @@ def sync_command_positions(u2d2, positions):
     u2d2.sync_write_positions(positions)
     print(f"Sync commanded motors to positions: {positions}")
 
-def sync_read_states(u2d2):
-    """Read and display motor states using sync read operations."""
-    # Use the new sync_read_state method for maximum efficiency
-    positions, velocities, currents = u2d2.sync_read_state()
+def sync_read_states(u2d2, duration):
+    """Sample motor states with sync read every SAMPLE_PERIOD for duration seconds, then display the last sample and the peaks of the move."""
+    period_ns = int(SAMPLE_PERIOD * 1e9)
+    next_sample = time.monotonic_ns()
+    deadline = next_sample + int(duration * 1e9)
+    samples = 0
+    peak_velocities = [0] * len(MOTOR_IDS)
+    peak_currents = [0] * len(MOTOR_IDS)
+    while next_sample < deadline:
+        delay_ns = next_sample - time.monotonic_ns()
+        if delay_ns > 0:
+            time.sleep(delay_ns / 1e9)
+        positions, velocities, currents = u2d2.sync_read_state()
+        samples += 1
+        peak_velocities = [max(peak, abs(velocity)) for peak, velocity in zip(peak_velocities, velocities)]
+        peak_currents = [max(peak, abs(current)) for peak, current in zip(peak_currents, currents)]
+        # Advance from the schedule, not from now, so read time does not add drift
+        next_sample += period_ns
     
-    # Display results
-    print("Motor States (Sync Read):")
+    # Display results, built as one block and printed once instead of once per motor
+    lines = [f"Motor States (Sync Read, {samples} samples over {duration:.1f}s):"]
     for i, motor_id in enumerate(MOTOR_IDS):
-        print(f"  Motor {motor_id}: Pos={positions[i]:4d}, Vel={velocities[i]:4d}, Curr={currents[i]:4d}")
+        lines.append(f"  Motor {motor_id}: Pos={positions[i]:4d}, Vel={velocities[i]:4d}, Curr={currents[i]:4d}"
+                     f" (peak |Vel|={peak_velocities[i]:4d}, peak |Curr|={peak_currents[i]:4d})")
+    print("\n".join(lines))
 
 def sync_read_specific_states(u2d2, state_type):
     """Read specific state using sync read operations."""
@@ -80,9 +97,10 @@ def sync_read_specific_states(u2d2, state_type):
     # Read the specific state
     values = u2d2.sync_read_specific(state_type)
     
-    print(f"Motor {state_type.title()} (Sync Read):")
+    lines = [f"Motor {state_type.title()} (Sync Read):"]
     for i, motor_id in enumerate(MOTOR_IDS):
-        print(f"  Motor {motor_id}: {state_type.title()}={values[i]:4d}")
+        lines.append(f"  Motor {motor_id}: {state_type.title()}={values[i]:4d}")
+    print("\n".join(lines))
 
 def main():
     """Main function."""
@@ -97,48 +115,44 @@ def main():
         print(f"❌ USB port {USB_PORT} not found!")
         return 1
     
-    # Initialize U2D2 interface with motor_ids for sync operations
-    u2d2 = U2D2Interface(USB_PORT, BAUDRATE, motor_ids=MOTOR_IDS, verbose=True)
-    
-    try:
-        # Set up motors
-        setup_motors(u2d2)
-        
-        # Main loop
-        cycle = 0
-        while True:
-            cycle += 1
-            print(f"\nCycle {cycle}")
-            
-            # Move to neutral position using sync operations
-            positions = [NEUTRAL_POSITION] * len(MOTOR_IDS)
-            sync_command_positions(u2d2, positions)
-            time.sleep(2.0)
-            sync_read_states(u2d2)
-            
-            # Demonstrate specific state reading
-            print("\nReading specific states:")
-            sync_read_specific_states(u2d2, 'position')
-            sync_read_specific_states(u2d2, 'velocity')
-            sync_read_specific_states(u2d2, 'current')
+    # Initialize U2D2 interface with motor_ids for sync operations; the port is closed when the block exits
+    with U2D2Interface(USB_PORT, BAUDRATE, motor_ids=MOTOR_IDS, verbose=True) as u2d2:
+        try:
+            # Set up motors
+            setup_motors(u2d2)
             
-            # Move to rotated position using sync operations
-            positions = [ROTATED_POSITION] * len(MOTOR_IDS)
-            sync_command_positions(u2d2, positions)
-            time.sleep(2.0)
-            sync_read_states(u2d2)
-            
-    except KeyboardInterrupt:
-        print("\n🛑 Stopping...")
-    except Exception as e:
-        print(f"❌ Error: {e}")
-    finally:
-        # Cleanup
-        print("🧹 Disabling torque...")
-        for motor_id in MOTOR_IDS:
-            u2d2.disable_torque(motor_id)
-        u2d2.close()
-        print("✅ Done!")
+            # Main loop
+            cycle = 0
+            while True:
+                cycle += 1
+                print(f"\nCycle {cycle}")
+                
+                # Move to neutral position using sync operations
+                positions = [NEUTRAL_POSITION] * len(MOTOR_IDS)
+                sync_command_positions(u2d2, positions)
+                sync_read_states(u2d2, MOVE_TIME)
+                
+                # Demonstrate specific state reading
+                print("\nReading specific states:")
+                sync_read_specific_states(u2d2, 'position')
+                sync_read_specific_states(u2d2, 'velocity')
+                sync_read_specific_states(u2d2, 'current')
+                
+                # Move to rotated position using sync operations
+                positions = [ROTATED_POSITION] * len(MOTOR_IDS)
+                sync_command_positions(u2d2, positions)
+                sync_read_states(u2d2, MOVE_TIME)
+                
+        except KeyboardInterrupt:
+            print("\n🛑 Stopping...")
+        except Exception as e:
+            print(f"❌ Error: {e}")
+        finally:
+            # Cleanup
+            print("🧹 Disabling torque...")
+            u2d2.bulk_disable_torque(MOTOR_IDS)
+    
+    print("✅ Done!")
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,41 @@
+"""
+Parsing and validation of the comma-separated motor ID arguments shared by the helpers.
+"""
+
+import numpy as np
+
+from dynamixel_u2d2.base_interface import MAX_MOTOR_ID
+
+
+def parse_ids(text: str) -> np.ndarray:
+    """
+    Parse a comma-separated ID list such as "1, 2,3".
+
+    Args:
+        text: Comma-separated integers
+
+    Returns:
+        int64 array of the IDs, in order
+
+    Raises:
+        ValueError: If the list is blank or any entry is not an integer
+    """
+    if not text.strip():
+        raise ValueError("empty ID list")
+
+    tokens = text.split(",")
+    try:
+        ids = [int(token) for token in tokens]  # int() accepts surrounding whitespace
+    except ValueError:
+        raise ValueError(f"invalid ID list: {text!r}") from None
+    return np.array(ids, dtype=np.int64)
+
+
+def invalid_ids(ids: np.ndarray) -> list:
+    """Return the IDs outside 0-252, as Python ints."""
+    return ids[(ids < 0) | (ids > MAX_MOTOR_ID)].tolist()
+
+
+def has_duplicates(ids: np.ndarray) -> bool:
+    """Return True if any ID appears more than once."""
+    return np.unique(ids).size != ids.size
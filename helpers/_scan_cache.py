@@ -0,0 +1,90 @@
+"""
+On-disk cache of the last full motor scan, keyed by port.
+
+A full sweep pings every ID at every baud rate, which takes several seconds.
+The helpers store its result in ~/.cache/dynamixel_u2d2/scan.json and, on the
+next run, confirm it with one broadcast ping per cached baud rate instead.
+The baud rate motors were last changed to is kept alongside, so searches for
+known IDs try it first.
+"""
+
+import json
+import os
+import time
+from typing import Dict, Optional
+
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "dynamixel_u2d2")
+CACHE_PATH = os.path.join(CACHE_DIR, "scan.json")
+LAST_BAUD_PATH = os.path.join(CACHE_DIR, "last_baud")
+
+
+def _load_all() -> dict:
+    """Read the whole cache file, returning an empty cache if it is missing or unreadable."""
+    try:
+        with open(CACHE_PATH) as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def _save_all(cache: dict):
+    """Write the whole cache file, ignoring failures (the cache is only an optimization)."""
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(CACHE_PATH, "w") as f:
+            json.dump(cache, f, indent=2, sort_keys=True)
+    except OSError:
+        pass
+
+
+def load_scan(port: str, scan_id_range: range) -> Optional[Dict[int, int]]:
+    """
+    Return the cached {motor_id: baudrate} for port, or None if there is none.
+
+    Entries recorded for a different ID range are ignored.
+    """
+    entry = _load_all().get(port)
+    if not entry or entry.get("scan_id_range") != [scan_id_range.start, scan_id_range.stop]:
+        return None
+    try:
+        return {int(motor_id): int(baudrate) for motor_id, baudrate in entry["motors"].items()}
+    except (KeyError, AttributeError, ValueError):
+        return None
+
+
+def save_scan(port: str, scan_id_range: range, detected_motors: Dict[int, int]):
+    """Record the {motor_id: baudrate} found on port by a full sweep of scan_id_range."""
+    cache = _load_all()
+    cache[port] = {
+        "motors": {str(motor_id): baudrate for motor_id, baudrate in detected_motors.items()},
+        "scan_id_range": [scan_id_range.start, scan_id_range.stop],
+        "mtime": time.time(),
+    }
+    _save_all(cache)
+
+
+def clear_scan(port: str):
+    """Forget the cached scan for port."""
+    cache = _load_all()
+    if cache.pop(port, None) is not None:
+        _save_all(cache)
+
+
+def load_last_baud() -> Optional[int]:
+    """Return the baud rate motors were last set to, or None if unknown."""
+    try:
+        with open(LAST_BAUD_PATH) as f:
+            return int(f.read().strip())
+    except (OSError, ValueError):
+        return None
+
+
+def save_last_baud(baudrate: int):
+    """Remember baudrate so the next search tries it first."""
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(LAST_BAUD_PATH, "w") as f:
+            f.write(f"{baudrate}\n")
+    except OSError:
+        pass
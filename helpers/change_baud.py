@@ -23,8 +23,11 @@ Examples:
     # Scan specific ID range and change all found motors
     python change_baud.py --new-baud 4000000 --scan-id-range 1,10
 
-    # Change specific motors with custom scan parameters
+    # Change specific motors with custom scan parameters (only these IDs are looked for)
     python change_baud.py --new-baud 4000000 --motor-ids 1,2,3 --scan-bauds 3000000,1000000
+
+    # Ignore the cached scan and sweep every baud rate again
+    python change_baud.py --new-baud 4000000 --rescan
 """
 
 import argparse
@@ -33,10 +36,19 @@ from typing import List, Dict, Optional, Tuple
 
 # Import from the package (assumes pip install -e . was run)
 from dynamixel_u2d2.u2d2_interface import U2D2Interface
+from helpers._scan_cache import load_scan, save_scan, clear_scan, load_last_baud, save_last_baud
+
+FULL_ID_RANGE = range(0, 253)  # IDs 0-252, the default sweep
 
 
 class BaudrateManager:
-    """Manager for Dynamixel baud rate operations using U2D2Interface."""
+    """
+    Manager for Dynamixel baud rate operations using U2D2Interface.
+    
+    One interface is opened on first use and shared by the scanning and
+    changing phases. Use the manager as a context manager (or call close())
+    to release the port.
+    """
     
     def __init__(self, port: str = "/dev/ttyUSB0", verbose: bool = True):
         """
@@ -51,17 +63,48 @@ class BaudrateManager:
         self.interface = None
         self.detected_motors = {}  # {motor_id: baudrate}
     
-    def scan_all_baudrates(self, scan_bauds: List[int] = None, scan_id_range: range = None) -> Dict[int, int]:
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def get_interface(self) -> U2D2Interface:
+        """Return the shared interface, opening the port on first use."""
+        if self.interface is None:
+            self.interface = U2D2Interface(self.port, 3000000, verbose=self.verbose)
+        return self.interface
+    
+    def close(self):
+        """Close the shared interface if it was opened."""
+        if self.interface is not None:
+            self.interface.close()
+            self.interface = None
+    
+    def scan_all_baudrates(self, scan_bauds: List[int] = None, scan_id_range: range = None, use_cache: bool = True) -> Dict[int, int]:
         """
         Scan for motors at specified baud rates using U2D2Interface.
         
+        A full sweep (no scan_bauds) is cached per port. With use_cache, the
+        cache is only a hint: one broadcast ping per cached baud rate must find
+        exactly the cached IDs, otherwise every baud rate is swept again.
+        
         Args:
             scan_bauds: List of baud rates to scan (default: all available)
             scan_id_range: Range of motor IDs to scan (default: 0-252)
+            use_cache: Try the cached full sweep before scanning (default: True)
             
         Returns:
             Dictionary mapping motor_id to baudrate
         """
+        scan_id_range = scan_id_range or FULL_ID_RANGE
+        
+        if use_cache and not scan_bauds:
+            cached = self._load_verified_scan(scan_id_range)
+            if cached is not None:
+                self.detected_motors = cached
+                return self.detected_motors
+
         if self.verbose:
             if scan_bauds:
                 print(f"🔍 Scanning for motors at baud rates: {scan_bauds}")
@@ -72,21 +115,61 @@ class BaudrateManager:
                 print(f"🔍 Scanning motor IDs: {scan_id_range.start}-{scan_id_range.stop-1}")
         
         try:
-            # Create interface for scanning (will be closed after scan)
-            interface = U2D2Interface(self.port, 3000000, verbose=self.verbose)
+            interface = self.get_interface()
             
             if scan_bauds:
                 # Custom baud rate scanning
                 self.detected_motors = {}
                 for baudrate in scan_bauds:
-                    detected = interface.scan_motors_at_baudrate(baudrate, scan_id_range or range(0, 253))
+                    detected = interface.scan_motors_at_baudrate(baudrate, scan_id_range)
                     for motor_id in detected:
                         self.detected_motors[motor_id] = baudrate
             else:
                 # Use default scanning with custom ID range
-                self.detected_motors = interface.scan_all_baudrates(scan_id_range or range(0, 253))
+                self.detected_motors = interface.scan_all_baudrates(scan_id_range)
+                save_scan(self.port, scan_id_range, self.detected_motors)
+            
+            return self.detected_motors
+            
+        except Exception as e:
+            print(f"❌ Error during scanning: {e}")
+            return {}
+    
+    def find_motors(self, motor_ids: List[int], scan_bauds: List[int] = None) -> Dict[int, int]:
+        """
+        Find the baud rates of known motor IDs.
+        
+        Baud rates the cached scan recorded for motor_ids are tried first, then
+        the most recently used one, then the rest, each with one broadcast ping
+        (falling back to pinging only motor_ids). The search stops as soon as
+        every motor has been found, so a stale cache only costs extra pings.
+        
+        Args:
+            motor_ids: Motor IDs to look for
+            scan_bauds: List of baud rates to try (default: all available)
             
-            interface.close()
+        Returns:
+            Dictionary mapping motor_id to baudrate for the motors found
+        """
+        cached = load_scan(self.port, FULL_ID_RANGE) or {}
+        hinted = {cached[motor_id] for motor_id in motor_ids if motor_id in cached}
+        last_baud = load_last_baud()
+        scan_bauds = sorted(scan_bauds or U2D2Interface.SCAN_BAUDRATES,
+                            key=lambda baudrate: (baudrate not in hinted, baudrate != last_baud))
+        missing = set(motor_ids)
+        
+        if self.verbose:
+            print(f"🔍 Looking for motors {motor_ids} at baud rates: {scan_bauds}")
+        
+        try:
+            interface = self.get_interface()
+            self.detected_motors = {}
+            for baudrate in scan_bauds:
+                for motor_id in interface.scan_motors_at_baudrate(baudrate, motor_ids):
+                    self.detected_motors[motor_id] = baudrate
+                    missing.discard(motor_id)
+                if not missing:
+                    break
             
             return self.detected_motors
             
@@ -94,6 +177,38 @@ class BaudrateManager:
             print(f"❌ Error during scanning: {e}")
             return {}
     
+    def _load_verified_scan(self, scan_id_range: range) -> Optional[Dict[int, int]]:
+        """
+        Return what a broadcast ping at each cached baud rate finds, or None to rescan.
+        
+        The result is only trusted if it holds exactly the cached IDs, each at the
+        baud rate it answered. Anything else (a motor missing, moved or added) means
+        the cache is stale and it is cleared.
+        """
+        cached = load_scan(self.port, scan_id_range)
+        if not cached:
+            return None
+        
+        verified = {}
+        try:
+            interface = self.get_interface()
+            for baudrate in sorted(set(cached.values())):
+                for motor_id in interface.scan_motors_at_baudrate(baudrate, scan_id_range):
+                    verified[motor_id] = baudrate
+        except Exception as e:
+            print(f"⚠️  Could not verify cached scan - {e}")
+            return None
+        
+        if verified != cached:
+            if self.verbose:
+                print("🔄 Cached scan is stale, rescanning...")
+            clear_scan(self.port)
+            return None
+        
+        if self.verbose:
+            print(f"✅ Using cached scan for {self.port} ({len(verified)} motors)")
+        return verified
+    
     def change_motors_baudrate(self, motor_baud_map: Dict[int, int], new_baud: int) -> Dict[int, bool]:
         """
         Change baud rate for multiple motors using U2D2Interface.
@@ -110,12 +225,7 @@ class BaudrateManager:
             return {}
         
         try:
-            # Create interface for baud rate changes
-            interface = U2D2Interface(self.port, 3000000, verbose=self.verbose)
-            results = interface.change_motors_baudrate(motor_baud_map, new_baud)
-            interface.close()
-            
-            return results
+            return self.get_interface().change_motors_baudrate(motor_baud_map, new_baud)
             
         except Exception as e:
             print(f"❌ Error changing baud rates: {e}")
@@ -185,6 +295,12 @@ def main():
         help='Skip confirmation prompt (use with caution)'
     )
     
+    parser.add_argument(
+        '--rescan',
+        action='store_true',
+        help='Ignore the cached scan and sweep every baud rate again'
+    )
+    
     args = parser.parse_args()
     
     # Validate baud rates
@@ -211,7 +327,7 @@ def main():
         try:
             scan_bauds = [int(x.strip()) for x in args.scan_bauds.split(',')]
             # Validate baud rates
-            invalid_bauds = [b for b in scan_bauds if b not in U2D2Interface.BAUDRATE_MAP]
+            invalid_bauds = sorted(set(scan_bauds) - U2D2Interface.BAUDRATE_SET)
             if invalid_bauds:
                 print(f"❌ Error: Invalid baud rates: {invalid_bauds}. Valid rates: {list(U2D2Interface.BAUDRATE_MAP.keys())}")
                 sys.exit(1)
@@ -220,7 +336,7 @@ def main():
             sys.exit(1)
     
     # Parse scan ID range if provided
-    scan_id_range = range(0, 253)  # Default: scan all IDs 0-252 (253 total)
+    scan_id_range = FULL_ID_RANGE  # Default: scan all IDs 0-252 (253 total)
     if args.scan_id_range:
         try:
             start_str, end_str = args.scan_id_range.split(',')
@@ -234,113 +350,116 @@ def main():
             print("❌ Error: Invalid ID range format. Use START,END (e.g., 1,10)")
             sys.exit(1)
     
-    # Create manager
-    manager = BaudrateManager(args.port, args.verbose)
-    
-    # Determine if we need to scan
-    need_to_scan = motor_ids is None
-    
-    # Scan for motors if needed
-    if need_to_scan:
-        if args.old_baud is not None:
-            # Scan only at the specified old baud rate
-            detected_motors = {}
-            try:
-                interface = U2D2Interface(manager.port, 3000000, verbose=manager.verbose)
-                detected = interface.scan_motors_at_baudrate(args.old_baud, scan_id_range)
-                interface.close()
-                for motor_id in detected:
-                    detected_motors[motor_id] = args.old_baud
-            except Exception as e:
-                print(f"❌ Error during scanning: {e}")
-                sys.exit(1)
-        else:
-            # Scan all baud rates
-            detected_motors = manager.scan_all_baudrates(scan_bauds, scan_id_range)
+    # Create manager; its port is closed when the block exits
+    with BaudrateManager(args.port, args.verbose) as manager:
+    
+        # Scan for motors unless both the IDs and their baud rate are given
+        if motor_ids is None:
+            if args.old_baud is not None:
+                # Scan only at the specified old baud rate
+                detected_motors = {}
+                try:
+                    detected = manager.get_interface().scan_motors_at_baudrate(args.old_baud, scan_id_range)
+                    for motor_id in detected:
+                        detected_motors[motor_id] = args.old_baud
+                except Exception as e:
+                    print(f"❌ Error during scanning: {e}")
+                    sys.exit(1)
+            else:
+                # Scan all baud rates
+                detected_motors = manager.scan_all_baudrates(scan_bauds, scan_id_range, use_cache=not args.rescan)
         
-        if not detected_motors:
-            print("❌ No motors detected")
-            sys.exit(1)
-    else:
-        # Use provided motor IDs with known baud rate
-        if args.old_baud is not None:
+            if not detected_motors:
+                print("❌ No motors detected")
+                sys.exit(1)
+        elif args.old_baud is not None:
+            # Use provided motor IDs with known baud rate
             detected_motors = {motor_id: args.old_baud for motor_id in motor_ids}
         else:
-            print("❌ Error: Must specify --old-baud when using --motor-ids")
-            sys.exit(1)
+            # Look only for the given IDs rather than sweeping the whole ID range
+            detected_motors = manager.find_motors(motor_ids, scan_bauds)
+            missing = [motor_id for motor_id in motor_ids if motor_id not in detected_motors]
+            if missing:
+                print(f"❌ Motors not found: {missing}")
+                sys.exit(1)
     
-    # Determine which motors to change
-    if motor_ids is None:
-        # Use all detected motors
-        target_motors = list(detected_motors.keys())
-    else:
-        # Use specified motors
-        target_motors = motor_ids
-    
-    # Display change plan
-    print("\n" + "="*60)
-    print("🔄 BAUD RATE CHANGE PLAN")
-    print("="*60)
-    print(f"New Baud Rate: {args.new_baud}")
-    print(f"Port: {args.port}")
-    if args.old_baud:
-        print(f"Old Baud Rate: {args.old_baud} (known)")
-    else:
-        print("Old Baud Rate: (detected via scanning)")
-    print()
-    print("Motors to change:")
-    for motor_id in target_motors:
-        current_baud = detected_motors.get(motor_id, "unknown")
-        print(f"  Motor ID {motor_id} ({current_baud} → {args.new_baud} baud)")
-    print()
-    print(f"Total motors to change: {len(target_motors)}")
-    print("="*60)
-    
-    # Confirm before making changes
-    if not args.yes:
-        print()
-        print("⚠️  WARNING: This will permanently change motor baud rates!")
-        print("⚠️  Make sure no other programs are using these motors.")
+        # Determine which motors to change
+        if motor_ids is None:
+            # Use all detected motors
+            target_motors = list(detected_motors.keys())
+        else:
+            # Use specified motors
+            target_motors = motor_ids
+    
+        # Display change plan
+        print("\n" + "="*60)
+        print("🔄 BAUD RATE CHANGE PLAN")
+        print("="*60)
+        print(f"New Baud Rate: {args.new_baud}")
+        print(f"Port: {args.port}")
+        if args.old_baud:
+            print(f"Old Baud Rate: {args.old_baud} (known)")
+        else:
+            print("Old Baud Rate: (detected via scanning)")
         print()
-        confirm = input("Proceed with baud rate changes? (yes/no): ").strip().lower()
-        if confirm != "yes":
-            print("❌ Operation cancelled")
-            sys.exit(0)
-    
-    # Create motor_baud_map for the target motors
-    motor_baud_map = {motor_id: detected_motors[motor_id] for motor_id in target_motors}
-    
-    # Change baud rates
-    results = manager.change_motors_baudrate(motor_baud_map, args.new_baud)
-    
-    # Report results
-    print("\n" + "="*60)
-    print("📊 RESULTS")
-    print("="*60)
-    
-    successful = sum(1 for success in results.values() if success)
-    total = len(results)
-    
-    print(f"Successfully changed: {successful}/{total} motors")
-    print()
-    
-    if successful == total:
-        print("✅ All motor baud rates changed successfully!")
-    else:
-        print("❌ Some changes failed:")
-        for motor_id, success in results.items():
-            status = "✅ Success" if success else "❌ Failed"
+        print("Motors to change:")
+        for motor_id in target_motors:
             current_baud = detected_motors.get(motor_id, "unknown")
-            print(f"  Motor ID {motor_id} ({current_baud} → {args.new_baud} baud): {status}")
-    
-    if successful < total:
-        failed_count = total - successful
-        print(f"\n⚠️  {failed_count} motor(s) failed to change baud rate")
-        print("💡 Troubleshooting tips:")
-        print("   - Check if motors are powered on")
-        print("   - Verify current baud rate is correct")
-        print("   - Ensure no other programs are using the motors")
-        print("   - Check USB connection")
+            print(f"  Motor ID {motor_id} ({current_baud} → {args.new_baud} baud)")
+        print()
+        print(f"Total motors to change: {len(target_motors)}")
+        print("="*60)
+    
+        # Confirm before making changes
+        if not args.yes:
+            print()
+            print("⚠️  WARNING: This will permanently change motor baud rates!")
+            print("⚠️  Make sure no other programs are using these motors.")
+            print()
+            confirm = input("Proceed with baud rate changes? (yes/no): ").strip().lower()
+            if confirm != "yes":
+                print("❌ Operation cancelled")
+                sys.exit(0)
+    
+        # Create motor_baud_map for the target motors
+        motor_baud_map = {motor_id: detected_motors[motor_id] for motor_id in target_motors}
+    
+        # Change baud rates
+        results = manager.change_motors_baudrate(motor_baud_map, args.new_baud)
+    
+        # Report results
+        print("\n" + "="*60)
+        print("📊 RESULTS")
+        print("="*60)
+    
+        successful = sum(1 for success in results.values() if success)
+        total = len(results)
+    
+        # Motors have moved, so the cached sweep no longer describes the bus
+        clear_scan(args.port)
+        if successful:
+            save_last_baud(args.new_baud)
+    
+        print(f"Successfully changed: {successful}/{total} motors")
+        print()
+    
+        if successful == total:
+            print("✅ All motor baud rates changed successfully!")
+        else:
+            print("❌ Some changes failed:")
+            for motor_id, success in results.items():
+                status = "✅ Success" if success else "❌ Failed"
+                current_baud = detected_motors.get(motor_id, "unknown")
+                print(f"  Motor ID {motor_id} ({current_baud} → {args.new_baud} baud): {status}")
+    
+        if successful < total:
+            failed_count = total - successful
+            print(f"\n⚠️  {failed_count} motor(s) failed to change baud rate")
+            print("💡 Troubleshooting tips:")
+            print("   - Check if motors are powered on")
+            print("   - Verify current baud rate is correct")
+            print("   - Ensure no other programs are using the motors")
+            print("   - Check USB connection")
 
 
 if __name__ == "__main__":
@@ -16,14 +16,20 @@ Examples:
 
     # Change with custom port
     python change_id.py --baud 3000000 --current-ids 1,2 --new-ids 10,11 --port /dev/ttyUSB1
+
+    # Also set Return Delay Time to 0 on the renamed motors
+    python change_id.py --baud 3000000 --current-ids 1,2 --new-ids 10,11 --zero-return-delay
 """
 
 import argparse
 import sys
 from typing import List, Dict, Optional
 
+import numpy as np
+
 # Import from the package (assumes pip install -e . was run)
 from dynamixel_u2d2.u2d2_interface import U2D2Interface
+from helpers._id_list import parse_ids, invalid_ids, has_duplicates
 
 
 class IDManager:
@@ -40,7 +46,7 @@ class IDManager:
         self.port = port
         self.verbose = verbose
     
-    def change_motors_id(self, current_ids: List[int], new_ids: List[int], baudrate: int) -> Dict[int, bool]:
+    def change_motors_id(self, current_ids: List[int], new_ids: List[int], baudrate: int, zero_return_delay: bool = False) -> Dict[int, bool]:
         """
         Change IDs for multiple motors using U2D2Interface.
         
@@ -48,6 +54,7 @@ class IDManager:
             current_ids: List of current motor IDs
             new_ids: List of new motor IDs (must match current_ids length)
             baudrate: Baud rate to use for communication
+            zero_return_delay: Also set Return Delay Time to 0 on the motors whose ID changed
             
         Returns:
             Dictionary mapping current_id to success status
@@ -66,12 +73,19 @@ class IDManager:
                 print(f"  {current_id} → {new_id}")
         
         try:
-            # Create interface for ID changes
-            interface = U2D2Interface(self.port, baudrate, verbose=self.verbose)
-            results = interface.change_motors_id(id_mapping, baudrate)
-            interface.close()
-            
-            return results
+            # Create interface for ID changes; the port is closed even if a change raises
+            with U2D2Interface(self.port, baudrate, verbose=self.verbose) as interface:
+                results = interface.change_motors_id(id_mapping, baudrate)
+                
+                if zero_return_delay:
+                    # The motors now answer at their new IDs
+                    changed_ids = [id_mapping[current_id] for current_id, success in results.items() if success]
+                    if changed_ids:
+                        interface.bulk_set_return_delay_time(changed_ids, 0, skip_unchanged=True)
+                        if self.verbose:
+                            print(f"✅ Return Delay Time set to 0 on motors {changed_ids}")
+                
+                return results
             
         except Exception as e:
             print(f"❌ Error changing motor IDs: {e}")
@@ -83,46 +97,49 @@ def validate_id_lists(current_ids: List[int], new_ids: List[int]) -> bool:
     Validate the current and new ID lists.
     
     Args:
-        current_ids: List of current motor IDs
-        new_ids: List of new motor IDs
+        current_ids: List (or array) of current motor IDs
+        new_ids: List (or array) of new motor IDs
         
     Returns:
         True if valid, False otherwise
     """
+    current_ids = np.asarray(current_ids, dtype=np.int64)
+    new_ids = np.asarray(new_ids, dtype=np.int64)
+    
     # Check lengths match
     if len(current_ids) != len(new_ids):
         print("❌ Error: current_ids and new_ids must have the same length")
         return False
     
     # Check for empty lists
-    if not current_ids:
+    if not current_ids.size:
         print("❌ Error: No motor IDs provided")
         return False
     
     # Validate current IDs
-    invalid_current = [id for id in current_ids if id < 0 or id > 252]
+    invalid_current = invalid_ids(current_ids)
     if invalid_current:
         print(f"❌ Error: Invalid current IDs: {invalid_current}. Must be 0-252")
         return False
     
     # Validate new IDs
-    invalid_new = [id for id in new_ids if id < 0 or id > 252]
+    invalid_new = invalid_ids(new_ids)
     if invalid_new:
         print(f"❌ Error: Invalid new IDs: {invalid_new}. Must be 0-252")
         return False
     
     # Check for duplicate current IDs
-    if len(current_ids) != len(set(current_ids)):
+    if has_duplicates(current_ids):
         print("❌ Error: Duplicate current IDs found. Each motor must have a unique current ID.")
         return False
     
     # Check for duplicate new IDs
-    if len(new_ids) != len(set(new_ids)):
+    if has_duplicates(new_ids):
         print("❌ Error: Duplicate new IDs found. Each motor must have a unique new ID.")
         return False
     
     # Check for overlapping IDs (current and new)
-    overlap = set(current_ids) & set(new_ids)
+    overlap = set(np.intersect1d(current_ids, new_ids, assume_unique=True).tolist())
     if overlap:
         print(f"❌ Error: Overlapping IDs found: {overlap}. Current and new IDs must be distinct.")
         return False
@@ -185,6 +202,12 @@ def main():
         help='Skip confirmation prompt (use with caution)'
     )
     
+    parser.add_argument(
+        '--zero-return-delay',
+        action='store_true',
+        help='Also set Return Delay Time to 0 (from the default 500 us) on the renamed motors'
+    )
+    
     args = parser.parse_args()
     
     # Validate baud rate
@@ -194,14 +217,14 @@ def main():
     
     # Parse current IDs
     try:
-        current_ids = [int(x.strip()) for x in args.current_ids.split(',')]
+        current_ids = parse_ids(args.current_ids)
     except ValueError:
         print("❌ Error: Invalid current IDs format. Use comma-separated integers (e.g., 1,2,3)")
         sys.exit(1)
     
     # Parse new IDs
     try:
-        new_ids = [int(x.strip()) for x in args.new_ids.split(',')]
+        new_ids = parse_ids(args.new_ids)
     except ValueError:
         print("❌ Error: Invalid new IDs format. Use comma-separated integers (e.g., 10,11,12)")
         sys.exit(1)
@@ -209,6 +232,8 @@ def main():
     # Validate ID lists
     if not validate_id_lists(current_ids, new_ids):
         sys.exit(1)
+    current_ids = current_ids.tolist()
+    new_ids = new_ids.tolist()
     
     # Set verbose mode
     verbose = args.verbose and not args.quiet
@@ -245,7 +270,7 @@ def main():
     manager = IDManager(args.port, verbose)
     
     try:
-        results = manager.change_motors_id(current_ids, new_ids, args.baud)
+        results = manager.change_motors_id(current_ids, new_ids, args.baud, args.zero_return_delay)
         
         # Report results
         print("\n" + "="*60)
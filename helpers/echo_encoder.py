@@ -16,6 +16,9 @@ Examples:
 
     # Use custom port
     python echo_encoder.py --baud 3000000 --motor-ids 1,2 --port /dev/ttyUSB1
+
+    # Set Return Delay Time to 0 first for faster position reads
+    python echo_encoder.py --baud 3000000 --motor-ids 1,2,3 --zero-return-delay
 """
 
 import argparse
@@ -26,12 +29,13 @@ from typing import List
 
 # Import from the package (assumes pip install -e . was run)
 from dynamixel_u2d2.u2d2_interface import U2D2Interface
+from helpers._id_list import parse_ids, invalid_ids, has_duplicates
 
 
 class EncoderEcho:
     """Continuous encoder position reader for Dynamixel motors."""
     
-    def __init__(self, port: str, baudrate: int, motor_ids: List[int], verbose: bool = True):
+    def __init__(self, port: str, baudrate: int, motor_ids: List[int], verbose: bool = True, zero_return_delay: bool = False):
         """
         Initialize the encoder echo.
         
@@ -40,12 +44,15 @@ class EncoderEcho:
             baudrate: Communication baud rate
             motor_ids: List of motor IDs to monitor
             verbose: Enable verbose output
+            zero_return_delay: Set Return Delay Time to 0 on connect
         """
         self.port = port
         self.baudrate = baudrate
         self.motor_ids = motor_ids
         self.verbose = verbose
+        self.zero_return_delay = zero_return_delay
         self.interface = None
+        self.read_positions = None  # Compiled position reader for motor_ids, set by connect()
         self.running = True
         
         # Setup signal handler for graceful shutdown
@@ -83,13 +90,24 @@ class EncoderEcho:
             
             # Ensure torque is disabled for all motors
             print("🔒 Ensuring torque is disabled for all motors...")
-            for motor_id in self.motor_ids:
+            try:
+                self.interface.bulk_disable_torque(self.motor_ids)
+                if self.verbose:
+                    print(f"✅ Motors {self.motor_ids}: Torque disabled")
+            except Exception as e:
+                print(f"⚠️  Could not disable torque - {e}")
+            
+            # Return Delay Time is an EEPROM register; only motors not already at 0 are written
+            if self.zero_return_delay:
                 try:
-                    self.interface.disable_torque(motor_id)
+                    self.interface.bulk_set_return_delay_time(self.motor_ids, 0, skip_unchanged=True)
                     if self.verbose:
-                        print(f"✅ Motor {motor_id}: Torque disabled")
+                        print(f"✅ Motors {self.motor_ids}: Return Delay Time set to 0")
                 except Exception as e:
-                    print(f"⚠️  Motor {motor_id}: Could not disable torque - {e}")
+                    print(f"⚠️  Could not set Return Delay Time - {e}")
+            
+            # One sync read of all positions per refresh instead of one read per motor
+            self.read_positions = self.interface.compile_bulk_read_positions(self.motor_ids)
             
             print("✅ All motors connected and ready for position monitoring")
             return True
@@ -110,42 +128,47 @@ class EncoderEcho:
         print("Press Ctrl+C to stop")
         print("="*60)
         
+        # Draw the static screen once; the loop only rewrites the value column
+        labels = [f"Motor {motor_id:2d}: Position = " for motor_id in self.motor_ids]
+        display_lines = [
+            "📊 Dynamixel Encoder Echo",
+            f"Port: {self.port} | Baud: {self.baudrate}",
+            f"Motors: {', '.join(map(str, self.motor_ids))}",
+            "="*60,
+            *labels,
+            "="*60,
+            "Press Ctrl+C to stop",
+        ]
+        print("\033[2J\033[H" + "\n".join(display_lines))  # Clear screen and move cursor to top
+        
+        # CUP escapes are 1-based; motor rows follow the 4 header lines
+        cursors = [f"\033[{row};{len(label) + 1}H" for row, label in enumerate(labels, start=5)]
+        end_cursor = f"\033[{len(display_lines) + 1};1H"
+        num_motors = len(self.motor_ids)
+        shown = [None] * num_motors
+        
+        # Bind what the loop calls every iteration to locals
+        read_positions = self.read_positions
+        write = sys.stdout.write
+        flush = sys.stdout.flush
+        sleep = time.sleep
+        
         try:
             while self.running:
-                # Build display content first, then clear and show all at once
-                display_lines = []
-                display_lines.append("📊 Dynamixel Encoder Echo")
-                display_lines.append(f"Port: {self.port} | Baud: {self.baudrate}")
-                display_lines.append(f"Motors: {', '.join(map(str, self.motor_ids))}")
-                display_lines.append("="*60)
-                
-                # Read positions for all motors
-                positions = {}
-                for motor_id in self.motor_ids:
-                    try:
-                        position = self.interface.get_position(motor_id)
-                        positions[motor_id] = position
-                    except Exception as e:
-                        positions[motor_id] = f"ERROR: {e}"
-                
-                # Add position data to display
-                for motor_id in self.motor_ids:
-                    pos = positions[motor_id]
-                    if isinstance(pos, int):
-                        display_lines.append(f"Motor {motor_id:2d}: Position = {pos:6d}")
-                    else:
-                        display_lines.append(f"Motor {motor_id:2d}: {pos}")
-                
-                display_lines.append("="*60)
-                display_lines.append("Press Ctrl+C to stop")
+                # Read positions for all motors and rewrite only the values that changed
+                try:
+                    values = [f"{pos:6d}\033[K" for pos in read_positions().tolist()]
+                except Exception as e:
+                    values = [f"ERROR: {e}\033[K"] * num_motors
                 
-                # Clear screen and display all content at once
-                print("\033[2J\033[H", end="")  # Clear screen and move cursor to top
-                for line in display_lines:
-                    print(line)
+                updates = [cursor + value for cursor, value, old in zip(cursors, values, shown) if value != old]
+                if updates:
+                    write("".join(updates) + end_cursor)
+                    flush()
+                    shown = values
                 
                 # Small delay to prevent overwhelming the interface
-                time.sleep(0.05)  # Reduced delay for smoother updates
+                sleep(0.05)  # Reduced delay for smoother updates
                 
         except KeyboardInterrupt:
             print("\n🛑 Stopped by user")
@@ -207,6 +230,12 @@ def main():
         help='Suppress verbose output (overrides --verbose)'
     )
     
+    parser.add_argument(
+        '--zero-return-delay',
+        action='store_true',
+        help='Set Return Delay Time to 0 (from the default 500 us) before monitoring'
+    )
+    
     args = parser.parse_args()
     
     # Validate baud rate
@@ -216,21 +245,20 @@ def main():
     
     # Parse motor IDs
     try:
-        motor_ids = [int(x.strip()) for x in args.motor_ids.split(',')]
-        if not motor_ids:
-            print("❌ Error: No motor IDs provided")
-            sys.exit(1)
+        motor_ids = parse_ids(args.motor_ids)
         
         # Validate motor IDs
-        for motor_id in motor_ids:
-            if not (0 <= motor_id <= 252):
-                print(f"❌ Error: Invalid motor ID {motor_id}. Must be 0-252")
-                sys.exit(1)
+        invalid = invalid_ids(motor_ids)
+        if invalid:
+            print(f"❌ Error: Invalid motor IDs {invalid}. Must be 0-252")
+            sys.exit(1)
         
         # Check for duplicates
-        if len(motor_ids) != len(set(motor_ids)):
+        if has_duplicates(motor_ids):
             print("❌ Error: Duplicate motor IDs found")
             sys.exit(1)
+        
+        motor_ids = motor_ids.tolist()
             
     except ValueError:
         print("❌ Error: Invalid motor IDs format. Use comma-separated integers (e.g., 1,2,3)")
@@ -240,7 +268,7 @@ def main():
     verbose = args.verbose and not args.quiet
     
     # Create encoder echo instance
-    echo = EncoderEcho(args.port, args.baud, motor_ids, verbose)
+    echo = EncoderEcho(args.port, args.baud, motor_ids, verbose, args.zero_return_delay)
     
     # Connect and start monitoring
     if echo.connect():
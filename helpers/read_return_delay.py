@@ -1,59 +1,96 @@
 import sys
 from dynamixel_sdk import *  # Uses Dynamixel SDK library
 
+from dynamixel_u2d2.port_latency import read_latency_timer, write_latency_timer
+
 # ====== USER CONFIGURATION ======
 DEVICENAME = "/dev/ttyUSB0"         # Update as needed
 PROTOCOL_VERSION = 2.0
 RETURN_DELAY_ADDR = 9              # EEPROM address for Return Delay Time
 RETURN_DELAY_UNIT_US = 2           # 1 unit = 2 microseconds
+LATENCY_TIMER_MS = 1               # USB latency timer to request (needs root or a udev rule, see port_latency.py)
 # =================================
 
-def read_return_delay_time(portHandler, packetHandler, motor_id, baudrate):
-    # Open the port
-    if not portHandler.openPort():
-        print("❌ Failed to open the port.")
-        return
+def lower_latency_timer():
+    # Lower the USB latency timer so each reply is not held back for 16 ms
+    if read_latency_timer(DEVICENAME) not in (None, LATENCY_TIMER_MS):
+        if write_latency_timer(DEVICENAME, LATENCY_TIMER_MS):
+            print(f"✅ Latency timer set to {LATENCY_TIMER_MS} ms")
+        else:
+            print("⚠️ Cannot write the latency timer (needs root or a udev rule), replies will be slower")
 
-    print("✅ Port opened.")
 
-    # Set the baudrate
-    if not portHandler.setBaudRate(baudrate):
-        print(f"❌ Failed to set baudrate to {baudrate}")
-        portHandler.closePort()
-        return
+def print_return_delay(motor_id, delay_value):
+    print(f"📨 Motor ID {motor_id} Return Delay Time: {delay_value} units ({delay_value * RETURN_DELAY_UNIT_US} µs)")
 
-    print(f"✅ Baudrate set to {baudrate}")
 
-    # Ping the motor
+def read_return_delay_time(portHandler, packetHandler, motor_id):
+    # Ping the motor first so a missing motor is told apart from a failed read
     model_number, dxl_comm_result, dxl_error = packetHandler.ping(portHandler, motor_id)
     if dxl_comm_result != COMM_SUCCESS:
         print(f"❌ Failed to ping ID {motor_id}: {packetHandler.getTxRxResult(dxl_comm_result)}")
-        portHandler.closePort()
         return
 
     print(f"✅ Found motor ID {motor_id} (Model Number: {model_number})")
 
-    # Read Return Delay Time
     delay_value, dxl_comm_result, dxl_error = packetHandler.read1ByteTxRx(portHandler, motor_id, RETURN_DELAY_ADDR)
-    if dxl_comm_result == COMM_SUCCESS:
-        print(f"📨 Return Delay Time: {delay_value} units ({delay_value * RETURN_DELAY_UNIT_US} µs)")
+    if dxl_comm_result != COMM_SUCCESS:
+        print(f"❌ Failed to read Return Delay Time of ID {motor_id}: {packetHandler.getTxRxResult(dxl_comm_result)}")
+    elif dxl_error != 0:
+        print(f"❌ Motor ID {motor_id} reported: {packetHandler.getRxPacketError(dxl_error)}")
     else:
-        print(f"❌ Failed to read Return Delay Time: {packetHandler.getTxRxResult(dxl_comm_result)}")
+        print_return_delay(motor_id, delay_value)
 
-    portHandler.closePort()
-    print("🔌 Port closed.")
+
+def read_return_delay_times(portHandler, packetHandler, motor_ids):
+    # One Sync Read fetches the Return Delay Time of every motor in a single transaction
+    groupSyncRead = GroupSyncRead(portHandler, packetHandler, RETURN_DELAY_ADDR, 1)
+    for motor_id in motor_ids:
+        groupSyncRead.addParam(motor_id)
+
+    dxl_comm_result = groupSyncRead.txRxPacket()
+    if dxl_comm_result != COMM_SUCCESS:
+        print(f"⚠️ Sync read failed: {packetHandler.getTxRxResult(dxl_comm_result)}, reading motors one by one")
+
+    for motor_id in motor_ids:
+        if groupSyncRead.isAvailable(motor_id, RETURN_DELAY_ADDR, 1):
+            print_return_delay(motor_id, groupSyncRead.getData(motor_id, RETURN_DELAY_ADDR, 1))
+        else:
+            # The sync read stops at the first missing motor, so fall back to
+            # a ping and a single read to say which motor is at fault
+            read_return_delay_time(portHandler, packetHandler, motor_id)
 
 
 if __name__ == "__main__":
     if len(sys.argv) != 3:
-        print("Usage: python read_return_delay.py <motor_id> <baudrate>")
-        print("Example: python read_return_delay.py 1 4000000")
+        print("Usage: python read_return_delay.py <motor_id>[,<motor_id>...] <baudrate>")
+        print("Example: python read_return_delay.py 1,2,3 4000000")
         sys.exit(1)
 
-    motor_id = int(sys.argv[1])
+    motor_ids = [int(x.strip()) for x in sys.argv[1].split(',')]
     baudrate = int(sys.argv[2])
 
+    lower_latency_timer()
+
     portHandler = PortHandler(DEVICENAME)
     packetHandler = PacketHandler(PROTOCOL_VERSION)
 
-    read_return_delay_time(portHandler, packetHandler, motor_id, baudrate)
+    # Open the port once for all motors
+    if not portHandler.openPort():
+        print("❌ Failed to open the port.")
+        sys.exit(1)
+
+    print("✅ Port opened.")
+
+    try:
+        # Set the baudrate
+        if not portHandler.setBaudRate(baudrate):
+            print(f"❌ Failed to set baudrate to {baudrate}")
+            sys.exit(1)
+
+        print(f"✅ Baudrate set to {baudrate}")
+
+        read_return_delay_times(portHandler, packetHandler, motor_ids)
+    finally:
+        portHandler.closePort()
+        print("🔌 Port closed.")
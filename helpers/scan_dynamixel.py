@@ -5,7 +5,7 @@ This script scans for Dynamixel motors at different baud rates and motor ID rang
 providing detailed information about detected motors.
 
 Usage:
-    python scan_dynamixel.py [--scan-bauds BAUDS] [--scan-id-range START,END] [--port PORT]
+    python scan_dynamixel.py [--scan-bauds BAUDS] [--scan-id-range START,END] [--port PORT] [--extra-ports PORTS | --all-ports] [--output FILE]
 
 Examples:
     # Scan all motors at all baud rates
@@ -19,15 +19,23 @@ Examples:
 
     # Scan with custom baud rates and ID range
     python scan_dynamixel.py --scan-bauds 3000000,4000000 --scan-id-range 1,20
+
+    # Sweep two adapters at once (each port scanned on its own thread)
+    python scan_dynamixel.py --port /dev/ttyUSB0 --extra-ports /dev/ttyUSB1
+
+    # Sweep every connected adapter at once
+    python scan_dynamixel.py --all-ports
+
+    # Record motors to a JSON Lines file as they are found
+    python scan_dynamixel.py --output scan.jsonl
 """
 
 import argparse
+import json
 import sys
+from collections import defaultdict
 from typing import List, Dict, Optional
 
-# Import from the package (assumes pip install -e . was run)
-from dynamixel_u2d2.u2d2_interface import U2D2Interface
-
 
 def main():
     """Main function with command line interface."""
@@ -58,6 +66,26 @@ def main():
         help='USB port path (default: /dev/ttyUSB0)'
     )
     
+    parser.add_argument(
+        '--extra-ports',
+        type=str,
+        default=None,
+        help='Comma-separated additional USB ports to sweep in parallel with --port (full baud rate sweep only)'
+    )
+    
+    parser.add_argument(
+        '--all-ports',
+        action='store_true',
+        help='Sweep every connected /dev/ttyUSB* and /dev/ttyACM* port in parallel with --port (full baud rate sweep only)'
+    )
+    
+    parser.add_argument(
+        '--output',
+        type=str,
+        default=None,
+        help='Also write each motor as it is found to this file, one JSON object per line'
+    )
+    
     parser.add_argument(
         '--verbose',
         action='store_true',
@@ -73,13 +101,18 @@ def main():
     
     args = parser.parse_args()
     
+    # Import from the package (assumes pip install -e . was run). Deferred until
+    # the arguments parse, so --help and usage errors skip loading the SDK.
+    from dynamixel_u2d2.u2d2_interface import U2D2Interface
+    from helpers.u2d2_port_timer import find_u2d2_ports
+    
     # Parse scan baud rates if provided
     scan_bauds = None
     if args.scan_bauds:
         try:
             scan_bauds = [int(x.strip()) for x in args.scan_bauds.split(',')]
             # Validate baud rates
-            invalid_bauds = [b for b in scan_bauds if b not in U2D2Interface.BAUDRATE_MAP]
+            invalid_bauds = sorted(set(scan_bauds) - U2D2Interface.BAUDRATE_SET)
             if invalid_bauds:
                 print(f"❌ Error: Invalid baud rates: {invalid_bauds}. Valid rates: {list(U2D2Interface.BAUDRATE_MAP.keys())}")
                 sys.exit(1)
@@ -102,76 +135,125 @@ def main():
             print("❌ Error: Invalid ID range format. Use START,END (e.g., 1,10)")
             sys.exit(1)
     
+    # Parse extra ports if provided
+    extra_ports = None
+    if args.extra_ports:
+        extra_ports = [x.strip() for x in args.extra_ports.split(',') if x.strip()]
+    elif args.all_ports:
+        extra_ports = [port for port in find_u2d2_ports() if port != args.port]
+    if extra_ports and scan_bauds:
+        print("❌ Error: --extra-ports/--all-ports only apply to the full baud rate sweep (omit --scan-bauds)")
+        sys.exit(1)
+    
     # Set verbose mode
     verbose = args.verbose and not args.quiet
     
+    # Optional JSON Lines record of each motor as it is found
+    output = None
+    if args.output:
+        try:
+            output = open(args.output, 'w')
+        except OSError as e:
+            print(f"❌ Error: Cannot open output file: {e}")
+            sys.exit(1)
+    
     # Create interface for scanning
     try:
         interface = U2D2Interface(args.port, 3000000, verbose=verbose)
     except Exception as e:
         print(f"❌ Error: Failed to initialize interface: {e}")
+        if output is not None:
+            output.close()
         sys.exit(1)
     
+    def record(motor_id: int, baudrate: int):
+        """Report a found motor right away, so progress is visible and survives an aborted scan."""
+        if verbose:
+            print(f"   ✅ Motor ID {motor_id} at {baudrate} baud", flush=True)
+        if output is not None:
+            output.write(json.dumps({"id": motor_id, "baud": baudrate}) + "\n")
+            output.flush()
+    
+    detected_motors = {}
+    failed = False
     try:
-        # Scan for motors
-        if scan_bauds:
-            # Custom baud rate scanning
-            detected_motors = {}
-            for baudrate in scan_bauds:
+        if extra_ports:
+            # Ports are swept concurrently; results are reported once all ports finish
+            detected_motors = interface.scan_all_baudrates(scan_id_range, extra_ports=extra_ports)
+            for motor_id, baudrate in detected_motors.items():
+                record(motor_id, baudrate)
+        else:
+            for baudrate in scan_bauds or U2D2Interface.SCAN_BAUDRATES:
+                # An ID found at one baud rate is not looked for again
+                remaining = [motor_id for motor_id in scan_id_range if motor_id not in detected_motors]
+                if not remaining:
+                    break
+                
                 if verbose:
                     print(f"🔄 Scanning at baudrate {baudrate}...")
-                detected = interface.scan_motors_at_baudrate(baudrate, scan_id_range)
+                try:
+                    detected = interface.scan_motors_at_baudrate(baudrate, remaining)
+                except Exception as e:
+                    print(f"⚠️  Scan at {baudrate} baud failed - {e}")
+                    continue
+                
                 for motor_id in detected:
                     detected_motors[motor_id] = baudrate
-        else:
-            # Use default scanning with custom ID range
-            detected_motors = interface.scan_all_baudrates(scan_id_range)
-        
-        # Print results
-        print("\n" + "="*50)
-        print("🔍 SCAN RESULTS")
-        print("="*50)
-        
-        if detected_motors:
-            print(f"✅ Found {len(detected_motors)} motor(s):")
-            print()
-            
-            # Group by baud rate for better display
-            by_baud = {}
-            for motor_id, baud in detected_motors.items():
-                if baud not in by_baud:
-                    by_baud[baud] = []
-                by_baud[baud].append(motor_id)
-            
-            for baud in sorted(by_baud.keys()):
-                motor_ids = sorted(by_baud[baud])
-                print(f"📡 Baud Rate {baud}:")
-                for motor_id in motor_ids:
-                    print(f"   - Motor ID {motor_id}")
-                print()
-            
-            # Summary
-            print("📊 Summary:")
-            print(f"   Total motors found: {len(detected_motors)}")
-            print(f"   Baud rates used: {len(by_baud)}")
-            print(f"   ID range scanned: {scan_id_range.start}-{scan_id_range.stop-1}")
-            
-        else:
-            print("❌ No motors detected")
-            print()
-            print("💡 Troubleshooting tips:")
-            print("   - Check USB connection")
-            print("   - Verify port path (try --port /dev/ttyUSB1, /dev/ttyUSB2, etc.)")
-            print("   - Ensure motors are powered on")
-            print("   - Try different baud rates with --scan-bauds")
-            print("   - Try different ID range with --scan-id-range")
+                    record(motor_id, baudrate)
     
+    except KeyboardInterrupt:
+        print("\n🛑 Scan interrupted, showing motors found so far")
     except Exception as e:
         print(f"❌ Error during scanning: {e}")
-        sys.exit(1)
+        failed = True
     
     finally:
         interface.close()
+        if output is not None:
+            output.close()
+    
+    print_results(detected_motors, scan_id_range)
+    if failed:
+        sys.exit(1)
+
+
+def print_results(detected_motors: Dict[int, int], scan_id_range: range):
+    """Print the scan results grouped by baud rate, or troubleshooting tips if nothing was found."""
+    print("\n" + "="*50)
+    print("🔍 SCAN RESULTS")
+    print("="*50)
+    
+    if detected_motors:
+        print(f"✅ Found {len(detected_motors)} motor(s):")
+        print()
+        
+        # Group by baud rate for better display; sorting the pairs once orders the IDs within each group
+        by_baud = defaultdict(list)
+        for motor_id, baud in sorted(detected_motors.items()):
+            by_baud[baud].append(motor_id)
+        
+        for baud in sorted(by_baud):
+            motor_ids = by_baud[baud]
+            print(f"📡 Baud Rate {baud}:")
+            for motor_id in motor_ids:
+                print(f"   - Motor ID {motor_id}")
+            print()
+        
+        # Summary
+        print("📊 Summary:")
+        print(f"   Total motors found: {len(detected_motors)}")
+        print(f"   Baud rates used: {len(by_baud)}")
+        print(f"   ID range scanned: {scan_id_range.start}-{scan_id_range.stop-1}")
+        
+    else:
+        print("❌ No motors detected")
+        print()
+        print("💡 Troubleshooting tips:")
+        print("   - Check USB connection")
+        print("   - Verify port path (try --port /dev/ttyUSB1, /dev/ttyUSB2, etc.)")
+        print("   - Ensure motors are powered on")
+        print("   - Try different baud rates with --scan-bauds")
+        print("   - Try different ID range with --scan-id-range")
 
 
 if __name__ == "__main__":
@@ -18,23 +18,30 @@ Examples:
 
 import argparse
 import os
-import glob
 import subprocess
 import stat
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 def find_u2d2_ports():
     """Find available U2D2 ports."""
-    ports = []
-    for pattern in ['/dev/ttyUSB*', '/dev/ttyACM*']:
-        ports.extend(glob.glob(pattern))
-    
-    # Filter to only character devices
+    # One pass over /dev, one stat per candidate
     u2d2_ports = []
-    for port in ports:
-        if os.path.exists(port) and stat.S_ISCHR(os.stat(port).st_mode):
-            u2d2_ports.append(port)
+    try:
+        with os.scandir('/dev') as entries:
+            for entry in entries:
+                if not entry.name.startswith(('ttyUSB', 'ttyACM')):
+                    continue
+                
+                # Filter to only character devices
+                try:
+                    if stat.S_ISCHR(entry.stat().st_mode):
+                        u2d2_ports.append(entry.path)
+                except OSError:
+                    continue
+    except OSError:
+        return []
     
     return sorted(u2d2_ports)
 
@@ -50,6 +57,42 @@ def get_latency_timer(port):
     except (OSError, ValueError):
         return None
 
+def set_low_latency_flag(port):
+    """Set the driver's ASYNC_LOW_LATENCY flag on a port, which drops ftdi_sio's latency timer to 1 ms."""
+    # Importing the package loads the SDK, so only do it when a port is actually configured
+    from dynamixel_u2d2.port_latency import set_low_latency
+    
+    try:
+        fd = os.open(port, os.O_RDWR | os.O_NOCTTY | os.O_NONBLOCK)
+    except OSError:
+        return False
+    try:
+        return set_low_latency(fd)
+    finally:
+        os.close(fd)
+
+def set_latency_timer_without_sudo(port, latency):
+    """
+    Try the ways of setting the latency timer that need no root.
+    
+    A udev rule may have made the sysfs file writable; otherwise a 1 ms
+    target can be reached through the low-latency ioctl on the port itself.
+    The timer is read back either way.
+    """
+    from dynamixel_u2d2.port_latency import write_latency_timer
+    
+    if write_latency_timer(port, latency) or (latency == 1 and set_low_latency_flag(port)):
+        return get_latency_timer(port) == latency
+    return False
+
+def get_latency_timers(ports):
+    """Get the current latency timer of every port, reading the sysfs files concurrently."""
+    if len(ports) < 2:
+        return {port: get_latency_timer(port) for port in ports}
+    
+    with ThreadPoolExecutor(max_workers=len(ports)) as executor:
+        return dict(zip(ports, executor.map(get_latency_timer, ports)))
+
 def set_latency_timer(port, latency):
     """Set latency timer for a port."""
     if not port.startswith('/dev/ttyUSB'):
@@ -62,6 +105,10 @@ def set_latency_timer(port, latency):
         print(f"❌ {port}: Latency timer path not found")
         return False
     
+    if set_latency_timer_without_sudo(port, latency):
+        print(f"✅ {port}: Set to {latency}ms")
+        return True
+    
     try:
         result = subprocess.run(
             ['sudo', 'tee', latency_path],
@@ -80,6 +127,46 @@ def set_latency_timer(port, latency):
         print(f"❌ {port}: Error - {e}")
         return False
 
+def set_latency_timers(ports, latency):
+    """
+    Set the latency timer of several ports with a single sudo call.
+    
+    Ports that can be set without root are handled first. One `sudo tee`
+    then writes every remaining port's sysfs file, so sudo and the process
+    start are paid once. Each port is read back afterwards, and any that did
+    not take the value are retried one at a time with set_latency_timer.
+    
+    Returns:
+        Number of ports set successfully
+    """
+    latency_paths = {}
+    for port in ports:
+        if port.startswith('/dev/ttyUSB') and not set_latency_timer_without_sudo(port, latency):
+            latency_path = f"/sys/bus/usb-serial/devices/{os.path.basename(port)}/latency_timer"
+            if os.path.exists(latency_path):
+                latency_paths[port] = latency_path
+    
+    if latency_paths:
+        try:
+            subprocess.run(
+                ['sudo', 'tee', *latency_paths.values()],
+                input=str(latency),
+                capture_output=True,
+                text=True
+            )
+        except Exception as e:
+            print(f"⚠️  Batched latency timer write failed - {e}")
+    
+    success_count = 0
+    for port in ports:
+        if get_latency_timer(port) == latency:
+            print(f"✅ {port}: Set to {latency}ms")
+            success_count += 1
+        elif set_latency_timer(port, latency):
+            success_count += 1
+    
+    return success_count
+
 def main():
     """Main function."""
     parser = argparse.ArgumentParser(
@@ -126,10 +213,12 @@ Examples:
     
     print(f"Found {len(ports)} U2D2 port(s):")
     
+    currents = get_latency_timers(ports)
+    
     if args.latency_timer is None:
         # Scan-only mode - just display ports
         for port in ports:
-            current = get_latency_timer(port)
+            current = currents[port]
             if current is not None:
                 print(f"  {port}: {current}ms")
             else:
@@ -141,7 +230,7 @@ Examples:
     # Configure mode - proceed with latency timer setting
     ports_to_change = []
     for port in ports:
-        current = get_latency_timer(port)
+        current = currents[port]
         if current is not None:
             status = "✅" if current == latency else "⚠️"
             print(f"  {port}: {current}ms {status}")
@@ -171,15 +260,12 @@ Examples:
     print()
     
     # Configure ports
-    success_count = 0
-    for port in ports_to_change:
-        if set_latency_timer(port, latency):
-            success_count += 1
+    success_count = set_latency_timers(ports_to_change, latency)
     
     # Show status for ports that didn't need changes
     for port in ports:
         if port not in ports_to_change:
-            current = get_latency_timer(port)
+            current = currents[port]
             if current == latency:
                 print(f"✅ {port}: Already set to {latency}ms")
                 success_count += 1
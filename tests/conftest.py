@@ -0,0 +1,111 @@
+"""
+Shared fixtures: a U2D2Interface whose serial port is an in-memory pipe.
+
+Bytes written by the interface are recorded, and status packets fed into the
+pipe are what the interface reads back, so packet paths can be exercised
+without hardware.
+"""
+
+import os
+
+import pytest
+from dynamixel_sdk import PacketHandler, PortHandler
+
+from dynamixel_u2d2 import u2d2_interface
+from dynamixel_u2d2.u2d2_interface import U2D2Interface
+
+
+class PipeSerial:
+    """Minimal stand-in for serial.Serial backed by a non-blocking pipe."""
+
+    def __init__(self):
+        self._read_fd, self._write_fd = os.pipe()
+        os.set_blocking(self._read_fd, False)
+        self.written = bytearray()
+        self.replies = []
+
+    def read(self, length):
+        try:
+            return os.read(self._read_fd, length)
+        except BlockingIOError:
+            return b''
+
+    def write(self, data):
+        self.written += bytes(data)
+        if self.replies:
+            self.feed(self.replies.pop(0))
+        return len(data)
+
+    def fileno(self):
+        return self._read_fd
+
+    def flush(self):
+        pass
+
+    def reset_input_buffer(self):
+        while self.read(4096):
+            pass
+
+    def feed(self, data):
+        os.write(self._write_fd, bytes(data))
+
+    def reply(self, data):
+        """Queue bytes to arrive after the next write, as a motor's status packet would."""
+        self.replies.append(bytes(data))
+
+    def close(self):
+        pass
+
+    def release(self):
+        os.close(self._read_fd)
+        os.close(self._write_fd)
+
+
+class PipePortHandler(PortHandler):
+    """
+    PortHandler whose setupPort opens a PipeSerial instead of a device.
+
+    The same PipeSerial survives baud rate changes, and every baud rate the
+    port is set to is recorded in baudrates.
+    """
+
+    def setupPort(self, cflag_baud):
+        if not isinstance(self.ser, PipeSerial):
+            self.ser = PipeSerial()
+            self.baudrates = []
+        self.baudrates.append(self.baudrate)
+        self.is_open = True
+        self.tx_time_per_byte = (1000.0 / self.baudrate) * 10.0
+        return True
+
+
+def ping_status_packet(motor_id, model_number=1060, firmware=48):
+    """Build the status packet a motor returns for a ping (XL430 by default)."""
+    return status_packet(motor_id, bytes([model_number & 0xFF, model_number >> 8, firmware]))
+
+
+def status_packet(motor_id, params=b'', error=0):
+    """Build a Protocol 2.0 status packet with the SDK's CRC."""
+    packet = [0xFF, 0xFF, 0xFD, 0x00, motor_id, 0, 0, 0x55, error] + list(params)
+    length = len(packet) - 7 + 2
+    packet[5], packet[6] = length & 0xFF, length >> 8
+    crc = PacketHandler(2.0).updateCRC(0, packet, len(packet))
+    return bytes(packet + [crc & 0xFF, crc >> 8])
+
+
+@pytest.fixture
+def pipe_interface(monkeypatch):
+    """Factory for U2D2Interfaces on a PipePortHandler; closed at teardown."""
+    monkeypatch.setattr(u2d2_interface, 'PortHandler', PipePortHandler)
+    interfaces = []
+
+    def make(motor_ids=None, **kwargs):
+        interface = U2D2Interface('/dev/null-u2d2', 1000000, motor_ids=motor_ids, **kwargs)
+        interfaces.append(interface)
+        return interface
+
+    yield make
+
+    for interface in interfaces:
+        interface.close()
+        interface._portHandler.ser.release()
@@ -0,0 +1,63 @@
+"""bulk_read returns bytes that stay valid; bulk_read_views is the zero-copy variant."""
+
+import asyncio
+
+from dynamixel_u2d2 import FakeU2D2Interface
+from dynamixel_u2d2.u2d2_interface import ADDR_PRESENT_POSITION, LEN_PRESENT_POSITION
+
+from .conftest import status_packet
+
+READ_PARAMS = [(1, ADDR_PRESENT_POSITION, LEN_PRESENT_POSITION), (2, ADDR_PRESENT_POSITION, LEN_PRESENT_POSITION)]
+
+
+def _positions_reply(first, second):
+    return (status_packet(1, first.to_bytes(4, 'little', signed=True))
+            + status_packet(2, second.to_bytes(4, 'little', signed=True)))
+
+
+def test_bulk_read_results_survive_the_next_read(pipe_interface):
+    u2d2 = pipe_interface()
+    ser = u2d2._portHandler.ser
+    ser.reply(_positions_reply(100, -200))
+    ser.reply(_positions_reply(300, 400))
+
+    first = u2d2.bulk_read(READ_PARAMS)
+    u2d2.bulk_read(READ_PARAMS)
+
+    assert all(type(data) is bytes for data in first.values())
+    assert first[(1, ADDR_PRESENT_POSITION)] == (100).to_bytes(4, 'little')
+    assert first[(2, ADDR_PRESENT_POSITION)] == (-200).to_bytes(4, 'little', signed=True)
+
+
+def test_bulk_read_views_share_one_buffer(pipe_interface):
+    u2d2 = pipe_interface()
+    ser = u2d2._portHandler.ser
+    ser.reply(_positions_reply(100, -200))
+    ser.reply(_positions_reply(300, 400))
+
+    first = u2d2.bulk_read_views(READ_PARAMS)
+    u2d2.bulk_read_views(READ_PARAMS)
+
+    assert all(isinstance(data, memoryview) for data in first.values())
+    assert bytes(first[(1, ADDR_PRESENT_POSITION)]) == (300).to_bytes(4, 'little')
+
+
+def test_fake_bulk_read_returns_bytes():
+    fake = FakeU2D2Interface(motor_ids=[1, 2])
+    fake.set_goal_position(1, 1234)
+
+    results = fake.bulk_read(READ_PARAMS + [(1, 0, 2)])
+
+    assert all(type(data) is bytes for data in results.values())
+    assert results[(1, 0)] == bytes(2)
+    assert isinstance(fake.bulk_read_views(READ_PARAMS)[(1, ADDR_PRESENT_POSITION)], memoryview)
+
+
+def test_fake_submit_bulk_read_returns_bytes():
+    fake = FakeU2D2Interface(motor_ids=[1, 2])
+
+    async def read():
+        return await (await fake.submit_bulk_read(READ_PARAMS))
+
+    results = asyncio.run(read())
+    assert all(type(data) is bytes for data in results.values())
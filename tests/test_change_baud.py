@@ -0,0 +1,79 @@
+"""The cached scan in change_baud.py is only a hint and is checked against the bus."""
+
+import pytest
+
+from helpers import _scan_cache
+from helpers.change_baud import FULL_ID_RANGE, BaudrateManager
+
+PORT = "/dev/ttyUSB_test"
+
+
+class BusStub:
+    """Answers scans from a fixed {motor_id: baudrate} bus layout and records the baud rates pinged."""
+
+    def __init__(self, bus):
+        self.bus = bus
+        self.pinged = []
+
+    def scan_motors_at_baudrate(self, baudrate, motor_ids):
+        self.pinged.append(baudrate)
+        return [motor_id for motor_id in motor_ids if self.bus.get(motor_id) == baudrate]
+
+    def scan_all_baudrates(self, scan_id_range):
+        return {motor_id: baudrate for motor_id, baudrate in self.bus.items() if motor_id in scan_id_range}
+
+    def close(self):
+        pass
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(_scan_cache, "CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr(_scan_cache, "CACHE_PATH", str(tmp_path / "scan.json"))
+    monkeypatch.setattr(_scan_cache, "LAST_BAUD_PATH", str(tmp_path / "last_baud"))
+
+
+def _manager(bus):
+    manager = BaudrateManager(PORT, verbose=False)
+    manager.interface = BusStub(bus)
+    return manager
+
+
+def test_cached_scan_is_used_when_the_bus_matches():
+    _scan_cache.save_scan(PORT, FULL_ID_RANGE, {1: 1000000, 2: 4000000})
+    manager = _manager({1: 1000000, 2: 4000000})
+
+    assert manager.scan_all_baudrates() == {1: 1000000, 2: 4000000}
+    assert sorted(manager.interface.pinged) == [1000000, 4000000]
+
+
+def test_motor_moved_to_another_cached_baud_forces_full_scan():
+    _scan_cache.save_scan(PORT, FULL_ID_RANGE, {1: 1000000, 2: 4000000})
+    manager = _manager({1: 4000000, 2: 4000000})
+
+    assert manager.scan_all_baudrates() == {1: 4000000, 2: 4000000}
+    assert _scan_cache.load_scan(PORT, FULL_ID_RANGE) == {1: 4000000, 2: 4000000}
+
+
+def test_motor_moved_to_an_uncached_baud_forces_full_scan():
+    _scan_cache.save_scan(PORT, FULL_ID_RANGE, {1: 1000000, 2: 1000000})
+    manager = _manager({1: 1000000, 2: 57600})
+
+    assert manager.scan_all_baudrates() == {1: 1000000, 2: 57600}
+
+
+def test_find_motors_tries_cached_baud_first():
+    _scan_cache.save_scan(PORT, FULL_ID_RANGE, {3: 57600})
+    _scan_cache.save_last_baud(4000000)
+    manager = _manager({3: 57600})
+
+    assert manager.find_motors([3]) == {3: 57600}
+    assert manager.interface.pinged == [57600]
+
+
+def test_find_motors_falls_back_when_the_hint_is_stale():
+    _scan_cache.save_scan(PORT, FULL_ID_RANGE, {3: 57600})
+    manager = _manager({3: 115200})
+
+    assert manager.find_motors([3]) == {3: 115200}
+    assert manager.interface.pinged[0] == 57600
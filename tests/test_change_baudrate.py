@@ -0,0 +1,34 @@
+"""Baud rate changes are confirmed by pinging the motors at the new rate."""
+
+from .conftest import ping_status_packet
+
+
+def test_only_motors_answering_at_new_baud_succeed(pipe_interface):
+    u2d2 = pipe_interface()
+    ser = u2d2._portHandler.ser
+    ser.reply(b'')  # Sync Write: no status packets
+    ser.reply(ping_status_packet(1) + ping_status_packet(3))  # Broadcast ping at the new rate
+
+    results = u2d2.change_motors_baudrate({1: 57600, 2: 57600, 3: 57600}, 4000000)
+
+    assert results == {1: True, 2: False, 3: True}
+
+
+def test_port_is_switched_and_restored(pipe_interface):
+    u2d2 = pipe_interface()
+    port = u2d2._portHandler
+    port.ser.reply(b'')
+    port.ser.reply(ping_status_packet(1))
+
+    u2d2.change_motors_baudrate({1: 57600}, 4000000)
+
+    assert port.baudrates[-4:] == [57600, 1000000, 4000000, 1000000]
+    assert port.getBaudRate() == 1000000
+
+
+def test_motors_already_at_new_baud_are_not_written(pipe_interface):
+    u2d2 = pipe_interface()
+    ser = u2d2._portHandler.ser
+
+    assert u2d2.change_motors_baudrate({1: 4000000}, 4000000) == {1: True}
+    assert not ser.written
@@ -0,0 +1,43 @@
+"""control_loop_tick hands back the state from the previous tick, not the current one."""
+
+import numpy as np
+
+from dynamixel_u2d2 import FakeU2D2Interface
+
+from .conftest import status_packet
+
+MOTOR_IDS = [1, 2]
+
+
+def _state_reply(position):
+    """Sync read replies (current, velocity, position) with every motor at position."""
+    params = (0).to_bytes(2, 'little') + (0).to_bytes(4, 'little') + position.to_bytes(4, 'little')
+    return b''.join(status_packet(motor_id, params) for motor_id in MOTOR_IDS)
+
+
+def test_state_lags_one_tick(pipe_interface):
+    u2d2 = pipe_interface(MOTOR_IDS)
+    ser = u2d2._portHandler.ser
+    for position in (100, 200, 300):
+        ser.reply(b'')  # Goal sync write
+        ser.reply(_state_reply(position))  # Sync read issued at the end of the tick
+    goals = np.zeros(len(MOTOR_IDS), dtype=np.int32)
+    previous_state = np.zeros((3, len(MOTOR_IDS)), dtype=np.int32)
+
+    # First tick: no previous read, so this tick's read is returned and flagged
+    assert u2d2.control_loop_tick(goals, previous_state) is False
+    assert previous_state[0].tolist() == [100, 100]
+
+    # Later ticks return what the previous tick read, not what this tick read
+    assert u2d2.control_loop_tick(goals, previous_state) is True
+    assert previous_state[0].tolist() == [100, 100]
+    assert u2d2.control_loop_tick(goals, previous_state) is True
+    assert previous_state[0].tolist() == [200, 200]
+
+
+def test_fake_state_is_from_before_the_goals():
+    fake = FakeU2D2Interface(motor_ids=MOTOR_IDS)
+    previous_state = np.zeros((3, len(MOTOR_IDS)), dtype=np.int32)
+
+    assert fake.control_loop_tick(np.array([500, 500], dtype=np.int32), previous_state) is True
+    assert previous_state[0].tolist() == [0, 0]
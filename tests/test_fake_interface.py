@@ -0,0 +1,68 @@
+"""Every FakeU2D2Interface state read reports the same simulated state."""
+
+import numpy as np
+import pytest
+
+from dynamixel_u2d2 import FakeU2D2Interface
+
+MOTOR_IDS = [4, 2, 7]
+POSITIONS = [1000, -2048, 70000]
+VELOCITIES = [5, -6, 0]
+CURRENTS = [-300, 12, 1]
+
+
+@pytest.fixture
+def fake():
+    """Fake with fixed states; torque is off, so the simulation leaves them alone."""
+    fake = FakeU2D2Interface(motor_ids=MOTOR_IDS)
+    rows = [fake._row(motor_id) for motor_id in MOTOR_IDS]
+    fake._position[rows] = POSITIONS
+    fake._velocity[rows] = VELOCITIES
+    fake._current[rows] = CURRENTS
+    return fake
+
+
+def test_single_motor_getters(fake):
+    assert [fake.get_position(motor_id) for motor_id in MOTOR_IDS] == POSITIONS
+    assert [fake.get_velocity(motor_id) for motor_id in MOTOR_IDS] == VELOCITIES
+    assert [fake.get_current(motor_id) for motor_id in MOTOR_IDS] == CURRENTS
+    assert fake.get_motor_state(2) == {'position': -2048, 'velocity': -6, 'current': 12}
+
+
+def test_sync_reads(fake):
+    assert fake.sync_read_state() == (POSITIONS, VELOCITIES, CURRENTS)
+    assert fake.sync_read_state_fast() == (POSITIONS, VELOCITIES, CURRENTS)
+    assert fake.sync_read_specific('velocity') == VELOCITIES
+
+
+def test_sync_read_state_np_fills_out(fake):
+    out = np.empty((3, len(MOTOR_IDS)), dtype=np.int32)
+
+    assert fake.sync_read_state_np(out) is out
+    assert out.tolist() == [POSITIONS, VELOCITIES, CURRENTS]
+
+
+def test_bulk_reads_follow_the_requested_order(fake):
+    motor_ids = [7, 4]
+
+    assert fake.bulk_read_positions(motor_ids) == {7: 70000, 4: 1000}
+    assert fake.bulk_read_velocities(motor_ids) == {7: 0, 4: 5}
+    assert fake.bulk_read_currents(motor_ids) == {7: 1, 4: -300}
+    assert fake.bulk_read_states(motor_ids) == {
+        7: {'position': 70000, 'velocity': 0, 'current': 1},
+        4: {'position': 1000, 'velocity': 5, 'current': -300},
+    }
+    assert fake.bulk_read_positions_np(motor_ids).tolist() == [70000, 1000]
+
+
+def test_bulk_read_states_soa_dtypes(fake):
+    soa = fake.bulk_read_states_soa(MOTOR_IDS)
+
+    assert soa['position'].dtype == np.int32 and soa['position'].tolist() == POSITIONS
+    assert soa['velocity'].dtype == np.int32 and soa['velocity'].tolist() == VELOCITIES
+    assert soa['current'].dtype == np.int16 and soa['current'].tolist() == CURRENTS
+
+
+def test_unknown_motor_reads_zero(fake):
+    assert fake.get_position(100) == 0
+    assert fake.bulk_read_states([100]) == {100: {'position': 0, 'velocity': 0, 'current': 0}}
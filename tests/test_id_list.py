@@ -0,0 +1,37 @@
+"""Parsing and validation of the helpers' comma-separated ID lists."""
+
+import numpy as np
+import pytest
+
+from helpers._id_list import has_duplicates, invalid_ids, parse_ids
+
+
+def test_parse_ids_accepts_spaces():
+    ids = parse_ids(" 1, 2,3 ")
+    assert ids.dtype == np.int64
+    assert ids.tolist() == [1, 2, 3]
+
+
+def test_parse_ids_single_id():
+    assert parse_ids("7").tolist() == [7]
+
+
+@pytest.mark.parametrize("text", ["", "   "])
+def test_parse_ids_rejects_blank(text):
+    with pytest.raises(ValueError, match="empty"):
+        parse_ids(text)
+
+
+@pytest.mark.parametrize("text", ["1,,2", "1,", ",1", "1,a", "1.5", "1;2"])
+def test_parse_ids_rejects_bad_entries(text):
+    with pytest.raises(ValueError, match="invalid ID list"):
+        parse_ids(text)
+
+
+def test_invalid_ids_are_out_of_range():
+    assert invalid_ids(parse_ids("-1,0,252,253")) == [-1, 253]
+
+
+def test_has_duplicates():
+    assert has_duplicates(parse_ids("1,2,1"))
+    assert not has_duplicates(parse_ids("1,2,3"))
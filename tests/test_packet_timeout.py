@@ -0,0 +1,40 @@
+"""Receive timeouts computed from the verified latency timer."""
+
+import pytest
+
+from dynamixel_u2d2.u2d2_interface import LEN_WRITE_STATUS, MAX_RETURN_DELAY_MS
+
+FACTORY_RETURN_DELAY_MS = 0.5
+
+
+def _timeout(u2d2, packet_length, latency_timer=1):
+    u2d2._latency_timer = latency_timer
+    u2d2._set_packet_timeout(packet_length)
+    return u2d2._portHandler.packet_timeout
+
+
+def test_single_status_packet(pipe_interface):
+    u2d2 = pipe_interface()
+    port = u2d2._portHandler
+
+    expected = port.tx_time_per_byte * LEN_WRITE_STATUS + 2.0 + 2.0 + MAX_RETURN_DELAY_MS
+    assert _timeout(u2d2, LEN_WRITE_STATUS) == pytest.approx(expected)
+
+
+@pytest.mark.parametrize("num_motors", [1, 8, 32])
+def test_sync_read_covers_factory_return_delay(pipe_interface, num_motors):
+    u2d2 = pipe_interface()
+    port = u2d2._portHandler
+    data_length = 10  # current + velocity + position
+    packet_length = (LEN_WRITE_STATUS + data_length) * num_motors
+
+    # Worst case arrival of the last status packet with factory settings
+    transfer_ms = port.tx_time_per_byte * packet_length + 2 * 1
+    assert _timeout(u2d2, packet_length) >= transfer_ms + num_motors * FACTORY_RETURN_DELAY_MS
+
+
+def test_timeout_is_below_sdk_default_for_small_reads(pipe_interface):
+    u2d2 = pipe_interface()
+
+    # The SDK assumes a 16 ms latency timer: 2 * 16 + 2 ms of slack
+    assert _timeout(u2d2, LEN_WRITE_STATUS + 4) < 34.0
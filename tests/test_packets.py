@@ -0,0 +1,75 @@
+"""Prebuilt Sync Write packets and the CRC, byte for byte against the SDK."""
+
+import os
+
+import pytest
+from dynamixel_sdk import GroupSyncWrite, PacketHandler
+
+from dynamixel_u2d2.base_interface import BaseInterface
+from dynamixel_u2d2.u2d2_interface import ADDR_GOAL_CURRENT, ADDR_GOAL_POSITION
+
+MOTOR_IDS = [1, 2, 3]
+
+
+def _sdk_sync_write(u2d2, address, length, values):
+    """Send values with a plain GroupSyncWrite and return the bytes it wrote."""
+    ser = u2d2._portHandler.ser
+    ser.written.clear()
+    group = GroupSyncWrite(u2d2._portHandler, PacketHandler(2.0), address, length)
+    for motor_id, value in zip(MOTOR_IDS, values):
+        group.addParam(motor_id, list((value & (2 ** (8 * length) - 1)).to_bytes(length, 'little')))
+    group.txPacket()
+    return bytes(ser.written)
+
+
+@pytest.mark.parametrize("positions", [
+    [0, 2048, 4095],
+    [-1, -4096, 1 << 20],
+    [0x00FDFFFF, 7, 8],  # Payload contains 0xFF 0xFF 0xFD, so the packet needs byte stuffing
+])
+def test_sync_write_positions_matches_sdk(pipe_interface, positions):
+    u2d2 = pipe_interface(MOTOR_IDS)
+    ser = u2d2._portHandler.ser
+    ser.written.clear()
+
+    u2d2.sync_write_positions(positions)
+
+    assert bytes(ser.written) == _sdk_sync_write(u2d2, ADDR_GOAL_POSITION, 4, positions)
+
+
+def test_sync_write_currents_matches_sdk(pipe_interface):
+    u2d2 = pipe_interface(MOTOR_IDS)
+    ser = u2d2._portHandler.ser
+    currents = [100, -100, 0]
+    ser.written.clear()
+
+    u2d2.sync_write_currents(currents)
+
+    assert bytes(ser.written) == _sdk_sync_write(u2d2, ADDR_GOAL_CURRENT, 2, currents)
+
+
+def test_repeated_sync_writes_refresh_the_packet(pipe_interface):
+    u2d2 = pipe_interface(MOTOR_IDS)
+    ser = u2d2._portHandler.ser
+    u2d2.sync_write_positions([1, 2, 3])
+    ser.written.clear()
+
+    u2d2.sync_write_positions([4, 5, 6])
+
+    assert bytes(ser.written) == _sdk_sync_write(u2d2, ADDR_GOAL_POSITION, 4, [4, 5, 6])
+
+
+@pytest.mark.parametrize("length", [0, 1, 2, 7, 64, 255])
+@pytest.mark.parametrize("start", [0, 0x1234])
+def test_crc16_matches_sdk(length, start):
+    data = os.urandom(length)
+    expected = PacketHandler(2.0).updateCRC(start, list(data), length)
+
+    assert BaseInterface._crc16(None, data, start) == expected
+
+
+def test_u2d2_crc16_matches_sdk(pipe_interface):
+    u2d2 = pipe_interface()
+    data = os.urandom(101)
+
+    assert u2d2._crc16(data) == PacketHandler(2.0).updateCRC(0, list(data), len(data))
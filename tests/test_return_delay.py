@@ -0,0 +1,42 @@
+"""Return Delay Time is an unsigned register (0-254) and is written as one."""
+
+from dynamixel_u2d2.u2d2_interface import ADDR_RETURN_DELAY_TIME
+
+from .conftest import status_packet
+
+MOTOR_IDS = [1, 2]
+SYNC_WRITE_PARAMS = 12  # Offset of the first [id, data] record in a Sync Write packet
+
+
+def test_factory_default_is_sent_as_one_unsigned_byte(pipe_interface):
+    u2d2 = pipe_interface()
+    ser = u2d2._portHandler.ser
+
+    u2d2.bulk_set_return_delay_time(MOTOR_IDS, 250)
+
+    assert ser.written[7] == 0x83  # Sync Write
+    assert int.from_bytes(ser.written[8:10], 'little') == ADDR_RETURN_DELAY_TIME
+    assert ser.written[SYNC_WRITE_PARAMS:SYNC_WRITE_PARAMS + 4] == bytes([1, 250, 2, 250])
+
+
+def test_skip_unchanged_decodes_values_above_127(pipe_interface):
+    u2d2 = pipe_interface()
+    ser = u2d2._portHandler.ser
+    ser.reply(status_packet(1, bytes([250])) + status_packet(2, bytes([0])))  # Present values
+    ser.reply(b'')  # Sync Write
+
+    u2d2.bulk_set_return_delay_time(MOTOR_IDS, 250, skip_unchanged=True)
+
+    sync_write = ser.written[ser.written.rindex(b'\xff\xff\xfd\x00\xfe'):]
+    assert sync_write[7] == 0x83
+    assert sync_write[SYNC_WRITE_PARAMS:-2] == bytes([2, 250])  # Only motor 2 differed
+
+
+def test_skip_unchanged_with_every_motor_set_writes_nothing(pipe_interface):
+    u2d2 = pipe_interface()
+    ser = u2d2._portHandler.ser
+    ser.reply(status_packet(1, bytes([200])) + status_packet(2, bytes([200])))
+
+    u2d2.bulk_set_return_delay_time(MOTOR_IDS, 200, skip_unchanged=True)
+
+    assert ser.written[7] == 0x82  # Only the Sync Read went out
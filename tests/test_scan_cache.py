@@ -0,0 +1,64 @@
+"""The on-disk scan cache shared by the helpers."""
+
+import pytest
+
+from helpers import _scan_cache
+
+PORT = "/dev/ttyUSB_test"
+FULL = range(0, 253)
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(_scan_cache, "CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setattr(_scan_cache, "CACHE_PATH", str(tmp_path / "cache" / "scan.json"))
+    monkeypatch.setattr(_scan_cache, "LAST_BAUD_PATH", str(tmp_path / "cache" / "last_baud"))
+    return tmp_path / "cache"
+
+
+def test_missing_cache_loads_nothing():
+    assert _scan_cache.load_scan(PORT, FULL) is None
+    assert _scan_cache.load_last_baud() is None
+
+
+def test_scan_round_trip_restores_int_keys():
+    _scan_cache.save_scan(PORT, FULL, {1: 57600, 12: 4000000})
+
+    assert _scan_cache.load_scan(PORT, FULL) == {1: 57600, 12: 4000000}
+
+
+def test_scan_is_keyed_by_port_and_id_range():
+    _scan_cache.save_scan(PORT, FULL, {1: 57600})
+    _scan_cache.save_scan("/dev/ttyUSB1", FULL, {2: 1000000})
+
+    assert _scan_cache.load_scan(PORT, FULL) == {1: 57600}
+    assert _scan_cache.load_scan("/dev/ttyUSB1", FULL) == {2: 1000000}
+    assert _scan_cache.load_scan(PORT, range(1, 10)) is None
+
+
+def test_clear_scan_only_forgets_one_port():
+    _scan_cache.save_scan(PORT, FULL, {1: 57600})
+    _scan_cache.save_scan("/dev/ttyUSB1", FULL, {2: 1000000})
+
+    _scan_cache.clear_scan(PORT)
+
+    assert _scan_cache.load_scan(PORT, FULL) is None
+    assert _scan_cache.load_scan("/dev/ttyUSB1", FULL) == {2: 1000000}
+
+
+@pytest.mark.parametrize("contents", ["not json", "[1, 2]", '{"/dev/ttyUSB_test": {"scan_id_range": [0, 253]}}'])
+def test_corrupt_cache_is_ignored(cache_dir, contents):
+    cache_dir.mkdir()
+    (cache_dir / "scan.json").write_text(contents)
+
+    assert _scan_cache.load_scan(PORT, FULL) is None
+    _scan_cache.save_scan(PORT, FULL, {3: 9600})
+    assert _scan_cache.load_scan(PORT, FULL) == {3: 9600}
+
+
+def test_last_baud_round_trip(cache_dir):
+    _scan_cache.save_last_baud(4000000)
+    assert _scan_cache.load_last_baud() == 4000000
+
+    (cache_dir / "last_baud").write_text("garbage")
+    assert _scan_cache.load_last_baud() is None
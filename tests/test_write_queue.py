@@ -0,0 +1,101 @@
+"""Queued writes are coalesced by flush(), and batch() defers sync writes to one port write."""
+
+import pytest
+from dynamixel_sdk import GroupBulkWrite, PacketHandler
+
+from dynamixel_u2d2.u2d2_interface import ADDR_GOAL_CURRENT, ADDR_GOAL_POSITION
+
+from .conftest import status_packet
+
+MOTOR_IDS = [1, 2]
+
+
+def test_contiguous_writes_merge_into_one_span(pipe_interface):
+    u2d2 = pipe_interface()
+    spans = u2d2._coalesce_writes([
+        (1, 10, b'\x01\x02'),
+        (1, 12, b'\x03'),
+        (1, 20, b'\x09'),
+        (2, 5, b'\x07'),
+    ])
+
+    assert spans == {1: [(10, b'\x01\x02\x03'), (20, b'\x09')], 2: [(5, b'\x07')]}
+
+
+def test_later_writes_win_on_overlap(pipe_interface):
+    u2d2 = pipe_interface()
+    spans = u2d2._coalesce_writes([(1, 10, b'\x01\x02\x03'), (1, 11, b'\xAA')])
+
+    assert spans == {1: [(10, b'\x01\xAA\x03')]}
+
+
+def test_flush_of_one_span_uses_an_acknowledged_write(pipe_interface):
+    u2d2 = pipe_interface()
+    ser = u2d2._portHandler.ser
+    ser.reply(status_packet(1))
+    u2d2.enqueue_write(1, ADDR_GOAL_POSITION, (100).to_bytes(4, 'little'))
+    u2d2.enqueue_write(1, ADDR_GOAL_POSITION, (200).to_bytes(4, 'little'))
+
+    assert u2d2.flush() == {1: True}
+    assert ser.written[7] == 0x03  # Write instruction
+    assert int.from_bytes(ser.written[10:14], 'little') == 200
+    assert u2d2.flush() == {}
+
+
+def test_flush_sends_one_span_per_motor_per_round(pipe_interface):
+    u2d2 = pipe_interface()
+    ser = u2d2._portHandler.ser
+    ser.reply(b'')  # Round 1: bulk write, no status packets
+    ser.reply(status_packet(2))  # Round 2: only motor 2 is left, so an acknowledged write
+    u2d2.enqueue_write(1, ADDR_GOAL_POSITION, (100).to_bytes(4, 'little'))
+    u2d2.enqueue_write(2, ADDR_GOAL_POSITION, (200).to_bytes(4, 'little'))
+    u2d2.enqueue_write(2, ADDR_GOAL_CURRENT, (50).to_bytes(2, 'little'))
+
+    assert u2d2.flush() == {1: True, 2: True}
+    flushed = bytes(ser.written)
+
+    ser.written.clear()
+    group = GroupBulkWrite(u2d2._portHandler, PacketHandler(2.0))
+    group.addParam(1, ADDR_GOAL_POSITION, 4, list((100).to_bytes(4, 'little')))
+    group.addParam(2, ADDR_GOAL_CURRENT, 2, list((50).to_bytes(2, 'little')))
+    group.txPacket()
+    bulk_packet = bytes(ser.written)
+
+    assert flushed.startswith(bulk_packet)
+    write_packet = flushed[len(bulk_packet):]
+    assert write_packet[4] == 2 and write_packet[7] == 0x03  # Write instruction to motor 2
+    assert int.from_bytes(write_packet[10:14], 'little') == 200
+
+
+def test_batch_sends_sync_writes_in_one_port_write(pipe_interface):
+    u2d2 = pipe_interface(MOTOR_IDS)
+    ser = u2d2._portHandler.ser
+    u2d2.sync_write_positions([1, 2])
+    u2d2.sync_write_currents([3, 4])
+    separate = bytes(ser.written)
+    ser.written.clear()
+
+    writes = []
+    write_port = u2d2._portHandler.writePort
+    u2d2._portHandler.writePort = lambda packet: writes.append(bytes(packet)) or write_port(packet)
+    with u2d2.batch():
+        u2d2.sync_write_positions([1, 2])
+        with u2d2.batch():  # Nested blocks join the outer one
+            u2d2.sync_write_currents([3, 4])
+        assert not ser.written
+
+    assert writes == [separate]
+
+
+def test_batch_sends_nothing_if_the_block_raises(pipe_interface):
+    u2d2 = pipe_interface(MOTOR_IDS)
+    ser = u2d2._portHandler.ser
+
+    with pytest.raises(KeyError):
+        with u2d2.batch():
+            u2d2.sync_write_positions([1, 2])
+            raise KeyError
+
+    assert not ser.written
+    u2d2.sync_write_positions([1, 2])
+    assert ser.written
@@ -0,0 +1,54 @@
+"""Single-motor writes through the prebuilt Write packet path."""
+
+from dynamixel_sdk import COMM_RX_TIMEOUT, COMM_SUCCESS
+
+from dynamixel_u2d2.u2d2_interface import ADDR_GOAL_POSITION, STRUCT_INT32
+
+from .conftest import status_packet
+
+
+def test_write_register_reads_status_packet(pipe_interface):
+    u2d2 = pipe_interface()
+    ser = u2d2._portHandler.ser
+    ser.reply(status_packet(11))
+
+    assert u2d2._write_register(11, ADDR_GOAL_POSITION, STRUCT_INT32, 2048) == (COMM_SUCCESS, 0)
+
+
+def test_write_register_reports_status_error(pipe_interface):
+    u2d2 = pipe_interface()
+    u2d2._portHandler.ser.reply(status_packet(11, error=0x02))
+
+    assert u2d2._write_register(11, ADDR_GOAL_POSITION, STRUCT_INT32, 2048) == (COMM_SUCCESS, 0x02)
+
+
+def test_write_register_times_out_without_reply(pipe_interface):
+    u2d2 = pipe_interface()
+
+    dxl_comm_result, _ = u2d2._write_register(11, ADDR_GOAL_POSITION, STRUCT_INT32, 2048)
+    assert dxl_comm_result == COMM_RX_TIMEOUT
+
+
+def test_write_register_packet_matches_sdk(pipe_interface):
+    u2d2 = pipe_interface()
+    ser = u2d2._portHandler.ser
+    ser.reply(status_packet(11))
+    u2d2._write_register(11, ADDR_GOAL_POSITION, STRUCT_INT32, -1234)
+    ours = bytes(ser.written)
+
+    ser.written.clear()
+    ser.reply(status_packet(11))
+    u2d2._packetHandler.write4ByteTxRx(u2d2._portHandler, 11, ADDR_GOAL_POSITION, -1234 & 0xFFFFFFFF)
+
+    assert ours == bytes(ser.written)
+
+
+def test_set_goal_position_sends_one_packet(pipe_interface):
+    u2d2 = pipe_interface()
+    ser = u2d2._portHandler.ser
+    ser.reply(status_packet(11))
+
+    u2d2.set_goal_position(11, 1000)
+
+    assert ser.written[4] == 11
+    assert int.from_bytes(ser.written[10:14], 'little', signed=True) == 1000